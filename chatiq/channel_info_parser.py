@@ -1,8 +1,18 @@
+import re
 from typing import Optional, Tuple
 
 from chatiq.exceptions import TemperatureRangeError, TimezoneOffsetSelectError
 from chatiq.models import SlackTeam
-from chatiq.utils import extract_emoji_text
+
+# All three emoji tokens compiled into one alternation so a parse scans the
+# topic and description once instead of running one search per emoji per text.
+_CHANNEL_INFO_RE = re.compile(
+    r"(?:^|\n)(?::thermometer:(?P<temperature>.*?)"
+    r"|:round_pushpin:(?P<timezone_offset>.*?)"
+    r"|:speech_balloon:(?P<context>.*?))"
+    r"(?=\n:[^\s:]+:|$)",
+    re.DOTALL,
+)
 
 
 class ChannelInfoParser:
@@ -41,13 +51,28 @@ class ChannelInfoParser:
             TimezoneOffsetSelectError: If the timezone offset is invalid.
         """
 
-        temperature = self._parse_temperature()
-        timezone_offset = self._parse_timezone_offset()
-        context = self._parse_context()
-        return temperature, timezone_offset, context
+        fields: dict = {"temperature": None, "timezone_offset": None, "context": None}
+        for text in (self.topic, self.description):
+            seen = set()
+            for match in _CHANNEL_INFO_RE.finditer(text):
+                name = match.lastgroup
+                if name in seen:
+                    # Only the first occurrence per text counts, matching the
+                    # old per-emoji search.
+                    continue
+                seen.add(name)
+                if fields[name] is None and (value := match.group(name).strip()):
+                    fields[name] = value
+
+        temperature = self._validate_temperature(fields["temperature"])
+        timezone_offset = self._validate_timezone_offset(fields["timezone_offset"])
+        return temperature, timezone_offset, fields["context"]
+
+    def _validate_temperature(self, temperature_str: Optional[str]) -> Optional[float]:
+        """Validates the extracted temperature for the AI model.
 
-    def _parse_temperature(self) -> Optional[float]:
-        """Parse the temperature for the AI model from the topic and description of the Slack channel.
+        Args:
+            temperature_str (Optional[str]): The extracted temperature text, if any.
 
         Returns:
             Optional[float]: The temperature for the AI model.
@@ -56,25 +81,24 @@ class ChannelInfoParser:
             TemperatureRangeError: If the temperature value is invalid or out of range.
         """
 
-        temperature_str = extract_emoji_text(self.topic, self.TEMPERATURE_EMOJI) or extract_emoji_text(
-            self.description, self.TEMPERATURE_EMOJI
-        )
+        if not temperature_str:
+            return None
 
-        if temperature_str:
-            try:
-                temperature = float(temperature_str)
-            except ValueError:
-                raise TemperatureRangeError(f"Invalid temperature value: {temperature_str}")
+        try:
+            temperature = float(temperature_str)
+        except ValueError:
+            raise TemperatureRangeError(f"Invalid temperature value: {temperature_str}")
 
-            if not (SlackTeam.MIN_TEMPERATURE <= temperature <= SlackTeam.MAX_TEMPERATURE):
-                raise TemperatureRangeError(f"Temperature value out of range: {temperature}")
+        if not (SlackTeam.MIN_TEMPERATURE <= temperature <= SlackTeam.MAX_TEMPERATURE):
+            raise TemperatureRangeError(f"Temperature value out of range: {temperature}")
 
-            return temperature
+        return temperature
 
-        return None
+    def _validate_timezone_offset(self, timezone_offset: Optional[str]) -> Optional[str]:
+        """Validates the extracted timezone offset.
 
-    def _parse_timezone_offset(self) -> Optional[str]:
-        """Parse the timezone offset from the topic and description of the Slack channel.
+        Args:
+            timezone_offset (Optional[str]): The extracted timezone offset, if any.
 
         Returns:
             Optional[str]: The timezone offset.
@@ -83,20 +107,7 @@ class ChannelInfoParser:
             TimezoneOffsetSelectError: If the timezone offset is invalid.
         """
 
-        timezone_offset = extract_emoji_text(self.topic, self.TIMEZONE_OFFSET_EMOJI) or extract_emoji_text(
-            self.description, self.TIMEZONE_OFFSET_EMOJI
-        )
-
         if timezone_offset and timezone_offset not in SlackTeam.TIMEZONE_OFFSETS:
             raise TimezoneOffsetSelectError(f"Invalid timezone offset: {timezone_offset}.")
 
         return timezone_offset
-
-    def _parse_context(self) -> Optional[str]:
-        """Parse the context for the AI model from the topic and description of the Slack channel.
-
-        Returns:
-            Optional[str]: The context for the AI model.
-        """
-
-        return extract_emoji_text(self.topic, self.CONTEXT_EMOJI) or extract_emoji_text(self.description, self.CONTEXT_EMOJI)
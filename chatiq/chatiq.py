@@ -2,15 +2,18 @@ import logging
 import signal
 import sys
 import threading
-from typing import Any, List, Optional, Set
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Set
 
 import openai
 from slack_bolt import App
 from slack_bolt.oauth.oauth_settings import OAuthSettings
 from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 from weaviate import Client
+from weaviate.config import Config, ConnectionConfig
 from weaviate.exceptions import WeaviateBaseError
 
+from chatiq import json_compat
 from chatiq.database import Database
 from chatiq.exceptions import SettingsValidationError
 from chatiq.handlers import (
@@ -37,6 +40,9 @@ class ChatIQ:
         and settings for the bot, and it's intended to be public so that you can run the app using this instance.
     """
 
+    WEAVIATE_POOL_CONNECTIONS = 32
+    WEAVIATE_POOL_MAXSIZE = 64
+
     BOT_TOKEN_SCOPES: List[str] = [
         "app_mentions:read",
         "channels:history",
@@ -97,12 +103,14 @@ class ChatIQ:
         self.weaviate_client = self._initialize_weaviate_client()
         self.db = self._initialize_database()
 
+        json_compat.patch_slack_bolt()
         self.bolt_app = bolt_app or self._initialize_app()
         if rate_limit_retry:
             self.bolt_app.client.retry_handlers.append(RateLimitErrorRetryHandler())
 
-        self.threads = []
-        self.thread_lock = threading.Lock()
+        self.futures: list = []
+        self.future_lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=Settings.BACKGROUND_WORKERS, thread_name_prefix="chatiq")
 
     def listen(self) -> None:
         """Start listening for Slack events.
@@ -129,21 +137,32 @@ class ChatIQ:
         self.bolt_app.action("timezone_offset_select")(TimezoneOffsetSelectHandler(self))
         self.bolt_app.action("context_save")(ContextSaveHandler(self))
 
-    def add_thread(self, thread: threading.Thread):
-        """Adds a thread to the list after cleaning up finished threads.
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        """Submits background work to the shared executor.
+
+        Using a bounded pool instead of one thread per event avoids the
+        per-request thread creation cost and caps concurrency under burst
+        load.
 
         Args:
-            thread (threading.Thread): The thread to be added.
+            fn (Callable): The function to run in the background.
+            args (Any): Positional arguments passed to the function.
+            kwargs (Any): Keyword arguments passed to the function.
+
+        Returns:
+            Future: The future for the submitted work.
         """
 
-        with self.thread_lock:
-            self._clean_threads()
-            self.threads.append(thread)
+        with self.future_lock:
+            self._clean_futures()
+            future = self.executor.submit(fn, *args, **kwargs)
+            self.futures.append(future)
+        return future
 
-    def _clean_threads(self):
-        """Removes finished threads from the list."""
+    def _clean_futures(self):
+        """Removes finished futures from the list."""
 
-        self.threads = [thread for thread in self.threads if thread.is_alive()]
+        self.futures = [future for future in self.futures if not future.done()]
 
     def _exit_gracefully(self, signum: int, frame: Any):
         """Handles SIGTERM by waiting for all threads to complete before exiting.
@@ -153,8 +172,7 @@ class ChatIQ:
             frame: The current stack frame (unused in this method but required by the signal module).
         """
 
-        for thread in self.threads:
-            thread.join()
+        self.executor.shutdown(wait=True)
         sys.exit(0)
 
     def _validate_settings(self, with_bolt_app: bool) -> None:
@@ -205,7 +223,14 @@ class ChatIQ:
         """
 
         try:
-            weaviate_client = Client(self.weaviate_url)
+            # Size the client's HTTP connection pool for bursty Slack traffic so
+            # concurrent adds and deletes reuse keep-alive connections instead
+            # of paying a TCP/TLS handshake per request.
+            connection_config = ConnectionConfig(
+                session_pool_connections=self.WEAVIATE_POOL_CONNECTIONS,
+                session_pool_maxsize=self.WEAVIATE_POOL_MAXSIZE,
+            )
+            weaviate_client = Client(self.weaviate_url, additional_config=Config(connection_config=connection_config))
         except Exception as e:
             error_message = f"Failed to connect to Weaviate. Error: {e}"
             self.logger.error(error_message)
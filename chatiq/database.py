@@ -37,7 +37,9 @@ class Database:
 
         self.logger = logging.getLogger(__name__)
         self.engine = create_engine(postgres_url)
-        self.Session = sessionmaker(bind=self.engine)
+        # Keep attributes loaded after commit so models can be read outside the
+        # transaction scope without an extra SELECT.
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
         self.installation_store = SQLAlchemyInstallationStore(client_id=slack_client_id, engine=self.engine)
         self.state_store = SQLAlchemyOAuthStateStore(expiration_seconds=self.STORE_EXPIRATION_SECONDS, engine=self.engine)
 
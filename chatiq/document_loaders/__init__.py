@@ -1,6 +1,31 @@
+from typing import Optional, Type
+
+from langchain.document_loaders.base import BaseLoader
+
 from .dummy_message import DummyMessageLoader  # noqa: F401
 from .message import MessageLoader  # noqa: F401
 from .pdf import PdfLoader  # noqa: F401
 from .plain_text import PlainTextLoader  # noqa: F401
 from .slack_link import SlackLinkLoader  # noqa: F401
 from .unfurlink_link import UnfurlingLinkLoader  # noqa: F401
+
+# File loaders in dispatch order; each class declares its own supported
+# filetypes so unsupported files are rejected before any loader is built.
+FILE_LOADERS = (PdfLoader, PlainTextLoader)
+
+
+def loader_for(file: dict) -> Optional[Type[BaseLoader]]:
+    """Returns the file loader class that supports a Slack file, if any.
+
+    Args:
+        file (dict): The file attached to the message.
+
+    Returns:
+        Optional[Type[BaseLoader]]: The matching loader class, or None when the
+            filetype is not handled.
+    """
+
+    for loader_cls in FILE_LOADERS:
+        if loader_cls.check_supported(file):
+            return loader_cls
+    return None
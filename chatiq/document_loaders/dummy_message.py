@@ -1,11 +1,10 @@
 import time
-from datetime import datetime, timezone
 from typing import List
 
 from langchain.docstore.document import Document
 from langchain.document_loaders.base import BaseLoader
 
-from chatiq.utils import pretty_json_dumps
+from chatiq.utils import compact_json_dumps, format_slack_timestamp
 
 
 class DummyMessageLoader(BaseLoader):
@@ -31,7 +30,7 @@ class DummyMessageLoader(BaseLoader):
 
         return [
             Document(
-                page_content=pretty_json_dumps(
+                page_content=compact_json_dumps(
                     {
                         "content_type": "message",
                         "user": self.USER_ID,
@@ -61,6 +60,6 @@ class DummyMessageLoader(BaseLoader):
             "channel_id": self.CHANNEL_ID,
             "thread_ts": str(timestamp),
             "ts": str(timestamp),
-            "timestamp": datetime.fromtimestamp(timestamp, timezone.utc).isoformat(),
+            "timestamp": format_slack_timestamp(timestamp),
             "permalink": f"https://matomel.slack.com/archives/{self.CHANNEL_ID}/{timestamp * 1000000}",
         }
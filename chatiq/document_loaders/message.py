@@ -1,6 +1,6 @@
 import logging
-from datetime import datetime, timezone
-from typing import List
+import sys
+from typing import Iterator, List
 
 from langchain.docstore.document import Document
 from langchain.document_loaders.base import BaseLoader
@@ -8,7 +8,7 @@ from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 from chatiq.text_processor import TextProcessor
-from chatiq.utils import pretty_json_dumps
+from chatiq.utils import compact_json_dumps, format_slack_timestamp
 
 from .pdf import PdfLoader
 from .plain_text import PlainTextLoader
@@ -46,6 +46,18 @@ class MessageLoader(BaseLoader):
             List[Document]: A list containing a single Document object.
         """
 
+        return list(self.lazy_load())
+
+    def lazy_load(self) -> Iterator[Document]:
+        """Lazily loads the Slack event into a Document object.
+
+        Yields the document one at a time so callers can pipeline it into a
+        batch importer without materializing intermediate lists.
+
+        Yields:
+            Iterator[Document]: An iterator that yields Document objects.
+        """
+
         metadata = self._build_metadata()
         message = self.processor.truncate_text(self.message["text"])
 
@@ -70,7 +82,7 @@ class MessageLoader(BaseLoader):
         if files:
             page_content["files"] = files
 
-        return [Document(page_content=pretty_json_dumps(page_content), metadata=metadata)]
+        yield Document(page_content=compact_json_dumps(page_content), metadata=metadata)
 
     def _build_metadata(self) -> dict:
         """Builds the metadata for the Document object.
@@ -89,7 +101,7 @@ class MessageLoader(BaseLoader):
         event_time = self.body["event_time"]
 
         try:
-            timestamp = datetime.fromtimestamp(event_time, timezone.utc)
+            timestamp = format_slack_timestamp(event_time)
         except ValueError:
             error_message = f"Error converting date: {event_time}"
             self.logger.error(error_message)
@@ -98,11 +110,11 @@ class MessageLoader(BaseLoader):
         return {
             "file_or_attachment_id": "",
             "content_type": "message",
-            "channel_type": self.body["event"]["channel_type"],
+            "channel_type": sys.intern(self.body["event"]["channel_type"]),
             "channel_id": self.body["event"]["channel"],
             "thread_ts": thread_ts,
             "ts": ts,
-            "timestamp": timestamp.isoformat(),
+            "timestamp": timestamp,
             "permalink": permalink,
         }
 
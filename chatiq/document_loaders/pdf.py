@@ -1,20 +1,31 @@
+import io
 import logging
-import tempfile
-from datetime import datetime, timezone
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from http import HTTPStatus
 from typing import Iterator, List
 
+import fitz
 import requests
 from langchain.docstore.document import Document
 from langchain.document_loaders.base import BaseLoader
-from langchain.document_loaders.blob_loaders import Blob
-from langchain.document_loaders.parsers.pdf import PyMuPDFParser
 from langchain.text_splitter import TokenTextSplitter
+from requests.adapters import HTTPAdapter
 from slack_bolt import BoltContext
 
 from chatiq.constants import FILE_DOCUMENT_THREAD_TS
 from chatiq.text_processor import TextProcessor
-from chatiq.utils import pretty_json_dumps
+from chatiq.utils import compact_json_dumps, format_slack_timestamp
+
+DOWNLOAD_TIMEOUT = 30.0
+DOWNLOAD_CHUNK_SIZE = 8192
+
+# Shared session so repeated Slack file downloads reuse pooled keep-alive
+# connections instead of paying a TCP/TLS handshake per file.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
+_session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
 
 
 class PdfLoader(BaseLoader):
@@ -25,6 +36,8 @@ class PdfLoader(BaseLoader):
     """
 
     PDF_FILETYPE = "pdf"
+    SUPPORTED_FILETYPES = frozenset({PDF_FILETYPE})
+    EXTRACT_WORKERS = min(os.cpu_count() or 1, 4)
 
     @classmethod
     def check_supported(cls, file: dict) -> bool:
@@ -34,7 +47,7 @@ class PdfLoader(BaseLoader):
             bool: If the file is PDF or not
         """
 
-        return file.get("filetype") == cls.PDF_FILETYPE
+        return file.get("filetype") in cls.SUPPORTED_FILETYPES
 
     def __init__(self, context: BoltContext, body: dict, file: dict, channel_type: str, model: str):
         """Initializes the PdfLoader with context and a Slack body.
@@ -55,15 +68,6 @@ class PdfLoader(BaseLoader):
         self.body = body
         self.file = file
         self.channel_type = channel_type
-        self.parser = PyMuPDFParser()
-
-    def __del__(self) -> None:
-        """Deletes the instance of PdfLoader.
-
-        Before the instance is deleted, it ensures any temporary files used during its lifecycle are closed properly.
-        """
-        if hasattr(self, "temp_file"):
-            self.temp_file.close()
 
     def load(self) -> List[Document]:
         """Loads the PDF file into Document objects.
@@ -78,29 +82,29 @@ class PdfLoader(BaseLoader):
         self._download_file()
 
         metadata = self._build_metadata()
-        documents = list(self.lazy_load())
-        content = "".join(doc.page_content for doc in documents)
+        content = "".join(self._extract_pages())
 
         texts = self.splitter.split_text(content)
         page_count = len(texts)
 
-        documents = []
-        for i, text in enumerate(texts):
-            page_content = pretty_json_dumps(
-                {
-                    "content_type": self.file["filetype"],
-                    "user": self.body["event"]["user_id"],
-                    "name": self.file["name"],
-                    "title": self.file["title"],
-                    "channel": self.body["event"]["channel_id"],
-                    "content": text,
-                    "page": f"{i + 1} / {page_count}",
-                    "permalink": self.file["permalink"],
-                    "timestamp": metadata["timestamp"],
-                }
+        # The per-file fields are assembled once and each chunk only adds its
+        # content and page number, so the loop does no redundant dict building.
+        base_content = {
+            "content_type": self.file["filetype"],
+            "user": self.body["event"]["user_id"],
+            "name": self.file["name"],
+            "title": self.file["title"],
+            "channel": self.body["event"]["channel_id"],
+            "permalink": self.file["permalink"],
+            "timestamp": metadata["timestamp"],
+        }
+        return [
+            Document(
+                page_content=compact_json_dumps({**base_content, "content": text, "page": f"{i + 1} / {page_count}"}),
+                metadata=metadata,
             )
-            documents.append(Document(page_content=page_content, metadata=metadata))
-        return documents
+            for i, text in enumerate(texts)
+        ]
 
     def lazy_load(self) -> Iterator[Document]:
         """Lazily loads the content of the PDF file.
@@ -109,8 +113,53 @@ class PdfLoader(BaseLoader):
             Iterator[Document]: An iterator that yields Document objects.
         """
 
-        blob = Blob.from_path(self.temp_file.name)
-        yield from self.parser.parse(blob)
+        for page_text in self._extract_pages():
+            yield Document(page_content=page_text)
+
+    def _extract_pages(self) -> List[str]:
+        """Extracts the text of every page from the downloaded PDF.
+
+        The document is opened directly from the downloaded bytes, so no
+        temporary file is written and no parser layer sits between the
+        loader and MuPDF.
+
+        Returns:
+            List[str]: The extracted text of each page.
+        """
+
+        document = fitz.open(stream=self.file_content, filetype=self.PDF_FILETYPE)
+        try:
+            page_count = document.page_count
+            if page_count <= 1:
+                return [page.get_text("text") for page in document]
+        finally:
+            document.close()
+
+        # MuPDF releases the GIL during extraction, so pages of a multi-page
+        # file are decoded concurrently. Each worker opens its own handle on
+        # the shared byte buffer since a fitz document is not thread-safe.
+        texts: List[str] = [""] * page_count
+        with ThreadPoolExecutor(max_workers=min(self.EXTRACT_WORKERS, page_count)) as executor:
+            futures = {executor.submit(self._extract_page, page_number): page_number for page_number in range(page_count)}
+            for future in as_completed(futures):
+                texts[futures[future]] = future.result()
+        return texts
+
+    def _extract_page(self, page_number: int) -> str:
+        """Extracts the text of a single page from the downloaded PDF.
+
+        Args:
+            page_number (int): The zero-based page number to extract.
+
+        Returns:
+            str: The extracted text of the page.
+        """
+
+        document = fitz.open(stream=self.file_content, filetype=self.PDF_FILETYPE)
+        try:
+            return document.load_page(page_number).get_text("text")
+        finally:
+            document.close()
 
     def _download_file(self) -> None:
         """Downloads the file from Slack.
@@ -125,14 +174,16 @@ class PdfLoader(BaseLoader):
         self.logger.debug(f"Downloading file on team: {self.body['team_id']}")
 
         headers = {"Authorization": f"Bearer {self.context['bot_token']}"}
-        response = requests.get(self.file["url_private"], headers=headers)
-        if response.status_code != HTTPStatus.OK:
-            error_message = f"Failed to download file. status code: {response.status_code}"
-            self.logger.error(error_message)
-            raise ValueError(error_message)
+        with _session.get(self.file["url_private"], headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            if response.status_code != HTTPStatus.OK:
+                error_message = f"Failed to download file. status code: {response.status_code}"
+                self.logger.error(error_message)
+                raise ValueError(error_message)
 
-        self.temp_file = tempfile.NamedTemporaryFile()
-        self.temp_file.write(response.content)
+            buffer = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                buffer.write(chunk)
+        self.file_content = buffer.getbuffer()
 
         self.logger.info(f"Downloaded file on team: {self.body['team_id']}")
 
@@ -149,7 +200,7 @@ class PdfLoader(BaseLoader):
         event_time = self.body["event_time"]
 
         try:
-            timestamp = datetime.fromtimestamp(event_time, timezone.utc)
+            timestamp = format_slack_timestamp(event_time)
         except ValueError:
             error_message = f"Error converting date: {event_time}"
             self.logger.error(error_message)
@@ -157,11 +208,11 @@ class PdfLoader(BaseLoader):
 
         return {
             "file_or_attachment_id": self.file["id"],
-            "content_type": self.file["filetype"],
-            "channel_type": self.channel_type,
+            "content_type": sys.intern(self.file["filetype"]),
+            "channel_type": sys.intern(self.channel_type),
             "channel_id": self.body["event"]["channel_id"],
             "thread_ts": FILE_DOCUMENT_THREAD_TS,
             "ts": self.body["event"]["event_ts"],
-            "timestamp": timestamp.isoformat(),
+            "timestamp": timestamp,
             "permalink": self.file["permalink"],
         }
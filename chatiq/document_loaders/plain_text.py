@@ -1,5 +1,5 @@
 import logging
-from datetime import datetime, timezone
+import sys
 from typing import List
 
 from langchain.docstore.document import Document
@@ -8,70 +8,72 @@ from langchain.text_splitter import TokenTextSplitter
 
 from chatiq.constants import FILE_DOCUMENT_THREAD_TS
 from chatiq.text_processor import TextProcessor
-from chatiq.utils import pretty_json_dumps
+from chatiq.utils import compact_json_dumps, format_slack_timestamp
 
 
 class PlainTextLoader(BaseLoader):
-    PLAIN_TEXT_FILETYPES = {
-        "text",
-        "applescript",
-        "c",
-        "csharp",
-        "cpp",
-        "css",
-        "csv",
-        "clojure",
-        "coffeescript",
-        "d",
-        "dart",
-        "diff",
-        "dockerfile",
-        "docs",
-        "erlang",
-        "fortran",
-        "go",
-        "gpres",
-        "groovy",
-        "gzip",
-        "html",
-        "handlebars",
-        "haskell",
-        "haxe",
-        "java",
-        "javascript",
-        "json",
-        "kotlin",
-        "latex",
-        "lisp",
-        "lua",
-        "markdown",
-        "matlab",
-        "mumps",
-        "objc",
-        "ocaml",
-        "pascal",
-        "perl",
-        "php",
-        "pig",
-        "powershell",
-        "puppet",
-        "python",
-        "r",
-        "ruby",
-        "rust",
-        "sql",
-        "sass",
-        "scala",
-        "scheme",
-        "shell",
-        "smalltalk",
-        "swift",
-        "tsv",
-        "vb",
-        "vbscript",
-        "velocity",
-        "xml",
-    }
+    PLAIN_TEXT_FILETYPES = frozenset(
+        {
+            "text",
+            "applescript",
+            "c",
+            "csharp",
+            "cpp",
+            "css",
+            "csv",
+            "clojure",
+            "coffeescript",
+            "d",
+            "dart",
+            "diff",
+            "dockerfile",
+            "docs",
+            "erlang",
+            "fortran",
+            "go",
+            "gpres",
+            "groovy",
+            "gzip",
+            "html",
+            "handlebars",
+            "haskell",
+            "haxe",
+            "java",
+            "javascript",
+            "json",
+            "kotlin",
+            "latex",
+            "lisp",
+            "lua",
+            "markdown",
+            "matlab",
+            "mumps",
+            "objc",
+            "ocaml",
+            "pascal",
+            "perl",
+            "php",
+            "pig",
+            "powershell",
+            "puppet",
+            "python",
+            "r",
+            "ruby",
+            "rust",
+            "sql",
+            "sass",
+            "scala",
+            "scheme",
+            "shell",
+            "smalltalk",
+            "swift",
+            "tsv",
+            "vb",
+            "vbscript",
+            "velocity",
+            "xml",
+        }
+    )
 
     """A class for loading plain text files in Slack into Document objects.
 
@@ -124,23 +126,24 @@ class PlainTextLoader(BaseLoader):
         texts = self.splitter.split_text(self.content)
         page_count = len(texts)
 
-        documents = []
-        for i, text in enumerate(texts):
-            page_content = pretty_json_dumps(
-                {
-                    "content_type": self.file["filetype"],
-                    "user": self.body["event"]["user_id"],
-                    "name": self.file["name"],
-                    "title": self.file["title"],
-                    "channel": self.body["event"]["channel_id"],
-                    "content": text,
-                    "page": f"{i + 1} / {page_count}",
-                    "permalink": self.file["permalink"],
-                    "timestamp": metadata["timestamp"],
-                }
+        # The per-file fields are assembled once and each chunk only adds its
+        # content and page number, so the loop does no redundant dict building.
+        base_content = {
+            "content_type": self.file["filetype"],
+            "user": self.body["event"]["user_id"],
+            "name": self.file["name"],
+            "title": self.file["title"],
+            "channel": self.body["event"]["channel_id"],
+            "permalink": self.file["permalink"],
+            "timestamp": metadata["timestamp"],
+        }
+        return [
+            Document(
+                page_content=compact_json_dumps({**base_content, "content": text, "page": f"{i + 1} / {page_count}"}),
+                metadata=metadata,
             )
-            documents.append(Document(page_content=page_content, metadata=metadata))
-        return documents
+            for i, text in enumerate(texts)
+        ]
 
     def _build_metadata(self) -> dict:
         """Builds metadata for the Document object based on the file dictionary.
@@ -155,7 +158,7 @@ class PlainTextLoader(BaseLoader):
         event_time = self.body["event_time"]
 
         try:
-            timestamp = datetime.fromtimestamp(event_time, timezone.utc)
+            timestamp = format_slack_timestamp(event_time)
         except ValueError:
             error_message = f"Error converting date: {event_time}"
             self.logger.error(error_message)
@@ -163,11 +166,11 @@ class PlainTextLoader(BaseLoader):
 
         return {
             "file_or_attachment_id": self.file["id"],
-            "content_type": self.file["filetype"],
-            "channel_type": self.channel_type,
+            "content_type": sys.intern(self.file["filetype"]),
+            "channel_type": sys.intern(self.channel_type),
             "channel_id": self.body["event"]["channel_id"],
             "thread_ts": FILE_DOCUMENT_THREAD_TS,
             "ts": self.body["event"]["event_ts"],
-            "timestamp": timestamp.isoformat(),
+            "timestamp": timestamp,
             "permalink": self.file["permalink"],
         }
@@ -1,5 +1,6 @@
 import logging
-from datetime import datetime, timezone
+import re
+import sys
 from typing import List
 
 from langchain.docstore.document import Document
@@ -7,11 +8,13 @@ from langchain.document_loaders.base import BaseLoader
 
 from chatiq.constants import FILE_DOCUMENT_THREAD_TS
 from chatiq.text_processor import TextProcessor
-from chatiq.utils import pretty_json_dumps
+from chatiq.utils import compact_json_dumps, format_slack_timestamp
 
 from .pdf import PdfLoader
 from .plain_text import PlainTextLoader
 
+_SLACK_ARCHIVES_RE = re.compile(r"^https://[^/]+\.slack\.com/archives/")
+
 
 class SlackLinkLoader(BaseLoader):
     """A class for loading attachments in Slack into Document objects.
@@ -32,7 +35,7 @@ class SlackLinkLoader(BaseLoader):
         original_url = attachment.get("original_url")
         author = attachment.get("author_id")
         text = attachment.get("text")
-        return id and original_url and author and text
+        return bool(id and author and text and original_url and _SLACK_ARCHIVES_RE.match(original_url))
 
     def __init__(self, body: dict, message: dict, attachment: dict, model: str):
         """Initializes the SlackLinkLoader with a Slack body.
@@ -77,7 +80,7 @@ class SlackLinkLoader(BaseLoader):
         if files:
             page_content["files"] = files
 
-        return [Document(page_content=pretty_json_dumps(page_content), metadata=metadata)]
+        return [Document(page_content=compact_json_dumps(page_content), metadata=metadata)]
 
     def _build_metadata(self) -> dict:
         """Builds metadata for the Document object based on the attachment dictionary.
@@ -92,7 +95,7 @@ class SlackLinkLoader(BaseLoader):
         event_time = self.body["event_time"]
 
         try:
-            timestamp = datetime.fromtimestamp(event_time, timezone.utc)
+            timestamp = format_slack_timestamp(event_time)
         except ValueError:
             error_message = f"Error converting date: {event_time}"
             self.logger.error(error_message)
@@ -103,11 +106,11 @@ class SlackLinkLoader(BaseLoader):
         return {
             "file_or_attachment_id": attachment_id,
             "content_type": "slack_link",
-            "channel_type": self.body["event"]["channel_type"],
+            "channel_type": sys.intern(self.body["event"]["channel_type"]),
             "channel_id": self.body["event"]["channel"],
             "thread_ts": FILE_DOCUMENT_THREAD_TS,
             "ts": self.message["ts"],
-            "timestamp": timestamp.isoformat(),
+            "timestamp": timestamp,
             "permalink": self.attachment["original_url"],
         }
 
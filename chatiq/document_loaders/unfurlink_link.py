@@ -1,5 +1,5 @@
 import logging
-from datetime import datetime, timezone
+import sys
 from typing import List
 
 from langchain.docstore.document import Document
@@ -7,7 +7,7 @@ from langchain.document_loaders.base import BaseLoader
 
 from chatiq.constants import FILE_DOCUMENT_THREAD_TS
 from chatiq.text_processor import TextProcessor
-from chatiq.utils import pretty_json_dumps
+from chatiq.utils import compact_json_dumps, format_slack_timestamp
 
 
 class UnfurlingLinkLoader(BaseLoader):
@@ -72,7 +72,7 @@ class UnfurlingLinkLoader(BaseLoader):
         if self.attachment.get("service_name"):
             page_content["service_name"] = self.attachment["service_name"]
 
-        return [Document(page_content=pretty_json_dumps(page_content), metadata=metadata)]
+        return [Document(page_content=compact_json_dumps(page_content), metadata=metadata)]
 
     def _build_metadata(self) -> dict:
         """Builds metadata for the Document object based on the attachment dictionary.
@@ -87,7 +87,7 @@ class UnfurlingLinkLoader(BaseLoader):
         event_time = self.body["event_time"]
 
         try:
-            timestamp = datetime.fromtimestamp(event_time, timezone.utc)
+            timestamp = format_slack_timestamp(event_time)
         except ValueError:
             error_message = f"Error converting date: {event_time}"
             self.logger.error(error_message)
@@ -98,10 +98,10 @@ class UnfurlingLinkLoader(BaseLoader):
         return {
             "file_or_attachment_id": attachment_id,
             "content_type": "unfurling_link",
-            "channel_type": self.body["event"]["channel_type"],
+            "channel_type": sys.intern(self.body["event"]["channel_type"]),
             "channel_id": self.body["event"]["channel"],
             "thread_ts": FILE_DOCUMENT_THREAD_TS,
             "ts": self.message["ts"],
-            "timestamp": timestamp.isoformat(),
+            "timestamp": timestamp,
             "permalink": self.attachment["original_url"],
         }
@@ -1,14 +1,12 @@
 from logging import Logger
 
 from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
-from sqlalchemy.exc import SQLAlchemyError
 
 import chatiq
 from chatiq.block_builders import HomeScreenBlockBuilder
 from chatiq.repositories.slack_team_repository import SlackTeamRepository
 
-from .base import BaseHandler
+from .base import BaseHandler, log_error
 
 
 class AppHomeOpenedHandler(BaseHandler):
@@ -49,9 +47,5 @@ class AppHomeOpenedHandler(BaseHandler):
             client.views_publish(user_id=body["event"]["user"], view={"type": "home", "blocks": blocks})
 
             logger.info(f"Published App Home on team: {body['team_id']}")
-        except SlackApiError as e:
-            logger.error(f"SlackApiError: {e}")
-        except SQLAlchemyError as e:
-            logger.error(f"SQLAlchemyError: {e}")
         except Exception as e:
-            logger.error(f"Error: {e}")
+            log_error(logger, e)
@@ -1,4 +1,5 @@
 import threading
+import time
 from logging import Logger
 from typing import Callable, List, Tuple
 
@@ -14,13 +15,49 @@ import chatiq
 from chatiq.channel_info_parser import ChannelInfoParser
 from chatiq.chat_chain import ChatChain
 from chatiq.exceptions import TemperatureRangeError, TimezoneOffsetSelectError
-from chatiq.models import SlackTeam
+from chatiq.models import SlackTeam, TeamConfig
 from chatiq.repositories import SlackTeamRepository
 from chatiq.text_processor import TextProcessor
-from chatiq.vectorstore import Vectorstore
+from chatiq.vectorstore import get_vectorstore
 
 from .base import BaseHandler
 
+CHANNEL_INFO_CACHE_SIZE = 1024
+CHANNEL_INFO_CACHE_TTL = 60.0
+LLM_CACHE_SIZE = 64
+
+# Channel topic/purpose/privacy changes rarely but is re-fetched per mention
+# and rate-limited by Slack, so recent results are served from memory.
+_channel_info_cache: dict = {}
+_channel_info_lock = threading.Lock()
+
+# ChatOpenAI instances are stateless per request but expensive to validate;
+# one instance per (model, temperature) pair is shared across mentions.
+_llm_cache: dict = {}
+_llm_lock = threading.Lock()
+
+
+def _get_chat_model(model: str, temperature: float) -> ChatOpenAI:
+    """Returns a shared ChatOpenAI instance for a model and temperature.
+
+    Args:
+        model (str): The model name.
+        temperature (float): The sampling temperature.
+
+    Returns:
+        ChatOpenAI: The shared chat model instance.
+    """
+
+    key = (model, temperature)
+    with _llm_lock:
+        chat = _llm_cache.get(key)
+        if chat is None:
+            if len(_llm_cache) >= LLM_CACHE_SIZE:
+                _llm_cache.clear()
+            chat = ChatOpenAI(model_name=model, temperature=temperature)
+            _llm_cache[key] = chat
+    return chat
+
 
 class AppMentionHandler(BaseHandler):
     """Event handler for the "app_mention" Slack event.
@@ -44,8 +81,8 @@ class AppMentionHandler(BaseHandler):
         """Event handler for the “app_mention" Slack event.
 
         When the bot is mentioned in a message, this method is called to handle the event. To prevent the
-        handler from taking too long and causing Slack to send duplicate events, a new thread is started to
-        handle the event's processing.
+        handler from taking too long and causing Slack to send duplicate events, the event's processing is
+        submitted to the shared background executor.
 
         Args:
             client (WebClient): The Slack WebClient for making API calls.
@@ -58,12 +95,10 @@ class AppMentionHandler(BaseHandler):
         if "edited" in body["event"]:
             return
 
-        thread = threading.Thread(target=self._handle, args=(client, body, logger, say))
-        self.chatiq.add_thread(thread)
-        thread.start()
+        self.chatiq.submit(self._handle, client, body, logger, say)
 
     def _handle(self, client: WebClient, body: dict, logger: Logger, say: Callable[..., None]) -> None:
-        """Actual handler function that processes the "app_mention" event. This function is run in a separate thread.
+        """Actual handler function that processes the "app_mention" event. This function is run on the background executor.
 
         Args:
             client (WebClient): The Slack WebClient for making API calls.
@@ -86,13 +121,15 @@ class AppMentionHandler(BaseHandler):
             with self.chatiq.db.transaction() as session:
                 repo = SlackTeamRepository(session)
                 team = repo.get_or_create(team_id, bot_id)
-                model = team.model
-                temperature = temperature if temperature is not None else team.temperature
-                timezone_offset = timezone_offset or team.timezone_offset
-                context = context or team.context
+                config = TeamConfig.from_team(team)
+
+            model = config.model
+            temperature = temperature if temperature is not None else config.temperature
+            timezone_offset = timezone_offset or config.timezone_offset
+            context = context or config.context
 
             token_length = TextProcessor.get_token_length_for_model(model)  # type: ignore
-            chat = ChatOpenAI(model_name=model, temperature=temperature)
+            chat = _get_chat_model(model, temperature)
 
             memory = ConversationTokenBufferMemory(
                 llm=chat,
@@ -103,7 +140,7 @@ class AppMentionHandler(BaseHandler):
                 max_token_limit=token_length,  # type: ignore
             )
 
-            vectorstore = Vectorstore(self.chatiq.weaviate_client, team_id)
+            vectorstore = get_vectorstore(self.chatiq.weaviate_client, team_id)
             vectorstore.ensure_index()
             retriever = vectorstore.as_retriever(is_private, channel_id, thread_ts)
 
@@ -165,6 +202,9 @@ class AppMentionHandler(BaseHandler):
     def _get_channel_info(self, client: WebClient, channel_id: str) -> Tuple[str, str, bool]:
         """Retrieves the topic, description and privacy status of a given Slack channel.
 
+        Results are cached per channel for a short interval to avoid
+        re-fetching rate-limited channel info on every mention.
+
         Args:
             client (WebClient): The Slack WebClient for making API calls.
             channel_id (str): The ID of the Slack channel.
@@ -173,11 +213,22 @@ class AppMentionHandler(BaseHandler):
             Tuple[str, str, bool]: The topic, description and the privacy status of the channel.
         """
 
+        with _channel_info_lock:
+            entry = _channel_info_cache.get(channel_id)
+            if entry and entry[0] >= time.monotonic():
+                return entry[1]
+
         info = client.conversations_info(channel=channel_id)
         topic = info["channel"]["topic"]["value"]
         description = info["channel"]["purpose"]["value"]
         is_private = info["channel"]["is_private"]
-        return topic, description, is_private
+        channel_info = (topic, description, is_private)
+
+        with _channel_info_lock:
+            if len(_channel_info_cache) >= CHANNEL_INFO_CACHE_SIZE:
+                _channel_info_cache.clear()
+            _channel_info_cache[channel_id] = (time.monotonic() + CHANNEL_INFO_CACHE_TTL, channel_info)
+        return channel_info
 
     def _get_messages(self, client: WebClient, channel_id: str, thread_ts: str) -> List[dict]:
         """Retrieves the previous messages in the thread where the bot was mentioned.
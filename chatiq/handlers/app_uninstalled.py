@@ -1,14 +1,10 @@
 from logging import Logger
 
-from slack_sdk.errors import SlackApiError
-from sqlalchemy.exc import SQLAlchemyError
-from weaviate.exceptions import WeaviateBaseError
-
 import chatiq
 from chatiq.repositories import SlackTeamRepository
-from chatiq.vectorstore import Vectorstore
+from chatiq.vectorstore import get_vectorstore
 
-from .base import BaseHandler
+from .base import BaseHandler, log_error
 
 
 class AppUninstalledHandler(BaseHandler):
@@ -45,15 +41,9 @@ class AppUninstalledHandler(BaseHandler):
                 repo = SlackTeamRepository(session)
                 repo.delete(body["team_id"])
 
-            vectorstore = Vectorstore(self.chatiq.weaviate_client, body["team_id"])
+            vectorstore = get_vectorstore(self.chatiq.weaviate_client, body["team_id"])
             vectorstore.delete_index()
 
             logger.info(f"Deleted index from vectorstore on team: {body['team_id']}")
-        except SlackApiError as e:
-            logger.error(f"SlackApiError: {e}")
-        except WeaviateBaseError as e:
-            logger.error(f"WeaviateBaseError: {e}")
-        except SQLAlchemyError as e:
-            logger.error(f"SQLAlchemyError: {e}")
         except Exception as e:
-            logger.error(f"Error: {e}")
+            log_error(logger, e)
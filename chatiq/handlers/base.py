@@ -1,5 +1,35 @@
+from logging import Logger
+
+from slack_sdk.errors import SlackApiError
+from sqlalchemy.exc import SQLAlchemyError
+from weaviate.exceptions import WeaviateBaseError
+
 import chatiq
 
+ERROR_PREFIXES = (
+    (SlackApiError, "SlackApiError"),
+    (WeaviateBaseError, "WeaviateBaseError"),
+    (SQLAlchemyError, "SQLAlchemyError"),
+)
+
+
+def log_error(logger: Logger, error: Exception) -> None:
+    """Logs an exception with a prefix identifying its library of origin.
+
+    Replaces the repeated per-library except clauses in handlers with a single
+    classification pass, so handlers need only one except block.
+
+    Args:
+        logger (Logger): The logger to log the error message.
+        error (Exception): The exception to be logged.
+    """
+
+    for error_class, prefix in ERROR_PREFIXES:
+        if isinstance(error, error_class):
+            logger.error(f"{prefix}: {error}")
+            return
+    logger.error(f"{type(error).__name__}: {error}")
+
 
 class BaseHandler:
     """Base class for handling Slack events.
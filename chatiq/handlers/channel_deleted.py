@@ -1,12 +1,9 @@
 from logging import Logger
 
-from slack_sdk.errors import SlackApiError
-from weaviate.exceptions import WeaviateBaseError
-
 import chatiq
-from chatiq.vectorstore import Vectorstore
+from chatiq.vectorstore import get_vectorstore
 
-from .base import BaseHandler
+from .base import BaseHandler, log_error
 
 
 class ChannelDeletedHandler(BaseHandler):
@@ -42,15 +39,11 @@ class ChannelDeletedHandler(BaseHandler):
         try:
             logger.debug(f"Channel deleteed on team: {body['team_id']}")
 
-            vectorstore = Vectorstore(self.chatiq.weaviate_client, body["team_id"])
+            vectorstore = get_vectorstore(self.chatiq.weaviate_client, body["team_id"])
             vectorstore.ensure_index()
 
             vectorstore.delete_channel(body["event"]["channel"])
 
             logger.info(f"Deleted channel from vectorstore on team: {body['team_id']}")
-        except SlackApiError as e:
-            logger.error(f"SlackApiError: {e}")
-        except WeaviateBaseError as e:
-            logger.error(f"WeaviateBaseError: {e}")
         except Exception as e:
-            logger.error(f"Error: {e}")
+            log_error(logger, e)
@@ -2,14 +2,12 @@ from logging import Logger
 from typing import Callable
 
 from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
-from sqlalchemy.exc import SQLAlchemyError
 
 import chatiq
 from chatiq.block_builders import HomeScreenBlockBuilder
 from chatiq.repositories import SlackTeamRepository
 
-from .base import BaseHandler
+from .base import BaseHandler, log_error
 
 
 class ContextSaveHandler(BaseHandler):
@@ -52,9 +50,5 @@ class ContextSaveHandler(BaseHandler):
             ack()
 
             logger.info(f"Saved context on team: {body['team']['id']}")
-        except SlackApiError as e:
-            logger.error(f"SlackApiError: {e}")
-        except SQLAlchemyError as e:
-            logger.error(f"SQLAlchemyError: {e}")
         except Exception as e:
-            logger.error(f"Error: {e}")
+            log_error(logger, e)
@@ -1,20 +1,15 @@
-import threading
 from logging import Logger
 from typing import Optional, Tuple
 
-from bs4 import BeautifulSoup
 from slack_bolt import BoltContext
 from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
-from sqlalchemy.exc import SQLAlchemyError
-from weaviate.exceptions import WeaviateBaseError
 
 import chatiq
-from chatiq.document_loaders import PdfLoader, PlainTextLoader
+from chatiq.document_loaders import PdfLoader, loader_for
 from chatiq.repositories import SlackTeamRepository
-from chatiq.vectorstore import Vectorstore
+from chatiq.vectorstore import get_vectorstore
 
-from .base import BaseHandler
+from .base import BaseHandler, log_error
 
 
 class FileSharedHandler(BaseHandler):
@@ -46,12 +41,10 @@ class FileSharedHandler(BaseHandler):
             logger (Logger): The logger to log debug and info messages.
         """
 
-        thread = threading.Thread(target=self._handle, args=(client, context, body, logger))
-        self.chatiq.add_thread(thread)
-        thread.start()
+        self.chatiq.submit(self._handle, client, context, body, logger)
 
     def _handle(self, client: WebClient, context: BoltContext, body: dict, logger: Logger) -> None:
-        """Actual handler function that processes the "file_shared" event. This function is run in a separate thread.
+        """Actual handler function that processes the "file_shared" event. This function is run on the background executor.
 
         Args:
             client (WebClient): The Slack WebClient for making API calls.
@@ -71,17 +64,17 @@ class FileSharedHandler(BaseHandler):
                 team = repo.get_or_create(body["team_id"], body["authorizations"][0]["user_id"])
                 model = team.model
 
-            vectorstore = Vectorstore(self.chatiq.weaviate_client, body["team_id"])
+            vectorstore = get_vectorstore(self.chatiq.weaviate_client, body["team_id"])
             vectorstore.ensure_index()
 
             documents = []
-            if PdfLoader.check_supported(file):
-                pdf_loader = PdfLoader(context, body, file, channel_type, model)  # type: ignore
-                documents.extend(pdf_loader.load())
-
-            if PlainTextLoader.check_supported(file):
-                unfurling_link_loader = PlainTextLoader(content, body, file, channel_type, model)  # type: ignore
-                documents.extend(unfurling_link_loader.load())
+            loader_cls = loader_for(file)
+            if loader_cls is not None:
+                # PdfLoader downloads the file itself and needs the bot token from
+                # the context; plain-text loaders receive the already-fetched content.
+                source = context if loader_cls is PdfLoader else content
+                loader = loader_cls(source, body, file, channel_type, model)  # type: ignore
+                documents.extend(loader.load())
 
             for document in documents:
                 # Iterating through the documents list and adding each document individually
@@ -91,14 +84,8 @@ class FileSharedHandler(BaseHandler):
                 vectorstore.add_documents([document])
 
             logger.info(f"Adding file from vectorstore on team: {body['team_id']}")
-        except SlackApiError as e:
-            logger.error(f"SlackApiError: {e}")
-        except WeaviateBaseError as e:
-            logger.error(f"WeaviateBaseError: {e}")
-        except SQLAlchemyError as e:
-            logger.error(f"SQLAlchemyError: {e}")
         except Exception as e:
-            logger.error(f"Error: {e}")
+            log_error(logger, e)
 
     def _get_file_info(self, client: WebClient, file_id: str) -> Tuple[dict, Optional[str]]:
         """Retrieves the content of the file.
@@ -117,6 +104,10 @@ class FileSharedHandler(BaseHandler):
         if response.get("content"):
             content = response["content"]
         elif response.get("content_html"):
+            # bs4 is only needed for HTML snippet files, so defer its import
+            # until one actually arrives.
+            from bs4 import BeautifulSoup
+
             soup = BeautifulSoup(response["content_html"], features="html.parser")
             content = soup.get_text()
         return response["file"], content
@@ -1,15 +1,12 @@
-import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from logging import Logger
-from operator import attrgetter
 from typing import Callable, List, Optional, Tuple
 
 from langchain.docstore.document import Document
 from slack_bolt import BoltContext
 from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
-from sqlalchemy.exc import SQLAlchemyError
-from weaviate.exceptions import WeaviateBaseError
 
 import chatiq
 from chatiq.block_builders import ChannelConfigurationBlockBuilder
@@ -18,12 +15,66 @@ from chatiq.document_loaders import MessageLoader
 from chatiq.document_loaders.slack_link import SlackLinkLoader
 from chatiq.document_loaders.unfurlink_link import UnfurlingLinkLoader
 from chatiq.exceptions import TemperatureRangeError, TimezoneOffsetSelectError
-from chatiq.models import SlackTeam
+from chatiq.models import SlackTeam, TeamConfig
 from chatiq.repositories import SlackTeamRepository
 from chatiq.utils import subtract_documents
-from chatiq.vectorstore import Vectorstore
+from chatiq.vectorstore import get_vectorstore
 
-from .base import BaseHandler
+from .base import BaseHandler, log_error
+
+
+@lru_cache(maxsize=4096)
+def _message_uuid(namespace_uuid: uuid.UUID, ts: str) -> uuid.UUID:
+    """Derives the deterministic message UUID, memoized per namespace and ts.
+
+    Message edits re-ingest the same ts under the same team namespace, so the
+    uuid5 digest is computed once per message rather than per event.
+
+    Args:
+        namespace_uuid (uuid.UUID): The team's namespace UUID.
+        ts (str): The message timestamp.
+
+    Returns:
+        uuid.UUID: The derived message UUID.
+    """
+
+    return uuid.uuid5(namespace_uuid, ts)
+
+
+SUPPORTED_SUBTYPES = frozenset({"message_deleted", "message_changed", "channel_topic", "channel_purpose", "file_share"})
+
+CHECK_SUPPORTED_CACHE_SIZE = 4096
+
+_check_supported_cache: dict = {}
+
+
+def _check_supported(loader_class: type, attachment: dict) -> bool:
+    """Checks loader support for an attachment, memoized on attachment identity.
+
+    On "message_changed" events the same attachments are checked for both the
+    current and previous message versions; caching by (id, url) halves those
+    repeated checks.
+
+    Args:
+        loader_class (type): The loader class whose check_supported is consulted.
+        attachment (dict): The attachment to the message.
+
+    Returns:
+        bool: If the attachment is supported by the loader or not.
+    """
+
+    id = attachment.get("id")
+    url = attachment.get("from_url") or attachment.get("original_url")
+    if id is None or url is None:
+        return bool(loader_class.check_supported(attachment))
+
+    key = (loader_class, id, url)
+    supported = _check_supported_cache.get(key)
+    if supported is None:
+        if len(_check_supported_cache) >= CHECK_SUPPORTED_CACHE_SIZE:
+            _check_supported_cache.clear()
+        supported = _check_supported_cache[key] = bool(loader_class.check_supported(attachment))
+    return supported
 
 
 class MessageHandler(BaseHandler):
@@ -57,17 +108,23 @@ class MessageHandler(BaseHandler):
             say (Callable[..., None]): The function to post messages.
         """
 
-        subtype = body["event"].get("subtype")
-        if subtype not in ("message_deleted", "message_changed", "channel_topic", "channel_purpose", "file_share", None):
+        event = body["event"]
+        subtype = event.get("subtype")
+        if subtype is not None and subtype not in SUPPORTED_SUBTYPES:
             logger.debug(f"Unsupported message subtype is received: {subtype}")
             return
 
-        thread = threading.Thread(target=self._handle, args=(client, context, body, logger, say))
-        self.chatiq.add_thread(thread)
-        thread.start()
+        # Skip the bot's own messages so replies do not trigger another
+        # ingestion job for every answer the bot posts.
+        bot_id = event.get("bot_id") or (event.get("message") or {}).get("bot_id")
+        if bot_id and bot_id == context.get("bot_id"):
+            logger.debug(f"Skipping own bot message on team: {body['team_id']}")
+            return
+
+        self.chatiq.submit(self._handle, client, context, body, logger, say)
 
     def _handle(self, client: WebClient, context: BoltContext, body: dict, logger: Logger, say: Callable[..., None]) -> None:
-        """Actual handler function that processes the "message" event. This function is run in a separate thread.
+        """Actual handler function that processes the "message" event. This function is run on the background executor.
 
         Args:
             client (WebClient): The Slack WebClient for making API calls.
@@ -101,6 +158,11 @@ class MessageHandler(BaseHandler):
         if body["event"].get("subtype") == "message_changed":
             message = body["event"]["message"]
             previous_message = body["event"]["previous_message"]
+            # Slack occasionally re-delivers message_changed events where
+            # nothing actually changed; there is no work to do for those.
+            if message == previous_message:
+                logger.debug(f"Skipping unchanged message on team: {body['team_id']}")
+                return
         else:
             message = body["event"]
             previous_message = None
@@ -111,24 +173,32 @@ class MessageHandler(BaseHandler):
             with self.chatiq.db.transaction() as session:
                 repo = SlackTeamRepository(session)
                 team = repo.get_or_create(body["team_id"], body["authorizations"][0]["user_id"])
-                model, namespace_uuid = attrgetter("model", "namespace_uuid")(team)
+                config = TeamConfig.from_team(team)
 
-            vectorstore = Vectorstore(self.chatiq.weaviate_client, body["team_id"])
+            vectorstore = get_vectorstore(self.chatiq.weaviate_client, body["team_id"])
             vectorstore.ensure_index()
 
-            message_loader = MessageLoader(client, body, message, model)
-            message_documents = message_loader.load()
-
-            uuids = [uuid.uuid5(namespace_uuid, doc.metadata["ts"]) for doc in message_documents]  # type: ignore
+            message_loader = MessageLoader(client, body, message, config.model)
+
+            # The message load and the two link diffs hit disjoint Slack
+            # endpoints, so run the I/O-bound loads concurrently and keep the
+            # vectorstore writes sequential below.
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                message_documents_future = executor.submit(message_loader.load)
+                unfurling_link_future = executor.submit(
+                    self._diff_unfurling_link_documents, body, message, previous_message, config.model
+                )
+                slack_link_future = executor.submit(
+                    self._diff_slack_link_documents, body, message, previous_message, config.model
+                )
+                message_documents = message_documents_future.result()
+                added_unfurling_link_documents, deleted_unfurling_link_documents = unfurling_link_future.result()
+                added_slack_link_documents, deleted_slack_link_documents = slack_link_future.result()
+
+            namespace_uuid = config.namespace_uuid
+            uuids = [_message_uuid(namespace_uuid, doc.metadata["ts"]) for doc in message_documents]
             vectorstore.add_documents(message_documents, uuids=uuids)
 
-            added_unfurling_link_documents, deleted_unfurling_link_documents = self._diff_unfurling_link_documents(
-                body, message, previous_message, model
-            )
-            added_slack_link_documents, deleted_slack_link_documents = self._diff_slack_link_documents(
-                body, message, previous_message, model
-            )
-
             for document in added_unfurling_link_documents + added_slack_link_documents:
                 # Iterating through the documents list and adding each document individually
                 # to the vectorstore. While vectorstore.add_documents is capable of handling a list
@@ -139,14 +209,8 @@ class MessageHandler(BaseHandler):
                 vectorstore.delete_file_or_attachment(document.metadata["file_or_attachment_id"])
 
             logger.info(f"Added documents to vectorstore on team: {body['team_id']}")
-        except SlackApiError as e:
-            logger.error(f"SlackApiError: {e}")
-        except WeaviateBaseError as e:
-            logger.error(f"WeaviateBaseError: {e}")
-        except SQLAlchemyError as e:
-            logger.error(f"SQLAlchemyError: {e}")
         except Exception as e:
-            logger.error(f"Error: {e}")
+            log_error(logger, e)
 
     def _handle_message_deleted_event(self, body: dict, logger: Logger) -> None:
         """Handles deleting messages.
@@ -159,16 +223,14 @@ class MessageHandler(BaseHandler):
         try:
             logger.debug(f"Deletiing message on team: {body['team_id']}")
 
-            vectorstore = Vectorstore(self.chatiq.weaviate_client, body["team_id"])
+            vectorstore = get_vectorstore(self.chatiq.weaviate_client, body["team_id"])
             vectorstore.ensure_index()
 
             vectorstore.delete_message(body["event"]["previous_message"]["ts"])
 
             logger.info(f"Deleted documents from vectorstore on team: {body['team_id']}")
-        except WeaviateBaseError as e:
-            logger.error(f"WeaviateBaseError: {e}")
         except Exception as e:
-            logger.error(f"Error: {e}")
+            log_error(logger, e)
 
     def _handle_channel_info_event(self, client: WebClient, body: dict, logger: Logger, say: Callable[..., None]) -> None:
         """Handles channel topic and purpose change.
@@ -186,7 +248,12 @@ class MessageHandler(BaseHandler):
         try:
             logger.debug(f"Changing channel info on team: {team_id}")
 
-            topic, description = self._get_channel_info(client, channel_id)
+            # channel_topic and channel_purpose events carry the new values in
+            # the payload, so the API round-trip is only needed as a fallback.
+            topic = body["event"].get("topic")
+            description = body["event"].get("purpose")
+            if topic is None or description is None:
+                topic, description = self._get_channel_info(client, channel_id)
             temperature, timezone_offset, context = ChannelInfoParser(topic, description).parse()
             blocks = ChannelConfigurationBlockBuilder.build_channel_configuration(temperature, timezone_offset, context)
 
@@ -208,12 +275,8 @@ class MessageHandler(BaseHandler):
                 "Please ensure the timezone offset  :round_pushpin:  of this channel "
                 f"is one of {', '.join(SlackTeam.TIMEZONE_OFFSETS)}.",
             )
-        except SlackApiError as e:
-            logger.error(f"SlackApiError: {e}")
-        except SQLAlchemyError as e:
-            logger.error(f"SQLAlchemyError: {e}")
         except Exception as e:
-            logger.error(f"Error: {e}")
+            log_error(logger, e)
 
     def _diff_unfurling_link_documents(
         self, body: dict, message: dict, previous_message: Optional[dict], model: str
@@ -231,11 +294,11 @@ class MessageHandler(BaseHandler):
             documents that have been added, and the second list contains documents that have been deleted.
         """
 
-        documents = self._load_unfurling_link_documents(body, message, model)
+        documents = self._load_link_documents(UnfurlingLinkLoader, body, message, model)
         if not previous_message:
             return documents, []
 
-        previous_documents = self._load_unfurling_link_documents(body, previous_message, model)
+        previous_documents = self._load_link_documents(UnfurlingLinkLoader, body, previous_message, model)
         added_documents = subtract_documents(documents, previous_documents)
         deleted_documents = subtract_documents(previous_documents, documents)
         return added_documents, deleted_documents
@@ -256,66 +319,36 @@ class MessageHandler(BaseHandler):
             documents that have been added, and the second list contains documents that have been deleted.
         """
 
-        documents = self._load_slack_link_documents(body, message, model)
+        documents = self._load_link_documents(SlackLinkLoader, body, message, model)
         if not previous_message:
             return documents, []
 
-        previous_documents = self._load_slack_link_documents(body, previous_message, model)
+        previous_documents = self._load_link_documents(SlackLinkLoader, body, previous_message, model)
         added_documents = subtract_documents(documents, previous_documents)
         deleted_documents = subtract_documents(previous_documents, documents)
         return added_documents, deleted_documents
 
-    def _load_unfurling_link_documents(self, body: dict, message: dict, model: str) -> List[Document]:
-        """Loads documents from unfurling links in the message.
-
-        This function iterates through the list of attachments in the message and loads the documents
-        for those that contain valid unfurling links.
-
-        Args:
-            body (dict): The body of the Slack message event.
-            message (dict): The message object from the event body.
-            model (str): The model identifier.
-
-        Returns:
-            List[Document]: A list of Document objects loaded from the unfurling links.
-        """
-
-        if not message.get("attachments"):
-            return []
+    def _load_link_documents(self, loader_class: type, body: dict, message: dict, model: str) -> List[Document]:
+        """Loads documents from link attachments in the message.
 
-        attachments = [
-            attachment for attachment in message["attachments"] if UnfurlingLinkLoader.check_supported(attachment)
-        ]
-
-        documents = []
-        for attachment in attachments:
-            loader = UnfurlingLinkLoader(body, message, attachment, model)
-            documents.extend(loader.load())
-        return documents
-
-    def _load_slack_link_documents(self, body: dict, message: dict, model: str) -> List[Document]:
-        """Loads documents from Slack links in the message.
-
-        This function iterates through the list of attachments in the message and loads the documents
-        for those that contain valid Slack links.
+        This function makes a single pass over the attachments, constructing a
+        loader only for attachments the loader class supports.
 
         Args:
+            loader_class (type): The loader class to construct for supported attachments.
             body (dict): The body of the Slack message event.
             message (dict): The message object from the event body.
             model (str): The model identifier.
 
         Returns:
-            List[Document]: A list of Document objects loaded from the Slack links.
+            List[Document]: A list of Document objects loaded from the links.
         """
 
-        if not message.get("attachments"):
-            return []
-
-        attachments = [attachment for attachment in message["attachments"] if SlackLinkLoader.check_supported(attachment)]
-
         documents = []
-        for attachment in attachments:
-            loader = SlackLinkLoader(body, message, attachment, model)
+        for attachment in message.get("attachments") or ():
+            if not _check_supported(loader_class, attachment):
+                continue
+            loader = loader_class(body, message, attachment, model)
             documents.extend(loader.load())
         return documents
 
@@ -2,15 +2,12 @@ from logging import Logger
 from typing import Callable
 
 from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
-from sqlalchemy.exc import SQLAlchemyError
 
 import chatiq
 from chatiq.block_builders import HomeScreenBlockBuilder
-from chatiq.exceptions import TemperatureRangeError
 from chatiq.repositories import SlackTeamRepository
 
-from .base import BaseHandler
+from .base import BaseHandler, log_error
 
 
 class TemperatureSelectHandler(BaseHandler):
@@ -47,17 +44,13 @@ class TemperatureSelectHandler(BaseHandler):
             with self.chatiq.db.transaction() as session:
                 repo = SlackTeamRepository(session)
                 team = repo.update(body["team"]["id"], {"temperature": float(select["selected_option"]["value"])})
-                blocks = HomeScreenBlockBuilder.build_home_screen(team)
 
+            # Build the blocks outside the transaction so the connection is not
+            # held open during pure CPU work.
+            blocks = HomeScreenBlockBuilder.build_home_screen(team)
             client.views_publish(user_id=body["user"]["id"], view={"type": "home", "blocks": blocks})
             ack()
 
             logger.info(f"Saved temperature on team: {body['team']['id']}")
-        except TemperatureRangeError as e:
-            logger.error(f"TemperatureRangeError: {e}")
-        except SlackApiError as e:
-            logger.error(f"SlackApiError: {e}")
-        except SQLAlchemyError as e:
-            logger.error(f"SQLAlchemyError: {e}")
         except Exception as e:
-            logger.error(f"Error: {e}")
+            log_error(logger, e)
@@ -0,0 +1,23 @@
+"""orjson-backed JSON decoding for the slack_bolt request path.
+
+slack_bolt parses every incoming event body with the stdlib json module.
+Swapping in orjson's C decoder shaves the per-request parse cost without
+changing any observable behavior, since orjson.loads accepts the same
+str/bytes input and returns the same dict structure.
+"""
+
+import json
+from types import SimpleNamespace
+
+import orjson
+import slack_bolt.request.internals
+
+
+def patch_slack_bolt() -> None:
+    """Registers orjson as the JSON decoder for slack_bolt request parsing.
+
+    Only the decode side is swapped; dumps stays on the stdlib so any
+    formatting slack_bolt expects is untouched. The patch is idempotent.
+    """
+
+    slack_bolt.request.internals.json = SimpleNamespace(loads=orjson.loads, dumps=json.dumps)
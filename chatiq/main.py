@@ -2,7 +2,7 @@ from flask import Flask, jsonify, make_response, request
 from slack_bolt import BoltRequest
 from slack_bolt.adapter.flask import SlackRequestHandler
 
-from chatiq import ChatIQ
+from chatiq import ChatIQ, metrics
 
 chatiq = ChatIQ(rate_limit_retry=True)
 chatiq.listen()
@@ -22,6 +22,17 @@ def healthcheck():
     return jsonify({"status": "OK"})
 
 
+@app.route("/metrics", methods=["GET"])
+def metrics_endpoint():
+    """Exposes process metrics in the Prometheus text exposition format.
+
+    Returns:
+        Response: A plain-text response with the rendered metrics.
+    """
+
+    return make_response(metrics.render(), 200, {"Content-Type": "text/plain; version=0.0.4"})
+
+
 @app.route("/slack/install", methods=["GET"])
 @app.route("/slack/oauth_redirect", methods=["GET"])
 def oauth_redirect():
@@ -0,0 +1,129 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+This module keeps counters and duration histograms for the hot Weaviate and
+cache paths without pulling in a client dependency. Metrics are process-local,
+protected by a single lock, and rendered on demand by the /metrics endpoint.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Iterator, Tuple
+
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+_lock = threading.Lock()
+_counters: dict = defaultdict(float)
+_histograms: dict = {}
+
+
+def _labels_key(labels: dict) -> Tuple[Tuple[str, str], ...]:
+    """Builds a hashable, ordered key for a label set.
+
+    Args:
+        labels (dict): The label names and values.
+
+    Returns:
+        Tuple[Tuple[str, str], ...]: The sorted label items.
+    """
+
+    return tuple(sorted(labels.items()))
+
+
+def increment(name: str, value: float = 1.0, **labels: str) -> None:
+    """Increments a counter.
+
+    Args:
+        name (str): The metric name.
+        value (float): The amount to add.
+        labels (str): The label values for the series.
+    """
+
+    with _lock:
+        _counters[(name, _labels_key(labels))] += value
+
+
+def observe(name: str, value: float, **labels: str) -> None:
+    """Records an observation into a duration histogram.
+
+    Args:
+        name (str): The metric name.
+        value (float): The observed value in seconds.
+        labels (str): The label values for the series.
+    """
+
+    key = (name, _labels_key(labels))
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = {"buckets": [0] * len(DURATION_BUCKETS), "sum": 0.0, "count": 0}
+            _histograms[key] = histogram
+        for index, upper_bound in enumerate(DURATION_BUCKETS):
+            if value <= upper_bound:
+                histogram["buckets"][index] += 1
+        histogram["sum"] += value
+        histogram["count"] += 1
+
+
+@contextmanager
+def time_operation(name: str, **labels: str) -> Iterator[None]:
+    """Times a block and records the duration into a histogram.
+
+    Args:
+        name (str): The metric name.
+        labels (str): The label values for the series.
+    """
+
+    started_at = time.monotonic()
+    try:
+        yield
+    finally:
+        observe(name, time.monotonic() - started_at, **labels)
+
+
+def _format_labels(label_items: Tuple[Tuple[str, str], ...], extra: str = "") -> str:
+    """Formats a label set for the exposition format.
+
+    Args:
+        label_items (Tuple[Tuple[str, str], ...]): The sorted label items.
+        extra (str): An extra pre-rendered label pair, e.g. the histogram le bound.
+
+    Returns:
+        str: The rendered label block, or an empty string when there are no labels.
+    """
+
+    parts = [f'{label}="{value}"' for label, value in label_items]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def render() -> str:
+    """Renders all metrics in the Prometheus text exposition format.
+
+    Returns:
+        str: The rendered metrics.
+    """
+
+    lines = []
+    with _lock:
+        for (name, label_items), value in sorted(_counters.items()):
+            lines.append(f"{name}{_format_labels(label_items)} {value}")
+        for (name, label_items), histogram in sorted(_histograms.items()):
+            for index, upper_bound in enumerate(DURATION_BUCKETS):
+                bound_label = f'le="{upper_bound}"'
+                lines.append(f"{name}_bucket{_format_labels(label_items, bound_label)} {histogram['buckets'][index]}")
+            inf_label = 'le="+Inf"'
+            lines.append(f"{name}_bucket{_format_labels(label_items, inf_label)} {histogram['count']}")
+            lines.append(f"{name}_sum{_format_labels(label_items)} {histogram['sum']}")
+            lines.append(f"{name}_count{_format_labels(label_items)} {histogram['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    """Clears all recorded metrics. Intended for tests."""
+
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
@@ -1,2 +1,2 @@
 from .base import Base  # noqa: F401
-from .slack_team import SlackTeam  # noqa: F401
+from .slack_team import SlackTeam, TeamConfig  # noqa: F401
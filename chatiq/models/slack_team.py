@@ -1,4 +1,5 @@
 import uuid
+from dataclasses import dataclass
 
 from sqlalchemy import UUID  # type: ignore
 from sqlalchemy import Column, Float, Integer, String
@@ -10,6 +11,42 @@ from chatiq.utils import get_timezone_offsets
 from .base import Base
 
 
+@dataclass(frozen=True, slots=True)
+class TeamConfig:
+    """A plain snapshot of the SlackTeam configuration.
+
+    Handlers read team attributes after the database transaction has closed.
+    Copying them into a slotted dataclass avoids SQLAlchemy descriptor
+    overhead and detached-instance loads on the hot path.
+
+    Attributes:
+        model (str): The model type to use for the AI.
+        namespace_uuid (uuid.UUID): The UUID used as a namespace for generating UUIDs for messages.
+        temperature (float): The randomness of the AI's output.
+        timezone_offset (str): The default timezone offset for the team.
+        context (str): The context to use for the AI.
+    """
+
+    model: str
+    namespace_uuid: uuid.UUID
+    temperature: float
+    timezone_offset: str
+    context: str
+
+    @classmethod
+    def from_team(cls, team: "SlackTeam") -> "TeamConfig":
+        """Builds a TeamConfig from a SlackTeam model instance.
+
+        Args:
+            team (SlackTeam): The team to snapshot.
+
+        Returns:
+            TeamConfig: The configuration snapshot.
+        """
+
+        return cls(team.model, team.namespace_uuid, team.temperature, team.timezone_offset, team.context)
+
+
 class SlackTeam(Base):
     """Represents a workspace configuration for a Slack team.
 
@@ -35,7 +72,7 @@ class SlackTeam(Base):
     __tablename__ = "slack_teams"
 
     id = Column(Integer, primary_key=True)
-    team_id = Column(String(32), unique=True, nullable=False)
+    team_id = Column(String(32), unique=True, index=True, nullable=False)
     bot_id = Column(String(32), nullable=False)
     namespace_uuid = Column(UUID(as_uuid=True), unique=True, nullable=False, default=uuid.uuid4)
     model = Column(String(32), nullable=False, default="gpt-3.5-turbo")
@@ -1,4 +1,7 @@
+from typing import Any, List
+
 from langchain.prompts.chat import ChatPromptTemplate, HumanMessagePromptTemplate, SystemMessagePromptTemplate
+from langchain.schema import BaseMessage, HumanMessage, SystemMessage
 
 INPUT_VARIABLES = ["input", "chat_history", "agent_scratchpad", "bot_id", "channel_id", "time_message", "context"]
 
@@ -65,7 +68,41 @@ Always include the permalink in your response.
 {context}\
 """
 
-QUESTION_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+_MESSAGE_CLASSES = {
+    SystemMessagePromptTemplate: SystemMessage,
+    HumanMessagePromptTemplate: HumanMessage,
+}
+
+
+class FastChatPromptTemplate(ChatPromptTemplate):
+    """A ChatPromptTemplate that fills its messages with plain str.format.
+
+    The QA chain formats the question prompt once per retrieved document, and the
+    generic implementation re-walks every message template and re-validates its
+    variables on each call. The message layout of these templates is static, so
+    this override formats each template string directly.
+    """
+
+    def format_messages(self, **kwargs: Any) -> List[BaseMessage]:
+        """Formats the message templates with the provided variables.
+
+        Args:
+            kwargs (Any): The values for the template variables.
+
+        Returns:
+            List[BaseMessage]: The formatted messages.
+        """
+
+        messages = []
+        for message_template in self.messages:
+            prompt = message_template.prompt
+            content = prompt.template.format(**{variable: kwargs[variable] for variable in prompt.input_variables})
+            message_class = _MESSAGE_CLASSES[type(message_template)]
+            messages.append(message_class(content=content, additional_kwargs=message_template.additional_kwargs))
+        return messages
+
+
+QUESTION_PROMPT_TEMPLATE = FastChatPromptTemplate.from_messages(
     [
         SystemMessagePromptTemplate.from_template(QUESTION_SYSTEM_MESSAGE),
         HumanMessagePromptTemplate.from_template("{question}"),
@@ -81,7 +118,7 @@ ______________________
 {summaries}\
 """
 
-COMBINE_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+COMBINE_PROMPT_TEMPLATE = FastChatPromptTemplate.from_messages(
     [
         SystemMessagePromptTemplate.from_template(COMBINE_SYSTEM_MESSAGE),
         HumanMessagePromptTemplate.from_template("{question}"),
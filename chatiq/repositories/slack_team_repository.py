@@ -1,10 +1,55 @@
 import logging
+import time
+from typing import Optional
 
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import NoResultFound, SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from chatiq.models import SlackTeam
 
+TEAM_CACHE_SIZE = 1024
+TEAM_CACHE_TTL = 300.0
+
+_team_cache: dict = {}
+
+
+def _cache_get(team_id: str) -> Optional[SlackTeam]:
+    """Returns the cached team for a team ID if present and not expired.
+
+    Args:
+        team_id (str): The Slack team ID.
+
+    Returns:
+        Optional[SlackTeam]: The cached team, or None on a miss.
+    """
+
+    entry = _team_cache.get(team_id)
+    if entry is None:
+        return None
+
+    expires_at, team = entry
+    if expires_at < time.monotonic():
+        # pop instead of del: concurrent workers can both observe the same
+        # expired entry, and the loser must see a plain miss, not a KeyError.
+        _team_cache.pop(team_id, None)
+        return None
+    return team
+
+
+def _cache_set(team_id: str, team: SlackTeam) -> None:
+    """Stores a team in the cache, bounded by TEAM_CACHE_SIZE.
+
+    Args:
+        team_id (str): The Slack team ID.
+        team (SlackTeam): The team to cache.
+    """
+
+    if len(_team_cache) >= TEAM_CACHE_SIZE:
+        _team_cache.clear()
+    _team_cache[team_id] = (time.monotonic() + TEAM_CACHE_TTL, team)
+
 
 class SlackTeamRepository:
     """Handles interactions with the SlackTeam model in the database.
@@ -16,6 +61,8 @@ class SlackTeamRepository:
         session (Session): The SQLAlchemy session to use for database interactions.
     """
 
+    _MUTABLE_FIELDS = frozenset({"bot_id", "model", "temperature", "context", "timezone_offset"})
+
     def __init__(self, session: Session):
         """Initializes a new instance of the SlackTeamRepository.
 
@@ -29,6 +76,30 @@ class SlackTeamRepository:
     def get(self, team_id: str) -> SlackTeam:
         """Retrieve a SlackTeam.
 
+        Team rows change rarely, so reads are served from a short-lived
+        per-process cache which update and delete invalidate.
+
+        Args:
+            team_id (str): The Slack team ID of the SlackTeam to retrieve.
+
+        Returns:
+            SlackTeam: The retrieved SlackTeam.
+
+        Raises:
+            ValueError: If no SlackTeam exists with the provided team ID.
+        """
+
+        team = _cache_get(team_id)
+        if team is not None:
+            return team
+
+        team = self._find(team_id)
+        _cache_set(team_id, team)
+        return team
+
+    def _find(self, team_id: str) -> SlackTeam:
+        """Retrieve a SlackTeam from the database, bypassing the cache.
+
         Args:
             team_id (str): The Slack team ID of the SlackTeam to retrieve.
 
@@ -42,7 +113,8 @@ class SlackTeamRepository:
         self.logger.debug(f"Attempting to find team: {team_id}")
 
         try:
-            return self.session.query(SlackTeam).filter_by(team_id=team_id).one()
+            statement = select(SlackTeam).where(SlackTeam.team_id == team_id)
+            return self.session.execute(statement).scalar_one()
         except NoResultFound as e:
             error_message = f"Team {team_id} not found: {e}"
             self.logger.error(error_message)
@@ -54,6 +126,10 @@ class SlackTeamRepository:
     def get_or_create(self, team_id: str, bot_id: str) -> SlackTeam:
         """Retrieve an existing SlackTeam or create a new one if it doesn't exist.
 
+        Uses a single INSERT ... ON CONFLICT DO NOTHING round-trip; the SELECT
+        only runs when the team already exists, and the race between concurrent
+        creators is resolved by Postgres.
+
         Args:
             team_id (str): The Slack team ID of the SlackTeam to get or create.
 
@@ -61,15 +137,27 @@ class SlackTeamRepository:
             SlackTeam: The retrieved or created SlackTeam.
         """
 
+        team = _cache_get(team_id)
+        if team is not None:
+            return team
+
         self.logger.debug(f"Attempting to get or create team: {team_id}")
 
         try:
-            team = self.session.query(SlackTeam).filter_by(team_id=team_id).first()
-            if team is None:
-                team = SlackTeam(team_id=team_id, bot_id=bot_id)
-                self.session.add(team)
+            statement = (
+                insert(SlackTeam)
+                .values(team_id=team_id, bot_id=bot_id)
+                .on_conflict_do_nothing(index_elements=["team_id"])
+                .returning(SlackTeam)
+            )
+            team = self.session.execute(statement).scalars().first()
+            if team is not None:
                 self.session.commit()
                 self.logger.info(f"Created team: {team_id}")
+            else:
+                team = self.session.execute(select(SlackTeam).where(SlackTeam.team_id == team_id)).scalars().first()
+            if team is not None:
+                _cache_set(team_id, team)
             return team
         except SQLAlchemyError as e:
             self.logger.error(f"Failed to get or create team: {team_id}. Error: {e}")
@@ -88,13 +176,13 @@ class SlackTeamRepository:
         self.logger.debug(f"Attempting to update attributes of team: {team_id}")
 
         try:
-            team = self.get(team_id)
+            team = self._find(team_id)
             for field, value in attributes.items():
-                if hasattr(team, field):
-                    setattr(team, field, value)
-                else:
+                if field not in self._MUTABLE_FIELDS:
                     raise ValueError(f"Invalid field {field} for team")
+                setattr(team, field, value)
             self.session.commit()
+            _team_cache.pop(team_id, None)
             self.logger.info(f"Successfully updated attributes of team: {team_id}")
             return team
         except SQLAlchemyError as e:
@@ -110,8 +198,9 @@ class SlackTeamRepository:
         self.logger.debug(f"Deleting team: {team_id}")
 
         try:
-            delete_count = self.session.query(SlackTeam).filter(SlackTeam.team_id == team_id).delete()
+            delete_count = self.session.execute(delete(SlackTeam).where(SlackTeam.team_id == team_id)).rowcount
             self.session.commit()
+            _team_cache.pop(team_id, None)
 
             if delete_count:
                 self.logger.info(f"Deleted team: {team_id}")
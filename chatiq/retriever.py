@@ -1,10 +1,88 @@
+import time
+from typing import Dict, Iterator, List, Optional
+
+from langchain.docstore.document import Document
 from langchain.vectorstores import Weaviate
 from langchain.vectorstores.base import VectorStoreRetriever
 
+from chatiq import metrics
+
+# Static filter clauses are shared across queries; only the dynamic
+# valueString leaves are allocated per call.
+PUBLIC_CHANNEL_CLAUSE = {"path": ["channel_type"], "operator": "Equal", "valueString": "channel"}
+
+QUERY_CACHE_SIZE = 256
+QUERY_CACHE_TTL = 300.0
+EMBEDDING_CACHE_SIZE = 4096
+
+_query_cache: dict = {}
+
+# Query embeddings are deterministic for a given model, so entries never
+# expire; the cache is only bounded in size.
+_embedding_cache: dict = {}
+
+
+def _cache_lookup(key: tuple) -> Optional[List[Document]]:
+    """Returns the cached documents for a query key if present and not expired.
+
+    Args:
+        key (tuple): The namespaced query key.
+
+    Returns:
+        Optional[List[Document]]: The cached documents, or None on a miss.
+    """
+
+    entry = _query_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, documents = entry
+    if expires_at < time.monotonic():
+        # pop instead of del: concurrent retrievals can both observe the same
+        # expired entry, and the loser must see a plain miss, not a KeyError.
+        _query_cache.pop(key, None)
+        return None
+    return documents
+
+
+def _cache_store(key: tuple, documents: List[Document]) -> None:
+    """Stores query results in the cache, bounded by QUERY_CACHE_SIZE.
+
+    Args:
+        key (tuple): The namespaced query key.
+        documents (List[Document]): The documents to cache.
+    """
+
+    if len(_query_cache) >= QUERY_CACHE_SIZE:
+        _query_cache.clear()
+    _query_cache[key] = (time.monotonic() + QUERY_CACHE_TTL, documents)
+
+
+def _channel_clause(channel_id: str) -> dict:
+    """Builds the OR clause matching a private channel or any public channel.
+
+    Args:
+        channel_id (str): The ID of the private channel.
+
+    Returns:
+        dict: The OR clause for the channel filter.
+    """
+
+    return {
+        "operator": "Or",
+        "operands": [
+            {"path": ["channel_id"], "operator": "Equal", "valueString": channel_id},
+            PUBLIC_CHANNEL_CLAUSE,
+        ],
+    }
+
 
 class Retriever(VectorStoreRetriever):
     is_private: bool
     channel_id: str
+    thread_ts: str
+    check_cache: bool = True
+    scope_clause: dict
 
     """A class that retrieves documents from the Weaviate index based on certain conditions.
 
@@ -18,7 +96,7 @@ class Retriever(VectorStoreRetriever):
         thread_ts (str): The ID of the thread. This is used to exclude messages in the current thread.
     """
 
-    def __init__(self, vectorstore: Weaviate, is_private: bool, channel_id: str, thread_ts: str):
+    def __init__(self, vectorstore: Weaviate, is_private: bool, channel_id: str, thread_ts: str, check_cache: bool = True):
         """Initializes a Retriever instance for a specific team and channel.
 
         Args:
@@ -26,16 +104,106 @@ class Retriever(VectorStoreRetriever):
             is_private (bool): True if the channel is private, False otherwise.
             channel_id (str): The ID of the channel where the bot was mentioned.
             thread_ts (str): The ID of the thread. This is used to exclude messages in the current thread.
+            check_cache (bool): False to bypass the query result cache, e.g. for sensitive threads.
         """
 
-        where_filter = self._build_retrieval_where_filter(is_private, channel_id, thread_ts)
+        # The channel scope clause is the only part of the filters that depends
+        # on the channel; build it once and share it between the retrieval
+        # filter and the per-call URL filters.
+        scope_clause = _channel_clause(channel_id) if is_private else PUBLIC_CHANNEL_CLAUSE
+        thread_clause = {"path": ["thread_ts"], "operator": "NotEqual", "valueString": thread_ts}
+        operands = [thread_clause, scope_clause] if is_private else [scope_clause, thread_clause]
+        where_filter = {"operator": "And", "operands": operands}
         super().__init__(
             vectorstore=vectorstore,
             search_kwargs={"where_filter": where_filter},
             is_private=is_private,
             channel_id=channel_id,
+            thread_ts=thread_ts,
+            check_cache=check_cache,
+            scope_clause=scope_clause,
         )
 
+    def get_relevant_documents(self, query: str) -> List[Document]:
+        """Retrieves relevant documents, serving repeat queries from a short-lived cache.
+
+        Results are cached per normalized query, namespaced by index, channel,
+        privacy and thread, so re-asked questions skip the Weaviate round-trip
+        while the entry is fresh. The index name carries the team, which keeps
+        Slack Connect channels (same channel_id across workspaces) from sharing
+        entries across teams.
+
+        Args:
+            query (str): The query to retrieve documents for.
+
+        Returns:
+            List[Document]: The relevant documents.
+        """
+
+        if not self.check_cache:
+            return self._search(query)
+
+        normalized_query = " ".join(query.split()).lower()
+        key = (self.vectorstore._index_name, self.channel_id, self.is_private, self.thread_ts, normalized_query)
+        documents = _cache_lookup(key)
+        if documents is None:
+            metrics.increment("chatiq_query_cache_misses_total")
+            documents = self._search(query, normalized_query)
+            _cache_store(key, documents)
+        else:
+            metrics.increment("chatiq_query_cache_hits_total")
+        return documents
+
+    def _search(self, query: str, normalized_query: Optional[str] = None) -> List[Document]:
+        """Runs the similarity search, reusing cached query embeddings when possible.
+
+        A repeated query whose embedding is already cached is searched with
+        nearVector, skipping the server-side transformers forward pass; on a
+        miss the query is embedded once through the text2vec-transformers
+        module endpoint and cached. If the module endpoint is unavailable the
+        search falls back to plain nearText.
+
+        Args:
+            query (str): The query to retrieve documents for.
+            normalized_query (Optional[str]): The normalized form used as the embedding cache key.
+
+        Returns:
+            List[Document]: The relevant documents.
+        """
+
+        if normalized_query is None:
+            normalized_query = " ".join(query.split()).lower()
+
+        vector = _embedding_cache.get(normalized_query)
+        if vector is None:
+            vector = self._embed_query(query)
+            if vector is None:
+                return super().get_relevant_documents(query)
+            if len(_embedding_cache) >= EMBEDDING_CACHE_SIZE:
+                _embedding_cache.clear()
+            _embedding_cache[normalized_query] = vector
+
+        return self.vectorstore.similarity_search_by_vector(vector, **self.search_kwargs)
+
+    def _embed_query(self, query: str) -> Optional[List[float]]:
+        """Embeds a query through the text2vec-transformers module endpoint.
+
+        Args:
+            query (str): The query to embed.
+
+        Returns:
+            Optional[List[float]]: The query embedding, or None if the module endpoint failed.
+        """
+
+        try:
+            response = self.vectorstore._client._connection.post(
+                path="/modules/text2vec-transformers/vectors",
+                weaviate_object={"text": query},
+            )
+            return response.json()["vector"]
+        except Exception:
+            return None
+
     def search_url(self, url: str) -> str:
         """Search for a specific URL in the Weaviate index.
 
@@ -49,7 +217,7 @@ class Retriever(VectorStoreRetriever):
             str: The content of the first document matching the URL.
         """
 
-        where_filter = self._build_url_search_where_filter(self.is_private, self.channel_id, url)
+        where_filter = self._build_url_search_where_filter(url)
         result = (
             self.vectorstore._client.query.get(self.vectorstore._index_name, self.vectorstore._query_attrs)
             .with_where(where_filter)
@@ -63,134 +231,90 @@ class Retriever(VectorStoreRetriever):
 
         return "Document is not found."
 
-    def _build_retrieval_where_filter(self, is_private: bool, channel_id: str, thread_ts: str) -> dict:
-        """Builds a filter for retrieving documents based on whether the channel is private or public.
+    ITER_SEARCH_PAGE_SIZE = 100
 
-        Args:
-            is_private (bool): True if the channel is private, False otherwise.
-            channel_id (str): The ID of the channel where the bot was mentioned.
-            thread_ts (str): The ID of the thread. This is used to exclude messages in the current thread.
+    def iter_search(self, where_filter: dict, page_size: int = ITER_SEARCH_PAGE_SIZE) -> Iterator[Document]:
+        """Lazily iterates all documents matching a filter, one page per round-trip.
 
-        Returns:
-            dict: A filter to be used for document retrieval.
-        """
-
-        if is_private:
-            return self._build_retrieval_private_where_filter(channel_id, thread_ts)
-        else:
-            return self._build_retrieval_public_where_filter(thread_ts)
-
-    def _build_retrieval_private_where_filter(self, channel_id: str, thread_ts: str) -> dict:
-        """Builds a filter for retrieving documents from a private channel.
+        Pages are fetched on demand, so consumers that stop early (for example
+        through itertools.islice) only pay for the pages they actually drained.
+        Weaviate's after-cursor cannot be combined with a where filter, so the
+        pages step by offset instead.
 
         Args:
-            channel_id (str): The ID of the private channel where the bot was mentioned.
-            thread_ts (str): The ID of the thread. This is used to exclude messages in the current thread.
+            where_filter (dict): The where filter to match documents against.
+            page_size (int): The number of documents fetched per round-trip.
 
-        Returns:
-            dict: A filter to be used for document retrieval.
+        Yields:
+            Document: Each document matching the filter.
         """
 
-        return {
-            "operator": "And",
-            "operands": [
-                {
-                    "path": ["thread_ts"],
-                    "operator": "NotEqual",
-                    "valueString": thread_ts,
-                },
-                {
-                    "operator": "Or",
-                    "operands": [
-                        {"path": ["channel_id"], "operator": "Equal", "valueString": channel_id},
-                        {"path": ["channel_type"], "operator": "Equal", "valueString": "channel"},
-                    ],
-                },
-            ],
-        }
-
-    def _build_retrieval_public_where_filter(self, thread_ts: str) -> dict:
-        """Builds a filter for retrieving documents from a public channel.
+        text_key = self.vectorstore._query_attrs[0]
+        offset = 0
+        while True:
+            result = (
+                self.vectorstore._client.query.get(self.vectorstore._index_name, self.vectorstore._query_attrs)
+                .with_where(where_filter)
+                .with_limit(page_size)
+                .with_offset(offset)
+                .do()
+            )
 
-        Args:
-            thread_ts (str): The ID of the thread. This is used to exclude messages in the current thread.
+            entries = result["data"]["Get"][self.vectorstore._index_name] or []
+            for entry in entries:
+                metadata = {key: value for key, value in entry.items() if key != text_key}
+                yield Document(page_content=entry[text_key], metadata=metadata)
 
-        Returns:
-            dict: A filter to be used for document retrieval.
-        """
+            if len(entries) < page_size:
+                return
+            offset += page_size
 
-        return {
-            "operator": "And",
-            "operands": [
-                {"path": ["channel_type"], "operator": "Equal", "valueString": "channel"},
-                {
-                    "path": ["thread_ts"],
-                    "operator": "NotEqual",
-                    "valueString": thread_ts,
-                },
-            ],
-        }
-
-    def _build_url_search_where_filter(self, is_private: bool, channel_id: str, url: str) -> dict:
-        """Builds a filter for URL search based on whether the channel is private or public.
+    def search_urls(self, urls: List[str]) -> Dict[str, str]:
+        """Search for multiple URLs in the Weaviate index with a single query.
+
+        This method builds one multi-get GraphQL document with an aliased Get block per URL,
+        so resolving N URLs costs a single round-trip instead of N.
 
         Args:
-            is_private (bool): True if the channel is private, False otherwise.
-            channel_id (str): The ID of the channel where the bot was mentioned.
-            URL (str): The URL to search for.
+            urls (List[str]): The URLs to search for.
 
         Returns:
-            dict: A filter to be used for document url_search.
+            Dict[str, str]: A mapping from each URL to the content of the first matching document.
         """
 
-        if is_private:
-            return self._build_url_search_private_where_filter(channel_id, url)
-        else:
-            return self._build_url_search_public_where_filter(url)
+        if not urls:
+            return {}
 
-    def _build_url_search_private_where_filter(self, channel_id: str, url: str) -> dict:
-        """Builds a filter for URL search from a private channel.
+        builders = []
+        for index, url in enumerate(urls):
+            where_filter = self._build_url_search_where_filter(url)
+            builders.append(
+                self.vectorstore._client.query.get(self.vectorstore._index_name, self.vectorstore._query_attrs)
+                .with_where(where_filter)
+                .with_limit(1)
+                .with_alias(f"url{index}")
+            )
+        result = self.vectorstore._client.query.multi_get(builders).do()
 
-        Args:
-            channel_id (str): The ID of the private channel where the bot was mentioned.
-            URL (str): The URL to search for.
+        contents = {}
+        for index, url in enumerate(urls):
+            documents = result["data"]["Get"].get(f"url{index}")
+            contents[url] = documents[0]["content"] if documents else "Document is not found."
+        return contents
 
-        Returns:
-            dict: A filter to be used for document URL search.
-        """
+    def _build_url_search_where_filter(self, url: str) -> dict:
+        """Builds a filter for URL search, reusing the prebuilt channel scope clause.
 
-        return {
-            "operator": "And",
-            "operands": [
-                {
-                    "path": ["permalink"],
-                    "operator": "Equal",
-                    "valueString": url,
-                },
-                {
-                    "operator": "Or",
-                    "operands": [
-                        {"path": ["channel_id"], "operator": "Equal", "valueString": channel_id},
-                        {"path": ["channel_type"], "operator": "Equal", "valueString": "channel"},
-                    ],
-                },
-            ],
-        }
-
-    def _build_url_search_public_where_filter(self, url: str) -> dict:
-        """Builds a filter for URL search from a public channel.
+        Only the permalink leaf is allocated per call; the channel scope clause
+        (including the nested Or for private channels) is shared from __init__.
 
         Args:
-            URL (str): The URL to search for.
+            url (str): The URL to search for.
 
         Returns:
             dict: A filter to be used for document URL search.
         """
 
-        return {
-            "operator": "And",
-            "operands": [
-                {"path": ["channel_type"], "operator": "Equal", "valueString": "channel"},
-                {"path": ["permalink"], "operator": "Equal", "valueString": url},
-            ],
-        }
+        permalink_clause = {"path": ["permalink"], "operator": "Equal", "valueString": url}
+        operands = [permalink_clause, self.scope_clause] if self.is_private else [self.scope_clause, permalink_clause]
+        return {"operator": "And", "operands": operands}
@@ -14,6 +14,10 @@ class Settings:
     This ensures that there is a single source of truth for settings throughout the application
     and reduces the risk of errors due to inconsistencies in settings.
 
+    The values are read from the environment once when the instance is created;
+    they never change at runtime, so repeated accesses are plain attribute reads
+    rather than os.environ lookups.
+
     Attributes:
         LOG_LEVEL (str): The logging level for the application (default is "info").
         SLACK_CLIENT_ID (str): The client ID for the Slack application.
@@ -22,50 +26,20 @@ class Settings:
         OPENAI_API_KEY (str): The API key for the OpenAI application.
         POSTGRES_URL (str): The URL for the PostgreSQL database.
         WEAVIATE_URL (str): The URL for the Weaviate service.
-        ENCRYPTION_KEY (bytes): The encryption key for MongoDB.
+        BACKGROUND_WORKERS (int): The size of the background handler thread pool (default is 8).
     """
 
-    @property
-    def LOG_LEVEL(self):
-        """str: The logging level for the application. Default is "info"."""
-
-        return os.environ.get("LOG_LEVEL", "info").upper()
-
-    @property
-    def SLACK_CLIENT_ID(self):
-        """str: The client ID for the Slack application."""
-
-        return os.environ.get("SLACK_CLIENT_ID")
-
-    @property
-    def SLACK_CLIENT_SECRET(self):
-        """str: The client secret for the Slack application."""
-
-        return os.environ.get("SLACK_CLIENT_SECRET")
-
-    @property
-    def SLACK_SIGNING_SECRET(self):
-        """str: The signing secret for the Slack application."""
-
-        return os.environ.get("SLACK_SIGNING_SECRET")
-
-    @property
-    def OPENAI_API_KEY(self):
-        """str: The API key for the OpenAI application."""
-
-        return os.environ.get("OPENAI_API_KEY")
-
-    @property
-    def POSTGRES_URL(self):
-        """str: The URL for the PostgreSQL database."""
-
-        return os.environ.get("POSTGRES_URL")
-
-    @property
-    def WEAVIATE_URL(self):
-        """str: The URL for the Weaviate service."""
-
-        return os.environ.get("WEAVIATE_URL")
+    def __init__(self):
+        """Initializes the Settings with a snapshot of the environment."""
+
+        self.LOG_LEVEL = os.environ.get("LOG_LEVEL", "info").upper()
+        self.SLACK_CLIENT_ID = os.environ.get("SLACK_CLIENT_ID")
+        self.SLACK_CLIENT_SECRET = os.environ.get("SLACK_CLIENT_SECRET")
+        self.SLACK_SIGNING_SECRET = os.environ.get("SLACK_SIGNING_SECRET")
+        self.OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
+        self.POSTGRES_URL = os.environ.get("POSTGRES_URL")
+        self.WEAVIATE_URL = os.environ.get("WEAVIATE_URL")
+        self.BACKGROUND_WORKERS = int(os.environ.get("CHATIQ_WORKERS", "8"))
 
 
 Settings = Settings()
@@ -1,8 +1,23 @@
+from functools import lru_cache
 from typing import Optional
 
 import tiktoken
 
 
+@lru_cache(maxsize=None)
+def _get_encoding(model: str) -> "tiktoken.Encoding":
+    """Returns the tiktoken encoding for a model, shared across instances.
+
+    Args:
+        model (str): The name of the model used for tokenization.
+
+    Returns:
+        tiktoken.Encoding: The encoding for the model.
+    """
+
+    return tiktoken.encoding_for_model(model)
+
+
 class TextProcessor:
     """A class that processes text based on a specific language model.
 
@@ -37,6 +52,7 @@ class TextProcessor:
         if model not in self.MODEL_TO_TOKEN_LENGTH:
             raise KeyError(f"The model '{model}' is not supported.")
         self.model = model
+        self.encoding = _get_encoding(model)
 
     @classmethod
     def get_token_length_for_model(cls, model: str) -> int:
@@ -68,13 +84,18 @@ class TextProcessor:
             str: The truncated text.
         """
 
-        encoding = tiktoken.encoding_for_model(self.model)
-        tokens = encoding.encode(text)
         if length is None:
             length = self.get_token_length_for_model(self.model)
 
-        truncated_text = encoding.decode(tokens[: length - 1])
-        if len(truncated_text) == len(text):
+        # Every BPE token encodes at least one byte, so a text whose UTF-8
+        # byte length is within the limit can never exceed it; most messages
+        # take this path and skip tokenization entirely.
+        if len(text.encode("utf-8")) <= length:
+            return text
+
+        tokens = self.encoding.encode(text)
+        if len(tokens) <= length:
             return text
 
+        truncated_text = self.encoding.decode(tokens[: length - 1])
         return f"{truncated_text}..."
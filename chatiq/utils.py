@@ -1,13 +1,31 @@
-import json
 import re
-from datetime import datetime
-from typing import Any, List, Optional
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional
+from zoneinfo import ZoneInfo, available_timezones
 
-from dateutil.tz import tzoffset
+import orjson
 from langchain.docstore.document import Document
-from pytz import UTC, common_timezones, timezone
 
-JSON_INDENT_LEVEL = 4
+# Lookahead-guarded character classes instead of a lazy ".*?": the capture
+# advances line by line and stops at the next emoji-prefixed line without
+# backtracking, so non-matching input stays linear.
+_EMOJI_RE_TEMPLATE = r"(?:^|\n){}([^\n]*(?:\n(?!:[^\s:]+:)[^\n]*)*)"
+
+
+@lru_cache(maxsize=64)
+def _compile_emoji_regex(emoji_pattern: str) -> "re.Pattern[str]":
+    """Compiles the extraction regex for an emoji pattern, memoized per pattern.
+
+    Args:
+        emoji_pattern (str): The emoji pattern to look for.
+
+    Returns:
+        re.Pattern[str]: The compiled regex for the emoji pattern.
+    """
+
+    return re.compile(_EMOJI_RE_TEMPLATE.format(emoji_pattern))
 
 
 def extract_emoji_text(text: str, emoji_pattern: str) -> Optional[str]:
@@ -21,14 +39,17 @@ def extract_emoji_text(text: str, emoji_pattern: str) -> Optional[str]:
         Optional[str]: The text associated with the emoji.
     """
 
-    next_emoji_pattern = r":[^\s:]+:"
-    emoji_regex = rf"(?:^|\n){emoji_pattern}(.*?)(?=\n{next_emoji_pattern}|$)"
-    extracted_texts = re.findall(emoji_regex, text, re.DOTALL)
+    # Most topics and descriptions contain no emoji token at all; a C-level
+    # substring check skips the regex scan entirely for those.
+    if emoji_pattern not in text:
+        return None
+
+    match = _compile_emoji_regex(emoji_pattern).search(text)
 
-    if not extracted_texts:
+    if not match:
         return None
 
-    return extracted_texts[0].strip()
+    return match.group(1).strip()
 
 
 def format_mention(user_id: str) -> str:
@@ -50,26 +71,30 @@ def format_mention(user_id: str) -> str:
     return f"<@{user_id}>"
 
 
+@lru_cache(maxsize=1)
 def get_timezone_offsets() -> List[str]:
-    """Returns a sorted list of unique timezone offsets from pytz common timezones.
+    """Returns a sorted list of unique timezone offsets from the system timezone database.
+
+    The result is cached; scanning all available timezones is pure overhead
+    after the first call since the set of half/whole-hour offsets is stable.
 
     Returns:
         List[str]: A sorted list of unique timezone offsets.
     """
 
+    now_utc = datetime.now(ZoneInfo("UTC"))
+
     offset_minutes_set = set()
-    for tz in common_timezones:
-        tzinfo = timezone(tz)
-        now_tz = datetime.utcnow().replace(tzinfo=UTC).astimezone(tzinfo)
+    for tz in available_timezones():
+        tzinfo = ZoneInfo(tz)
+        now_tz = now_utc.astimezone(tzinfo)
         utcoffset = now_tz.utcoffset()
         if utcoffset is None:
             raise ValueError(f"Unexpected None value from utcoffset for timezone: {tz}")
 
-        offset_seconds = utcoffset.total_seconds()
-        offset_minutes, _ = divmod(offset_seconds, 60)
-        offset_minutes_set.add(offset_minutes)
+        offset_minutes_set.add(int(utcoffset.total_seconds()) // 60)
 
-    sorted_offset_minutes = sorted(list(offset_minutes_set))
+    sorted_offset_minutes = sorted(offset_minutes_set)
 
     offsets = []
     for offset_minutes in sorted_offset_minutes:
@@ -81,25 +106,22 @@ def get_timezone_offsets() -> List[str]:
             offset_hours += 1
             offset_minutes = 60 - offset_minutes
 
-        offset = f"{int(offset_hours):+03}:{int(offset_minutes):02}"
-        offsets.append(offset)
+        offsets.append(f"{offset_hours:+03}:{offset_minutes:02}")
 
     return offsets
 
 
-def get_emoji_from_timezone_offset(timezone_offset: str) -> str:
-    """Returns an emoji associated with the given timezone offset.
+def _compute_emoji_from_timezone_offset(offset_hours: int, offset_minutes: int) -> str:
+    """Computes the clock emoji for a timezone offset expressed in hours and minutes.
 
     Args:
-        timezone_offset (str): The timezone offset in "+HH:MM" or "-HH:MM" format.
+        offset_hours (int): The hour part of the timezone offset.
+        offset_minutes (int): The minute part of the timezone offset.
 
     Returns:
         str: The associated emoji in unicode.
     """
 
-    offset_parts = timezone_offset.split(":")
-    offset_hours, offset_minutes = map(int, offset_parts)
-
     if offset_hours < 0 and offset_minutes == 30:
         offset_hours -= 1
 
@@ -111,6 +133,31 @@ def get_emoji_from_timezone_offset(timezone_offset: str) -> str:
         return f":clock{emoji_hours if emoji_hours != 0 else 12}:"
 
 
+# Every whole and half-hour offset from -12:00 to +14:00, computed once so
+# lookups are a single dict access.
+_OFFSET_TO_EMOJI = {
+    f"{offset_hours:+03}:{offset_minutes:02}": _compute_emoji_from_timezone_offset(offset_hours, offset_minutes)
+    for offset_hours in range(-12, 15)
+    for offset_minutes in (0, 30)
+}
+
+
+def get_emoji_from_timezone_offset(timezone_offset: str) -> str:
+    """Returns an emoji associated with the given timezone offset.
+
+    Args:
+        timezone_offset (str): The timezone offset in "+HH:MM" or "-HH:MM" format.
+
+    Returns:
+        str: The associated emoji in unicode.
+
+    Raises:
+        KeyError: If the timezone offset is not a whole or half-hour offset.
+    """
+
+    return _OFFSET_TO_EMOJI[timezone_offset]
+
+
 def utc_to_local(utc_datetime: datetime, timezone_offset: str) -> datetime:
     """Convert a UTC datetime to a local datetime based on a timezone offset.
 
@@ -122,19 +169,106 @@ def utc_to_local(utc_datetime: datetime, timezone_offset: str) -> datetime:
         datetime: The converted local datetime object.
     """
 
+    return utc_datetime.astimezone(_timezone_for_offset(timezone_offset))
+
+
+@lru_cache(maxsize=64)
+def _timezone_for_offset(timezone_offset: str) -> timezone:
+    """Returns the fixed-offset timezone for an offset string, memoized per offset.
+
+    Args:
+        timezone_offset (str): The timezone offset string in format '+HH:MM' or '-HH:MM'.
+
+    Returns:
+        timezone: The fixed-offset timezone.
+    """
+
     offset_hours, offset_minutes = map(int, timezone_offset.split(":"))
-    offset = tzoffset(None, offset_hours * 3600 + offset_minutes * 60)
+    return timezone(timedelta(hours=offset_hours, minutes=offset_minutes))
+
+
+JSON_CACHE_SIZE = 4096
+
+# Serialized JSON for recently seen payloads; loaders re-serialize the same
+# metadata envelope for every chunk of a file, so repeats are common.
+_json_cache: dict = {}
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively converts an object into a hashable cache key.
+
+    Args:
+        obj (Any): The object to freeze.
+
+    Returns:
+        Any: A hashable representation with dicts as sorted item tuples
+            and lists as tuples.
+    """
+
+    if isinstance(obj, dict):
+        return tuple(sorted((key, _freeze(value)) for key, value in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+
+def _cached_dumps(obj: Any, option: int) -> str:
+    """Serializes an object with orjson, memoizing results per payload.
+
+    Args:
+        obj (Any): The object to serialize.
+        option (int): The orjson option flags.
+
+    Returns:
+        str: The serialized JSON string.
+    """
+
+    try:
+        key = (option, _freeze(obj))
+    except TypeError:
+        return orjson.dumps(obj, option=option).decode()
+
+    cached = _json_cache.get(key)
+    if cached is None:
+        if len(_json_cache) >= JSON_CACHE_SIZE:
+            _json_cache.clear()
+        cached = orjson.dumps(obj, option=option).decode()
+        _json_cache[key] = cached
+    return cached
+
+
+@lru_cache(maxsize=8192)
+def format_slack_timestamp(epoch_seconds: int) -> str:
+    """Formats an epoch timestamp as an ISO 8601 UTC string, memoized per second.
 
-    return utc_datetime.astimezone(offset)
+    Slack event timestamps have second granularity and every chunk of a file
+    shares the same event_time, so repeats dominate and the cached string is
+    reused instead of rebuilding a datetime per document.
+
+    Args:
+        epoch_seconds (int): The epoch timestamp in seconds.
+
+    Returns:
+        str: The ISO 8601 formatted timestamp.
+
+    Raises:
+        ValueError: If the timestamp cannot be converted to a date.
+    """
+
+    try:
+        tm = time.gmtime(epoch_seconds)
+    except (OSError, OverflowError) as e:
+        raise ValueError(str(e))
+    return "%04d-%02d-%02dT%02d:%02d:%02d+00:00" % (tm.tm_year, tm.tm_mon, tm.tm_mday, tm.tm_hour, tm.tm_min, tm.tm_sec)
 
 
 def pretty_json_dumps(obj: Any) -> str:
     """Convert an object to a JSON string with indentation for better readability.
 
-    This function is a wrapper around json.dumps, and it is specifically designed
+    This function is a wrapper around orjson.dumps, and it is specifically designed
     for converting objects containing slack message data to JSON strings. The output
-    JSON strings have an indentation level of 4 for readability, and it does not
-    ensure ASCII encoding to maintain non-Latin characters in the original form.
+    JSON strings are indented for readability, and non-Latin characters are kept in
+    their original form since orjson serializes UTF-8 natively.
 
     Args:
         obj (Any): The Python object to be converted into a JSON string. This is
@@ -145,7 +279,27 @@ def pretty_json_dumps(obj: Any) -> str:
         str: A JSON string representing the input object.
     """
 
-    return json.dumps(obj, indent=JSON_INDENT_LEVEL, ensure_ascii=False)
+    return _cached_dumps(obj, orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+
+def compact_json_dumps(obj: Any) -> str:
+    """Convert an object to a compact JSON string without indentation.
+
+    This function is the storage-oriented counterpart of pretty_json_dumps.
+    Documents persisted to the vectorstore do not need to be human-readable,
+    and dropping the indentation shrinks the stored object size, which keeps
+    more objects resident in Weaviate's vector cache.
+
+    Args:
+        obj (Any): The Python object to be converted into a JSON string. This is
+            typically a dictionary containing slack message data and other related
+            metadata.
+
+    Returns:
+        str: A compact JSON string representing the input object.
+    """
+
+    return _cached_dumps(obj, orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
 
 
 def subtract_documents(documents: List[Document], previous_documents: List[Document]) -> List[Document]:
@@ -161,4 +315,38 @@ def subtract_documents(documents: List[Document], previous_documents: List[Docum
         List[Document]: A list of documents that are present in the `documents` but not in the `previous_documents`.
     """
 
-    return [doc for doc in documents if doc not in previous_documents]
+    return list(subtract_documents_iter(documents, previous_documents))
+
+
+def subtract_documents_iter(documents: List[Document], previous_documents: List[Document]) -> Iterator[Document]:
+    """Lazily subtracts two lists of documents.
+
+    This is the streaming form of `subtract_documents`; it yields documents from the
+    `documents` that are not present in the `previous_documents` without allocating a
+    second list, for consumers that only iterate the result once.
+
+    Args:
+        documents (List[Document]): A list of current documents.
+        previous_documents (List[Document]): A list of previous documents.
+
+    Yields:
+        Document: Each document that is present in the `documents` but not in the `previous_documents`.
+    """
+
+    previous_keys = {_document_key(document) for document in previous_documents}
+    for document in documents:
+        if _document_key(document) not in previous_keys:
+            yield document
+
+
+def _document_key(document: Document) -> tuple:
+    """Builds a hashable identity key for a document.
+
+    Args:
+        document (Document): The document to build the key for.
+
+    Returns:
+        tuple: A tuple of the page content and the sorted metadata items.
+    """
+
+    return (document.page_content, tuple(sorted(document.metadata.items())))
@@ -1,14 +1,84 @@
 import logging
-from typing import Any, List
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, wraps
+from typing import Any, Iterable, List, Optional, Union
 
 from langchain.docstore.document import Document
 from langchain.vectorstores import Weaviate
 from weaviate import Client
 from weaviate.exceptions import WeaviateBaseError
 
+from chatiq import metrics
 from chatiq.document_loaders import DummyMessageLoader
 from chatiq.retriever import Retriever
 
+VECTORSTORE_CACHE_SIZE = 256
+
+# Namespace for deterministic document UUIDs, so Slack's at-least-once event
+# delivery results in idempotent upserts instead of duplicate objects.
+NAMESPACE_DOCUMENT = uuid.UUID("4ee57f0e-6220-59e0-baad-74204bc93786")
+
+
+def _weaviate_op(failure_message: str):
+    """Wraps a Vectorstore method so failures are logged and raised as WeaviateBaseError.
+
+    Args:
+        failure_message (str): The error message template, formatted with the method's
+            positional arguments and `self`.
+
+    Returns:
+        Callable: The decorator applying the error handling.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                with metrics.time_operation("chatiq_weaviate_op_duration_seconds", op=method.__name__):
+                    result = method(self, *args, **kwargs)
+            except Exception as e:
+                metrics.increment("chatiq_weaviate_ops_total", op=method.__name__, status="error")
+                error_message = f"{failure_message.format(*args, self=self)}. Error: {e}"
+                self.logger.error(error_message)
+                raise WeaviateBaseError(error_message)
+            metrics.increment("chatiq_weaviate_ops_total", op=method.__name__, status="success")
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+_vectorstore_cache: dict = {}
+
+
+def get_vectorstore(weaviate_client: Client, team_id: str) -> "Vectorstore":
+    """Returns a shared Vectorstore for a team, constructing one on first use.
+
+    Vectorstore construction allocates the langchain Weaviate wrapper and
+    reconfigures client batching; callers on the event hot path should go
+    through this factory so repeated events for the same team reuse one
+    instance per process.
+
+    Args:
+        weaviate_client (Client): A client instance for interacting with the Weaviate server.
+        team_id (str): The Slack team ID.
+
+    Returns:
+        Vectorstore: The shared Vectorstore for the team.
+    """
+
+    key = (id(weaviate_client), team_id)
+    vectorstore = _vectorstore_cache.get(key)
+    if vectorstore is None:
+        if len(_vectorstore_cache) >= VECTORSTORE_CACHE_SIZE:
+            _vectorstore_cache.clear()
+        vectorstore = Vectorstore(weaviate_client, team_id)
+        _vectorstore_cache[key] = vectorstore
+    return vectorstore
+
 
 class Vectorstore:
     """Manages interaction with Weaviate indexes for storing, retrieving, and removing Slack messages.
@@ -28,7 +98,24 @@ class Vectorstore:
     """
 
     INDEX_KEY = "content"
-    ATTRIBUTES = [
+    BATCH_SIZE = 100
+    BATCH_NUM_WORKERS = 4
+    BATCH_CONNECTION_ERROR_RETRIES = 3
+    DELETE_CHUNK_SIZE = 100
+    RETRIEVER_CACHE_SIZE = 128
+    WARMUP_PHRASES = (
+        "what did we decide in this channel",
+        "summarize the latest discussion",
+        "who is working on the deployment",
+        "when is the next release",
+        "share the link to the document",
+        "what was the error message",
+        "how do I set up the project",
+        "any updates on the incident",
+        "what are the action items",
+        "remind me of the meeting notes",
+    )
+    ATTRIBUTES = (
         "file_or_attachment_id",
         "content_type",
         "channel_type",
@@ -37,12 +124,28 @@ class Vectorstore:
         "ts",
         "permalink",
         "timestamp",
-    ]
+    )
     CLASS_SCHEMA = {
         "class": "<class to be updated>",
         "description": "<description to be updated>",
         "vectorizer": "text2vec-transformers",
         "moduleConfig": {"text2vec-transformers": {"poolingStrategy": "masked_mean", "vectorizeClassName": False}},
+        # Tuned for a high-write, recall-tolerant message index: moderate graph
+        # connectivity keeps inserts cheap while dynamic ef bounds the search cost.
+        # Filter-only properties carry a roaring-bitmap filterable index and skip
+        # the searchable BM25 index, since the where clauses in the Retriever are
+        # applied in the same Get query as the vector search.
+        "vectorIndexConfig": {
+            "ef": 64,
+            "efConstruction": 128,
+            "maxConnections": 16,
+            "vectorCacheMaxObjects": 1000000,
+            "dynamicEfMin": 100,
+            "dynamicEfMax": 500,
+            "dynamicEfFactor": 8,
+            "skip": False,
+            "cleanupIntervalSeconds": 300,
+        },
         "properties": [
             {
                 "dataType": ["text"],
@@ -53,6 +156,8 @@ class Vectorstore:
             {
                 "dataType": ["string"],
                 "description": "The file or attachment ID",
+                "indexFilterable": True,
+                "indexSearchable": False,
                 "name": "file_or_attachment_id",
             },
             {
@@ -63,26 +168,36 @@ class Vectorstore:
             {
                 "dataType": ["string"],
                 "description": "The channel type",
+                "indexFilterable": True,
+                "indexSearchable": False,
                 "name": "channel_type",
             },
             {
                 "dataType": ["string"],
                 "description": "The channel ID",
+                "indexFilterable": True,
+                "indexSearchable": False,
                 "name": "channel_id",
             },
             {
                 "dataType": ["string"],
                 "description": "The message ID",
+                "indexFilterable": True,
+                "indexSearchable": False,
                 "name": "ts",
             },
             {
                 "dataType": ["string"],
                 "description": "The thread ID",
+                "indexFilterable": True,
+                "indexSearchable": False,
                 "name": "thread_ts",
             },
             {
                 "dataType": ["string"],
                 "description": "The permalink",
+                "indexFilterable": True,
+                "indexSearchable": False,
                 "name": "permalink",
             },
             {
@@ -105,7 +220,32 @@ class Vectorstore:
         self.weaviate_client = weaviate_client
         self.team_id = team_id
         self.index_name = f"Message{self.team_id}"
+        # Dynamic server-side batching: imports are flushed in batches sized by
+        # server backpressure (starting from BATCH_SIZE) and sent by a small
+        # worker pool instead of one request per object.
+        self.weaviate_client.batch.configure(
+            batch_size=self.BATCH_SIZE,
+            dynamic=True,
+            num_workers=self.BATCH_NUM_WORKERS,
+            connection_error_retries=self.BATCH_CONNECTION_ERROR_RETRIES,
+            callback=self._on_batch_result,
+        )
         self.weaviate = Weaviate(self.weaviate_client, self.index_name, self.INDEX_KEY, None, self.ATTRIBUTES)
+        self._retrievers: dict = {}
+        self._pending_seed: Optional[threading.Thread] = None
+        self._index_ensured = False
+
+    def _on_batch_result(self, results: Optional[List[dict]]) -> None:
+        """Logs errors reported for individual objects in a flushed batch.
+
+        Args:
+            results (Optional[List[dict]]): The batch results returned by Weaviate.
+        """
+
+        for result in results or []:
+            errors = result.get("result", {}).get("errors")
+            if errors:
+                self.logger.error("Failed to import object into %s index for Weaviate. Error: %s", self.index_name, errors)
 
     def add_documents(self, documents: List[Document], **kwargs: Any) -> List[str]:
         """Adds a list of documents to the Weaviate index associated with the team.
@@ -117,101 +257,168 @@ class Vectorstore:
             List[str]: A list of document IDs for the documents that were added.
         """
 
-        self.logger.debug(f"Adding {len(documents)} documents to {self.index_name} index for Weaviate")
+        if not documents:
+            return []
 
-        return self.weaviate.add_documents(documents, **kwargs)
+        self.logger.debug("Adding %d documents to %s index for Weaviate", len(documents), self.index_name)
 
-    def delete_message(self, ts: str) -> None:
-        """Deletes a message from the Weaviate class (index) associated with the team.
+        uuids = kwargs.get("uuids") or [self._document_uuid(document) for document in documents]
+
+        # Write directly through the client batch instead of the langchain
+        # wrapper; the read path keeps the wrapper since the Retriever needs it.
+        with metrics.time_operation("chatiq_weaviate_op_duration_seconds", op="add_documents"):
+            with self.weaviate_client.batch as batch:
+                for document, document_uuid in zip(documents, uuids):
+                    properties = {self.INDEX_KEY: document.page_content, **document.metadata}
+                    batch.add_data_object(properties, self.index_name, uuid=document_uuid)
+        metrics.increment("chatiq_weaviate_ops_total", op="add_documents", status="success")
+        return [str(document_uuid) for document_uuid in uuids]
+
+    def _document_uuid(self, document: Document) -> uuid.UUID:
+        """Derives a deterministic UUID for a document.
+
+        The identity covers the team, message, file or attachment and content, so
+        redelivered events map to the same object while distinct pages of one
+        file stay distinct.
 
         Args:
-            ts (str): The ID of the message to be deleted from the index.
+            document (Document): The document to derive the UUID for.
 
-        Raises:
-            WeaviateBaseError: If there is any error while deleting the document.
+        Returns:
+            uuid.UUID: The deterministic UUID for the document.
         """
 
-        self.logger.debug(f"Deleteing message from {self.index_name} index for Weaviate")
+        metadata = document.metadata
+        identity = ":".join(
+            (self.team_id, metadata.get("ts", ""), metadata.get("file_or_attachment_id", ""), document.page_content)
+        )
+        return uuid.uuid5(NAMESPACE_DOCUMENT, identity)
 
-        try:
-            with self.weaviate_client.batch as batch:
-                batch.delete_objects(
-                    class_name=self.index_name,
-                    where={"path": ["ts"], "operator": "Equal", "valueString": ts},
-                )
-        except Exception as e:
-            error_message = f"Failed to delete message from {self.index_name} index for Weaviate. Error: {e}"
-            self.logger.error(error_message)
-            raise WeaviateBaseError(error_message)
+    def delete_message(self, ts: Union[str, Iterable[str]]) -> None:
+        """Deletes one or more messages from the Weaviate class (index) associated with the team.
 
-        self.logger.info(f"Deleted message from {self.index_name} index for Weaviate")
+        Args:
+            ts (Union[str, Iterable[str]]): The ID or IDs of the messages to be deleted from the index.
 
-    def delete_file_or_attachment(self, file_or_attachment_id: str) -> None:
-        """Deletes a file or attachment from the Weaviate class (index) associated with the team.
+        Raises:
+            WeaviateBaseError: If there is any error while deleting the documents.
+        """
+
+        self._delete("message", "ts", ts)
+
+    def delete_file_or_attachment(self, file_or_attachment_id: Union[str, Iterable[str]]) -> None:
+        """Deletes one or more files or attachments from the Weaviate class (index) associated with the team.
 
         Args:
-            file_or_attachment_id (str): The ID of the file or attachment to be deleted from the index.
+            file_or_attachment_id (Union[str, Iterable[str]]): The ID or IDs of the files or attachments
+                to be deleted from the index.
 
         Raises:
-            WeaviateBaseError: If there is any error while deleting the document.
+            WeaviateBaseError: If there is any error while deleting the documents.
         """
 
-        self.logger.debug(f"Deleteing file or attachment from {self.index_name} index for Weaviate")
+        self._delete("file or attachment", "file_or_attachment_id", file_or_attachment_id)
 
-        try:
-            with self.weaviate_client.batch as batch:
-                batch.delete_objects(
-                    class_name=self.index_name,
-                    where={"path": ["file_or_attachment_id"], "operator": "Equal", "valueString": file_or_attachment_id},
-                )
-        except Exception as e:
-            error_message = f"Failed to delete file or attachment from {self.index_name} index for Weaviate. Error: {e}"
-            self.logger.error(error_message)
-            raise WeaviateBaseError(error_message)
+    def delete_channel(self, channel_id: Union[str, Iterable[str]]) -> None:
+        """Deletes one or more channels from the Weaviate class (index) associated with the team.
+
+        Args:
+            channel_id (Union[str, Iterable[str]]): The ID or IDs of the channels to be deleted from the index.
+
+        Raises:
+            WeaviateBaseError: If there is any error while deleting the documents.
+        """
 
-        self.logger.info(f"Deleted file or attachment from {self.index_name} index for Weaviate")
+        self._delete("channel", "channel_id", channel_id)
 
-    def delete_channel(self, channel_id: str) -> None:
-        """Deletes a channel from the Weaviate class (index) associated with the team.
+    @_weaviate_op("Failed to delete {0} from {self.index_name} index for Weaviate")
+    def _delete(self, noun: str, field: str, values: Union[str, Iterable[str]]) -> None:
+        """Deletes objects matching a field from the index, with logging and error wrapping.
 
         Args:
-            channel_id (str): The ID of the channel to be deleted from the index.
+            noun (str): The kind of object being deleted, used in log messages.
+            field (str): The schema property to match on.
+            values (Union[str, Iterable[str]]): The value or values to delete.
 
         Raises:
-            WeaviateBaseError: If there is any error while deleting the document.
+            WeaviateBaseError: If there is any error while deleting the documents.
         """
 
-        self.logger.debug(f"Deleteing channel from {self.index_name} index for Weaviate")
+        self.logger.debug("Deleting %s from %s index for Weaviate", noun, self.index_name)
+        self._delete_by(field, values)
+        self.logger.info("Deleted %s from %s index for Weaviate", noun, self.index_name)
 
-        try:
-            with self.weaviate_client.batch as batch:
-                batch.delete_objects(
-                    class_name=self.index_name,
-                    where={"path": ["channel_id"], "operator": "Equal", "valueString": channel_id},
-                )
-        except Exception as e:
-            error_message = f"Failed to delete channel from {self.index_name} index for Weaviate. Error: {e}"
-            self.logger.error(error_message)
-            raise WeaviateBaseError(error_message)
+    def _delete_by(self, field: str, values: Union[str, Iterable[str]]) -> None:
+        """Deletes all objects whose field matches any of the values in a single batch.
+
+        Values are coalesced into Or-of-Equal filters chunked to DELETE_CHUNK_SIZE per
+        delete_objects call, so bulk deletes cost one round-trip per chunk instead of
+        one per value.
+
+        Args:
+            field (str): The schema property to match on.
+            values (Union[str, Iterable[str]]): The value or values to delete.
+        """
 
-        self.logger.info(f"Deleted channel from {self.index_name} index for Weaviate")
+        if isinstance(values, str):
+            values = [values]
+        else:
+            values = list(values)
+        if not values:
+            return
 
-    def as_retriever(self, is_private: bool, channel_id: str, thread_ts: str) -> Retriever:
+        with self.weaviate_client.batch as batch:
+            for start in range(0, len(values), self.DELETE_CHUNK_SIZE):
+                end = start + self.DELETE_CHUNK_SIZE
+                chunk = values[start:end]
+                batch.delete_objects(class_name=self.index_name, where=self._build_delete_where(field, chunk))
+
+    @staticmethod
+    def _build_delete_where(field: str, values: List[str]) -> dict:
+        """Builds the where filter matching a field against one or more values.
+
+        Args:
+            field (str): The schema property to match on.
+            values (List[str]): The values to match.
+
+        Returns:
+            dict: The where filter for the delete.
+        """
+
+        if len(values) == 1:
+            return {"path": [field], "operator": "Equal", "valueString": values[0]}
+        return {
+            "operator": "Or",
+            "operands": [{"path": [field], "operator": "Equal", "valueString": value} for value in values],
+        }
+
+    def as_retriever(self, is_private: bool, channel_id: str, thread_ts: str, check_cache: bool = True) -> Retriever:
         """Returns a retriever for fetching documents from the Weaviate index based on certain conditions.
 
         The conditions for retrieval vary based on whether the channel is private or public.
+        Repeat queries in the same channel and thread are served from the retriever's
+        short-lived result cache unless check_cache is False.
 
         Args:
             is_private (bool): True if the channel is private, False otherwise.
             channel_id (str): The ID of the channel where the bot was mentioned.
             thread_ts (str): The ID of the thread. This is used to exclude messages in the current thread.
+            check_cache (bool): False to bypass the query result cache, e.g. for sensitive threads.
 
         Returns:
             Retriever: A retriever object for fetching documents from the index.
         """
 
-        return Retriever(self.weaviate, is_private, channel_id, thread_ts)
+        key = (is_private, channel_id, thread_ts, check_cache)
+        retriever = self._retrievers.get(key)
+        if retriever is None:
+            if len(self._retrievers) >= self.RETRIEVER_CACHE_SIZE:
+                self._retrievers.clear()
+            retriever = Retriever(self.weaviate, is_private, channel_id, thread_ts, check_cache=check_cache)
+            self._retrievers[key] = retriever
+        return retriever
 
+    @_weaviate_op("Failed to ensure {self.index_name} index from Weaviate")
     def ensure_index(self):
         """Ensures that the Weaviate class (index) for the team exists.
 
@@ -221,40 +428,171 @@ class Vectorstore:
             WeaviateBaseError: If there is any error while checking or creating the index.
         """
 
-        self.logger.debug(f"Ensuring {self.index_name} index for Weaviate")
+        # Instances are shared per team via get_vectorstore, so after the first
+        # successful check the schema round-trip is skipped entirely. A racing
+        # duplicate check before the flag flips is harmless.
+        if self._index_ensured:
+            return
+
+        self.logger.debug("Ensuring %s index for Weaviate", self.index_name)
+
+        if not self.weaviate_client.schema.exists(self.index_name):
+            self.weaviate_client.schema.create({"classes": [self._schema_for(self.index_name, self.team_id)]})
+
+            # Seed in the background so the install callback does not wait on
+            # the dummy-document upload and its embedding round-trip.
+            self._pending_seed = threading.Thread(target=self._seed_index, daemon=True)
+            self._pending_seed.start()
+            self.logger.info("Created %s index for Weaviate", self.index_name)
+
+        self._index_ensured = True
+
+    INDEX_WORKERS = 8
+
+    @classmethod
+    def ensure_indexes(cls, weaviate_client: Client, team_ids: Iterable[str], workers: int = INDEX_WORKERS) -> None:
+        """Ensures the indexes for multiple teams concurrently.
+
+        Each team's ensure_index blocks on HTTP, so the teams are fanned out over
+        a thread pool; the shared client is thread-safe and connection-pooled.
+
+        Args:
+            weaviate_client (Client): A client instance for interacting with the Weaviate server.
+            team_ids (Iterable[str]): The Slack team IDs to ensure indexes for.
+            workers (int): The maximum number of concurrent index operations.
+
+        Raises:
+            WeaviateBaseError: If ensuring the index failed for any team.
+        """
+
+        cls._run_index_operation("ensure_index", weaviate_client, team_ids, workers)
+
+    @classmethod
+    def delete_indexes(cls, weaviate_client: Client, team_ids: Iterable[str], workers: int = INDEX_WORKERS) -> None:
+        """Deletes the indexes for multiple teams concurrently.
+
+        Args:
+            weaviate_client (Client): A client instance for interacting with the Weaviate server.
+            team_ids (Iterable[str]): The Slack team IDs to delete indexes for.
+            workers (int): The maximum number of concurrent index operations.
+
+        Raises:
+            WeaviateBaseError: If deleting the index failed for any team.
+        """
+
+        cls._run_index_operation("delete_index", weaviate_client, team_ids, workers)
+
+    @classmethod
+    def _run_index_operation(cls, operation: str, weaviate_client: Client, team_ids: Iterable[str], workers: int) -> None:
+        """Runs an index operation for multiple teams on a thread pool.
+
+        Team IDs are deduplicated so no two workers touch the same class
+        concurrently.
+
+        Args:
+            operation (str): The name of the Vectorstore method to run per team.
+            weaviate_client (Client): A client instance for interacting with the Weaviate server.
+            team_ids (Iterable[str]): The Slack team IDs to operate on.
+            workers (int): The maximum number of concurrent index operations.
+
+        Raises:
+            WeaviateBaseError: If the operation failed for any team.
+        """
+
+        team_ids = list(dict.fromkeys(team_ids))
+        if not team_ids:
+            return
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(getattr(get_vectorstore(weaviate_client, team_id), operation)): team_id
+                for team_id in team_ids
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(f"{futures[future]}: {e}")
+
+        if errors:
+            raise WeaviateBaseError(f"Failed to {operation} for teams: {'; '.join(errors)}")
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _schema_for(cls, index_name: str, team_id: str) -> dict:
+        """Returns the rendered class schema for a team, built once per team.
+
+        The schema body is only ever JSON-serialized by schema.create, so the
+        static inner property lists are shared rather than copied.
+
+        Args:
+            index_name (str): The name of the Weaviate class (index) for the team.
+            team_id (str): The Slack team ID.
+
+        Returns:
+            dict: The rendered class schema.
+        """
+
+        return {
+            **cls.CLASS_SCHEMA,
+            "class": index_name,
+            "description": f"A Slack message index for {team_id}",
+        }
+
+    def _seed_index(self) -> None:
+        """Inserts the dummy documents into a freshly created index.
+
+        LangChain throws an index out of range error when the vectorstore has no
+        document to query against, so every new index is seeded with dummy
+        documents. Errors are logged rather than raised since this runs on a
+        background thread.
+        """
+
+        try:
+            self.add_documents(DummyMessageLoader().load())
+        except Exception as e:
+            self.logger.error("Failed to seed %s index for Weaviate. Error: %s", self.index_name, e)
+            return
+
+        self._warm_index()
+
+    def _warm_index(self) -> None:
+        """Issues cheap warm-up queries against a freshly created index.
+
+        Cold indexes pay a first-query cliff while HNSW structures and the
+        transformers module warm up, so a canned set of common Slack phrases is
+        queried once in the background. Errors are logged rather than raised
+        since this runs on a background thread.
+        """
 
         try:
-            if not self.weaviate_client.schema.exists(self.index_name):
-                class_schema = {
-                    **self.CLASS_SCHEMA,
-                    "class": self.index_name,
-                    "description": f"A Slack message index for {self.team_id}",
-                }
-                self.weaviate_client.schema.create({"classes": [class_schema]})
-
-                # LangChain throws index out of range error when vectorstore has no document to query against.
-                # Add dummy documents to workaround the issue
-                self.weaviate.add_documents(DummyMessageLoader().load())
-                self.logger.info(f"Created {self.index_name} index for Weaviate")
+            for phrase in self.WARMUP_PHRASES:
+                self.weaviate_client.query.get(self.index_name, ["ts"]).with_near_text({"concepts": [phrase]}).with_limit(
+                    1
+                ).do()
         except Exception as e:
-            error_message = f"Failed to ensure {self.index_name} index from Weaviate. Error: {e}"
-            self.logger.error(error_message)
-            raise WeaviateBaseError(error_message)
+            self.logger.error("Failed to warm up %s index for Weaviate. Error: %s", self.index_name, e)
 
+    @_weaviate_op("Failed to remove {self.index_name} index from Weaviate")
     def delete_index(self):
         """Deletes the Weaviate class (index) associated with the team.
 
+        Waits for any pending index seeding to finish first, so a delete racing a
+        fresh install cannot leave seeded documents behind.
+
         Raises:
             WeaviateBaseError: If there is any error while deleting the index.
         """
 
-        self.logger.debug(f"Removing {self.index_name} index from Weaviate")
+        self.logger.debug("Removing %s index from Weaviate", self.index_name)
 
-        try:
-            if self.weaviate_client.schema.exists(self.index_name):
-                self.weaviate_client.schema.delete_class(self.index_name)
-                self.logger.info(f"Removed {self.index_name} index from Weaviate")
-        except Exception as e:
-            error_message = f"Failed to remove {self.index_name} index from Weaviate. Error: {e}"
-            self.logger.error(error_message)
-            raise WeaviateBaseError(error_message)
+        self._index_ensured = False
+
+        if self._pending_seed is not None:
+            self._pending_seed.join()
+            self._pending_seed = None
+
+        if self.weaviate_client.schema.exists(self.index_name):
+            self.weaviate_client.schema.delete_class(self.index_name)
+            self.logger.info("Removed %s index from Weaviate", self.index_name)
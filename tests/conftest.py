@@ -0,0 +1,39 @@
+from functools import lru_cache
+from typing import Any, Tuple
+from unittest.mock import MagicMock
+
+
+@lru_cache(maxsize=None)
+def _spec_attributes(cls: type) -> Tuple[str, ...]:
+    """Returns the attribute names of a class, introspected once per class.
+
+    Args:
+        cls (type): The class to introspect.
+
+    Returns:
+        Tuple[str, ...]: The attribute names of the class.
+    """
+
+    return tuple(dir(cls))
+
+
+def fast_mock(cls: type, **attributes: Any) -> MagicMock:
+    """Builds a spec'd MagicMock without re-introspecting the class per call.
+
+    MagicMock(spec=cls) walks dir(cls) on every construction; this helper
+    caches that walk per class and passes the attribute list instead, which
+    keeps the same attribute strictness while making repeated fixture
+    construction cheap.
+
+    Args:
+        cls (type): The class to mock.
+        attributes (Any): Attribute values to preset on the mock.
+
+    Returns:
+        MagicMock: The spec'd mock instance.
+    """
+
+    mock = MagicMock(spec=list(_spec_attributes(cls)))
+    for name, value in attributes.items():
+        setattr(mock, name, value)
+    return mock
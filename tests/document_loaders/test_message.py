@@ -2,7 +2,7 @@ import pytest
 from slack_sdk import WebClient
 
 from chatiq.document_loaders import MessageLoader
-from chatiq.utils import pretty_json_dumps
+from chatiq.utils import compact_json_dumps
 
 
 @pytest.fixture
@@ -32,7 +32,7 @@ def test_message_loader_load_new_message(mock_client):
     documents = loader.load()
 
     assert len(documents) == 1
-    assert documents[0].page_content == pretty_json_dumps(
+    assert documents[0].page_content == compact_json_dumps(
         {
             "content_type": "message",
             "user": "U0JD6RZU6",
@@ -76,7 +76,7 @@ def test_message_loader_load_message_changed(mock_client):
     documents = loader.load()
 
     assert len(documents) == 1
-    assert documents[0].page_content == pretty_json_dumps(
+    assert documents[0].page_content == compact_json_dumps(
         {
             "content_type": "message",
             "user": "U0JD6RZU6",
@@ -126,7 +126,7 @@ def test_message_loader_load_file_documents(mock_client):
     documents = loader.load()
 
     assert len(documents) == 1
-    assert documents[0].page_content == pretty_json_dumps(
+    assert documents[0].page_content == compact_json_dumps(
         {
             "content_type": "message",
             "user": "U0JD6RZU6",
@@ -182,7 +182,7 @@ def test_message_loader_load_pdf_documents(mock_client):
     documents = loader.load()
 
     assert len(documents) == 1
-    assert documents[0].page_content == pretty_json_dumps(
+    assert documents[0].page_content == compact_json_dumps(
         {
             "content_type": "message",
             "user": "U0JD6RZU6",
@@ -237,7 +237,7 @@ def test_message_loader_unfurling_links(mock_client):
     documents = loader.load()
 
     assert len(documents) == 1
-    assert documents[0].page_content == pretty_json_dumps(
+    assert documents[0].page_content == compact_json_dumps(
         {
             "content_type": "message",
             "user": "U0JD6RZU6",
@@ -291,7 +291,7 @@ def test_message_loader_slack_links(mock_client):
     documents = loader.load()
 
     assert len(documents) == 1
-    assert documents[0].page_content == pretty_json_dumps(
+    assert documents[0].page_content == compact_json_dumps(
         {
             "content_type": "message",
             "user": "U0JD6RZU6",
@@ -1,11 +1,44 @@
+from types import MappingProxyType
+
 import pytest
 import requests_mock
-from langchain.document_loaders.parsers.pdf import PyMuPDFParser
-from langchain.schema import Document
 from slack_bolt import BoltContext
 
-from chatiq.document_loaders import PdfLoader
-from chatiq.utils import pretty_json_dumps
+from chatiq.document_loaders import PdfLoader, loader_for
+from chatiq.utils import compact_json_dumps
+
+# Shared read-only fixtures; tests only read these, so the same objects are
+# reused instead of rebuilding the nested literals per test.
+BODY = MappingProxyType(
+    {
+        "team_id": "T0JD6RZU6",
+        "event": {
+            "channel_id": "C024BE91L",
+            "user_id": "U0JD6RZU6",
+            "event_ts": "1629470261.000200",
+        },
+        "event_time": 1629470261,
+    }
+)
+PDF_FILE = MappingProxyType(
+    {
+        "id": "F0JD6RZU6",
+        "filetype": "pdf",
+        "name": "test.pdf",
+        "title": "Test PDF File",
+        "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.pdf",
+        "url_private": "http://example.com/test.pdf",
+    }
+)
+UNKNOWN_FILE = MappingProxyType(
+    {
+        "id": "F0JD6RZU6",
+        "filetype": "unknown",
+        "name": "test.unknown",
+        "title": "Test Unknown File",
+        "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.unknown",
+    }
+)
 
 
 @pytest.fixture
@@ -22,10 +55,12 @@ def mock_request():
 
 @pytest.fixture
 def mock_parser(mocker):
-    mock_parser = mocker.MagicMock(spec=PyMuPDFParser)
-    mock_parser.parse.return_value = [Document(page_content="parsed pdf content", metadata={"page": 1})]
-    mocker.patch("chatiq.document_loaders.pdf.PyMuPDFParser", return_value=mock_parser)
-    return mock_parser
+    mock_page = mocker.MagicMock()
+    mock_page.get_text.return_value = "parsed pdf content"
+    mock_document = mocker.MagicMock()
+    mock_document.__iter__ = lambda self: iter([mock_page])
+    mock_document.page_count = 1
+    return mocker.patch("chatiq.document_loaders.pdf.fitz.open", return_value=mock_document)
 
 
 def test_check_supported():
@@ -38,30 +73,13 @@ def test_check_supported():
 
 
 def test_pdf_load_supported_file(mock_context, mock_request, mock_parser):
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
-            "channel_id": "C024BE91L",
-            "user_id": "U0JD6RZU6",
-            "event_ts": "1629470261.000200",
-        },
-        "event_time": 1629470261,
-    }
-    file = {
-        "id": "F0JD6RZU6",
-        "filetype": "pdf",
-        "name": "test.pdf",
-        "title": "Test PDF File",
-        "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.pdf",
-        "url_private": "http://example.com/test.pdf",
-    }
     mock_request.get("http://example.com/test.pdf", text="pdf content")
 
-    loader = PdfLoader(mock_context, body, file, "public", "gpt-3.5-turbo")
+    loader = PdfLoader(mock_context, BODY, PDF_FILE, "public", "gpt-3.5-turbo")
     documents = loader.load()
 
     assert len(documents) == 1
-    assert documents[0].page_content == pretty_json_dumps(
+    assert documents[0].page_content == compact_json_dumps(
         {
             "content_type": "pdf",
             "user": "U0JD6RZU6",
@@ -86,25 +104,24 @@ def test_pdf_load_supported_file(mock_context, mock_request, mock_parser):
     }
 
 
-def test_pdf_load_unsupported_file(mock_context):
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
-            "channel_id": "C024BE91L",
-            "user_id": "U0JD6RZU6",
-            "event_ts": "1629470261.000200",
-        },
-        "event_time": 1629470261,
-    }
-    file = {
-        "id": "F0JD6RZU6",
-        "filetype": "unknown",
-        "name": "test.unknown",
-        "title": "Test Unknown File",
-        "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.unknown",
-    }
+def test_pdf_extract_pages_preserves_page_order(mock_context, mocker):
+    pages = []
+    for index in range(3):
+        page = mocker.MagicMock()
+        page.get_text.return_value = f"page {index}"
+        pages.append(page)
+    mock_document = mocker.MagicMock()
+    mock_document.page_count = 3
+    mock_document.load_page.side_effect = lambda page_number: pages[page_number]
+    mocker.patch("chatiq.document_loaders.pdf.fitz.open", return_value=mock_document)
+
+    loader = PdfLoader(mock_context, BODY, PDF_FILE, "public", "gpt-3.5-turbo")
+    loader.file_content = b"%PDF"
+
+    assert loader._extract_pages() == ["page 0", "page 1", "page 2"]
+    assert mock_document.load_page.call_count == 3
 
-    loader = PdfLoader(mock_context, body, file, "public", "gpt-3.5-turbo")
-    documents = loader.load()
 
-    assert len(documents) == 0
+def test_pdf_loader_for_unsupported_file():
+    assert loader_for(PDF_FILE) is PdfLoader
+    assert loader_for(UNKNOWN_FILE) is None
@@ -1,18 +1,12 @@
-from chatiq.document_loaders import PlainTextLoader
-from chatiq.utils import pretty_json_dumps
+from types import MappingProxyType
 
+from chatiq.document_loaders import PlainTextLoader, loader_for
+from chatiq.utils import compact_json_dumps
 
-def test_check_supported():
-    text_file_supported = PlainTextLoader.check_supported({"filetype": "text"})
-    assert text_file_supported
-    pdf_file_supported = PlainTextLoader.check_supported({"filetype": "pdf"})
-    assert not pdf_file_supported
-    tombstone_supported = PlainTextLoader.check_supported({"mode": "tombstone"})
-    assert not tombstone_supported
-
-
-def test_plain_text_load_supported_file():
-    body = {
+# Shared read-only fixtures; tests only read these, so the same objects are
+# reused instead of rebuilding the nested literals per test.
+BODY = MappingProxyType(
+    {
         "team_id": "T0JD6RZU6",
         "event": {
             "channel_id": "C024BE91L",
@@ -21,18 +15,42 @@ def test_plain_text_load_supported_file():
         },
         "event_time": 1629470261,
     }
-    file = {
+)
+SUPPORTED_FILE = MappingProxyType(
+    {
         "id": "F0JD6RZU6",
         "filetype": "python",
         "name": "test.py",
         "title": "Test Python File",
         "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.py",
     }
-    loader = PlainTextLoader("print('Hello, world!')", body, file, "public", "gpt-3.5-turbo")
+)
+UNSUPPORTED_FILE = MappingProxyType(
+    {
+        "id": "F0JD6RZU6",
+        "filetype": "unknown",
+        "name": "test.unknown",
+        "title": "Test Unknown File",
+        "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.unknown",
+    }
+)
+
+
+def test_check_supported():
+    text_file_supported = PlainTextLoader.check_supported({"filetype": "text"})
+    assert text_file_supported
+    pdf_file_supported = PlainTextLoader.check_supported({"filetype": "pdf"})
+    assert not pdf_file_supported
+    tombstone_supported = PlainTextLoader.check_supported({"mode": "tombstone"})
+    assert not tombstone_supported
+
+
+def test_plain_text_load_supported_file():
+    loader = PlainTextLoader("print('Hello, world!')", BODY, SUPPORTED_FILE, "public", "gpt-3.5-turbo")
     documents = loader.load()
 
     assert len(documents) == 1
-    assert documents[0].page_content == pretty_json_dumps(
+    assert documents[0].page_content == compact_json_dumps(
         {
             "content_type": "python",
             "user": "U0JD6RZU6",
@@ -57,24 +75,6 @@ def test_plain_text_load_supported_file():
     }
 
 
-def test_plain_text_load_unsupported_file():
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
-            "channel_id": "C024BE91L",
-            "user_id": "U0JD6RZU6",
-            "event_ts": "1629470261.000200",
-        },
-        "event_time": 1629470261,
-    }
-    file = {
-        "id": "F0JD6RZU6",
-        "filetype": "unknown",
-        "name": "test.unknown",
-        "title": "Test Unknown File",
-        "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.unknown",
-    }
-    loader = PlainTextLoader("", body, file, "public", "gpt-3.5-turbo")
-    documents = loader.load()
-
-    assert len(documents) == 0
+def test_plain_text_loader_for_unsupported_file():
+    assert loader_for(SUPPORTED_FILE) is PlainTextLoader
+    assert loader_for(UNSUPPORTED_FILE) is None
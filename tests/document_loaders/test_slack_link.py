@@ -1,5 +1,22 @@
+from types import MappingProxyType
+
 from chatiq.document_loaders import SlackLinkLoader
-from chatiq.utils import pretty_json_dumps
+from chatiq.utils import compact_json_dumps
+
+# Shared read-only event body; tests only read it, so one object is reused
+# instead of rebuilding the nested literal per test.
+BODY = MappingProxyType(
+    {
+        "team_id": "T0JD6RZU6",
+        "event": {
+            "channel_type": "channel",
+            "channel": "C024BE91L",
+            "user": "U0JD6RZU6",
+            "ts": "1629470261.000200",
+        },
+        "event_time": 1629470261,
+    }
+)
 
 
 def test_check_supported():
@@ -24,17 +41,7 @@ def test_check_supported():
 
 
 def test_slack_link_loader_load_valid_input():
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
-            "channel_type": "channel",
-            "channel": "C024BE91L",
-            "user": "U0JD6RZU6",
-            "ts": "1629470261.000200",
-        },
-        "event_time": 1629470261,
-    }
-    message = body["event"]
+    message = BODY["event"]
     attachment = {
         "id": 1,
         "original_url": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
@@ -43,11 +50,11 @@ def test_slack_link_loader_load_valid_input():
     }
     model = "gpt-3.5-turbo"
 
-    loader = SlackLinkLoader(body, message, attachment, model)
+    loader = SlackLinkLoader(BODY, message, attachment, model)
     documents = loader.load()
 
     assert len(documents) == 1
-    assert documents[0].page_content == pretty_json_dumps(
+    assert documents[0].page_content == compact_json_dumps(
         {
             "content_type": "slack_link",
             "user": "U0JD6RZU6",
@@ -71,17 +78,7 @@ def test_slack_link_loader_load_valid_input():
 
 
 def test_slack_link_loader_load_file_document():
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
-            "channel_type": "channel",
-            "channel": "C024BE91L",
-            "user": "U0JD6RZU6",
-            "ts": "1629470261.000200",
-        },
-        "event_time": 1629470261,
-    }
-    message = body["event"]
+    message = BODY["event"]
     attachment = {
         "id": 1,
         "original_url": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
@@ -100,11 +97,11 @@ def test_slack_link_loader_load_file_document():
     }
     model = "gpt-3.5-turbo"
 
-    loader = SlackLinkLoader(body, message, attachment, model)
+    loader = SlackLinkLoader(BODY, message, attachment, model)
     documents = loader.load()
 
     assert len(documents) == 1
-    assert documents[0].page_content == pretty_json_dumps(
+    assert documents[0].page_content == compact_json_dumps(
         {
             "content_type": "slack_link",
             "user": "U0JD6RZU6",
@@ -134,21 +131,11 @@ def test_slack_link_loader_load_file_document():
 
 
 def test_slack_link_loader_load_invalid_input():
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
-            "channel_type": "channel",
-            "channel": "C024BE91L",
-            "user": "U0JD6RZU6",
-            "ts": "1629470261.000200",
-        },
-        "event_time": 1629470261,
-    }
-    message = body["event"]
+    message = BODY["event"]
     attachment = {"id": None, "original_url": None, "author_id": None, "text": None}
     model = "gpt-3.5-turbo"
 
-    loader = SlackLinkLoader(body, message, attachment, model)
+    loader = SlackLinkLoader(BODY, message, attachment, model)
     documents = loader.load()
 
     assert len(documents) == 0
@@ -0,0 +1,51 @@
+from logging import Logger
+from unittest.mock import MagicMock
+
+import pytest
+from slack_bolt import BoltContext
+from weaviate import Client
+
+from chatiq import ChatIQ
+from chatiq.database import Database
+from tests.conftest import fast_mock
+
+# The handlers only ever call these WebClient methods; listing them as the
+# spec keeps attribute strictness for the calls that matter without walking
+# the several hundred API methods a full WebClient spec would pull in.
+_WEB_CLIENT_METHODS = ("conversations_info", "conversations_replies", "files_info", "views_publish")
+
+
+# Fixtures shared by the handler test modules; modules with special needs
+# (preset return values, stubs) override them locally.
+@pytest.fixture
+def mock_chatiq():
+    mock_chatiq = fast_mock(ChatIQ)
+    mock_chatiq.weaviate_client = fast_mock(Client)
+    mock_chatiq.db = fast_mock(Database)
+    mock_chatiq.submit.side_effect = lambda fn, *args: fn(*args)
+    return mock_chatiq
+
+
+@pytest.fixture
+def mock_client():
+    return MagicMock(spec=list(_WEB_CLIENT_METHODS))
+
+
+@pytest.fixture
+def mock_context():
+    return fast_mock(BoltContext)
+
+
+@pytest.fixture
+def mock_logger():
+    return fast_mock(Logger)
+
+
+@pytest.fixture
+def mock_say(mocker):
+    return mocker.MagicMock()
+
+
+@pytest.fixture
+def mock_ack(mocker):
+    return mocker.MagicMock()
@@ -1,35 +1,14 @@
-from logging import Logger
-
 import pytest
-from slack_sdk import WebClient
 
-from chatiq import ChatIQ
-from chatiq.database import Database
 from chatiq.handlers import AppHomeOpenedHandler
 from chatiq.models import SlackTeam
 from chatiq.repositories.slack_team_repository import SlackTeamRepository
+from tests.conftest import fast_mock
 
 
 @pytest.fixture
-def mock_chatiq(mocker):
-    mock_chatiq = mocker.MagicMock(spec=ChatIQ)
-    mock_chatiq.db = mocker.MagicMock(spec=Database)
-    return mock_chatiq
-
-
-@pytest.fixture
-def mock_client(mocker):
-    return mocker.MagicMock(spec=WebClient)
-
-
-@pytest.fixture
-def mock_logger(mocker):
-    return mocker.MagicMock(spec=Logger)
-
-
-@pytest.fixture
-def mock_team(mocker):
-    mock_team = mocker.MagicMock(spec=SlackTeam)
+def mock_team():
+    mock_team = fast_mock(SlackTeam)
     mock_team.model = "gpt-3.5-turbo"
     mock_team.temperature = 0.2
     mock_team.context = "Test context"
@@ -38,7 +17,7 @@ def mock_team(mocker):
 
 @pytest.fixture
 def mock_repository(mocker, mock_team):
-    mock_repository = mocker.MagicMock(spec=SlackTeamRepository)
+    mock_repository = fast_mock(SlackTeamRepository)
     mock_repository.return_value = mock_team
     mocker.patch("chatiq.handlers.app_home_opened.SlackTeamRepository", return_value=mock_repository)
     return mock_repository
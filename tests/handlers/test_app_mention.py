@@ -1,34 +1,28 @@
 import uuid
-from logging import Logger
 
 import pytest
 from langchain.chat_models import ChatOpenAI
 from langchain.memory import ConversationTokenBufferMemory
 from slack_sdk import WebClient
-from weaviate import Client
 
-from chatiq import ChatIQ
 from chatiq.chat_chain import ChatChain
-from chatiq.database import Database
 from chatiq.handlers import AppMentionHandler
+from chatiq.handlers import app_mention as app_mention_module
 from chatiq.models import SlackTeam
 from chatiq.repositories import SlackTeamRepository
 from chatiq.vectorstore import Vectorstore
+from tests.conftest import fast_mock
 
 
-@pytest.fixture
-def mock_chatiq(mocker):
-    mock_chatiq = mocker.MagicMock(spec=ChatIQ)
-    mock_chatiq.weaviate_client = mocker.MagicMock(spec=Client)
-    mock_chatiq.db = mocker.MagicMock(spec=Database)
-    mock_chatiq.threads = []
-    mock_chatiq.add_thread.side_effect = lambda thread: mock_chatiq.threads.append(thread)
-    return mock_chatiq
+@pytest.fixture(autouse=True)
+def clear_handler_caches():
+    app_mention_module._channel_info_cache.clear()
+    app_mention_module._llm_cache.clear()
 
 
 @pytest.fixture
-def mock_client(mocker):
-    mock_client = mocker.MagicMock(spec=WebClient)
+def mock_client():
+    mock_client = fast_mock(WebClient)
     mock_client.conversations_info.return_value = {
         "channel": {
             "topic": {"value": ":thermometer: 2.0"},
@@ -58,47 +52,37 @@ def mock_client(mocker):
     return mock_client
 
 
-@pytest.fixture
-def mock_say(mocker):
-    return mocker.MagicMock()
-
-
-@pytest.fixture
-def mock_logger(mocker):
-    return mocker.MagicMock(spec=Logger)
-
-
 @pytest.fixture
 def mock_chat_chain(mocker):
-    mock_chat_chain = mocker.MagicMock(spec=ChatChain)
+    mock_chat_chain = fast_mock(ChatChain)
     mocker.patch("chatiq.handlers.app_mention.ChatChain", return_value=mock_chat_chain)
     return mock_chat_chain
 
 
 @pytest.fixture
 def mock_chat_openai(mocker):
-    mock_chat_openai = mocker.MagicMock(spec=ChatOpenAI)
+    mock_chat_openai = fast_mock(ChatOpenAI)
     mocker.patch("chatiq.handlers.app_mention.ChatOpenAI", return_value=mock_chat_openai)
     return mock_chat_openai
 
 
 @pytest.fixture
 def mock_memory(mocker):
-    mock_memory = mocker.MagicMock(spec=ConversationTokenBufferMemory)
+    mock_memory = fast_mock(ConversationTokenBufferMemory)
     mocker.patch("chatiq.handlers.app_mention.ConversationTokenBufferMemory", return_value=mock_memory)
     return mock_memory
 
 
 @pytest.fixture
 def mock_vectorstore(mocker):
-    mock_vectorstore = mocker.MagicMock(spec=Vectorstore)
-    mocker.patch("chatiq.handlers.app_mention.Vectorstore", return_value=mock_vectorstore)
+    mock_vectorstore = fast_mock(Vectorstore)
+    mocker.patch("chatiq.handlers.app_mention.get_vectorstore", return_value=mock_vectorstore)
     return mock_vectorstore
 
 
 @pytest.fixture
-def mock_team(mocker):
-    mock_team = mocker.MagicMock(spec=SlackTeam)
+def mock_team():
+    mock_team = fast_mock(SlackTeam)
     mock_team.model = "gpt-3.5-turbo"
     mock_team.namespace_uuid = uuid.UUID("b63dfe06-5e32-4fe4-9dda-f0426eb8d83a")
     return mock_team
@@ -106,7 +90,7 @@ def mock_team(mocker):
 
 @pytest.fixture
 def mock_repository(mocker, mock_team):
-    mock_repository = mocker.MagicMock(spec=SlackTeamRepository)
+    mock_repository = fast_mock(SlackTeamRepository)
     mocker.patch("chatiq.handlers.app_mention.SlackTeamRepository", return_value=mock_repository)
     mock_repository.get_or_create.return_value = mock_team
     return mock_repository
@@ -147,9 +131,6 @@ def test_app_mention_handler_call(
     }
 
     handler(mock_client, body, mock_logger, mock_say)
-    for thread in mock_chatiq.threads:
-        thread.join()
-
     mock_client.conversations_info.assert_called_once_with(channel="C024BE91L")
     mock_repository.get_or_create.assert_called_once_with(body["team_id"], body["authorizations"][0]["user_id"])
     mock_vectorstore.ensure_index.assert_called_once()
@@ -166,3 +147,71 @@ def test_app_mention_handler_call(
         }
     )
     mock_say.assert_called_once_with(mock_chat_chain.run.return_value, thread_ts="1579244331.000200")
+
+
+def test_app_mention_handler_caches_channel_info(
+    mock_chatiq,
+    mock_client,
+    mock_logger,
+    mock_say,
+    mock_chat_openai,
+    mock_memory,
+    mock_chat_chain,
+    mock_vectorstore,
+    mock_repository,
+    mock_team,
+):
+    handler = AppMentionHandler(mock_chatiq)
+    body = {
+        "team_id": "T0JD6RZU6",
+        "event": {
+            "user": "U0JD6RS3T",
+            "text": "Hello, World!",
+            "ts": "1579244331.000200",
+            "thread_ts": "1579244331.000200",
+            "channel_type": "channel",
+            "channel": "C024BE91L",
+        },
+        "authorizations": [{"user_id": "U0JD6RZU6"}],
+    }
+
+    handler(mock_client, body, mock_logger, mock_say)
+    handler(mock_client, body, mock_logger, mock_say)
+
+    mock_client.conversations_info.assert_called_once_with(channel="C024BE91L")
+    assert mock_say.call_count == 2
+
+
+def test_app_mention_handler_reuses_chat_model(
+    mock_chatiq,
+    mock_client,
+    mock_logger,
+    mock_say,
+    mock_chat_openai,
+    mock_memory,
+    mock_chat_chain,
+    mock_vectorstore,
+    mock_repository,
+    mock_team,
+    mocker,
+):
+    mock_chat_openai_class = mocker.patch("chatiq.handlers.app_mention.ChatOpenAI", return_value=mock_chat_openai)
+    handler = AppMentionHandler(mock_chatiq)
+    body = {
+        "team_id": "T0JD6RZU6",
+        "event": {
+            "user": "U0JD6RS3T",
+            "text": "Hello, World!",
+            "ts": "1579244331.000200",
+            "thread_ts": "1579244331.000200",
+            "channel_type": "channel",
+            "channel": "C024BE91L",
+        },
+        "authorizations": [{"user_id": "U0JD6RZU6"}],
+    }
+
+    handler(mock_client, body, mock_logger, mock_say)
+    handler(mock_client, body, mock_logger, mock_say)
+
+    mock_chat_openai_class.assert_called_once()
+    assert mock_say.call_count == 2
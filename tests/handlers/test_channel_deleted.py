@@ -1,31 +1,14 @@
-from logging import Logger
-
 import pytest
-from weaviate import Client
 
-from chatiq import ChatIQ
-from chatiq.database import Database
 from chatiq.handlers import ChannelDeletedHandler
 from chatiq.vectorstore import Vectorstore
-
-
-@pytest.fixture
-def mock_chatiq(mocker):
-    mock_chatiq = mocker.MagicMock(spec=ChatIQ)
-    mock_chatiq.weaviate_client = mocker.MagicMock(spec=Client)
-    mock_chatiq.db = mocker.MagicMock(spec=Database)
-    return mock_chatiq
-
-
-@pytest.fixture
-def mock_logger(mocker):
-    return mocker.MagicMock(spec=Logger)
+from tests.conftest import fast_mock
 
 
 @pytest.fixture
 def mock_vectorstore(mocker):
-    mock_vectorstore = mocker.MagicMock(spec=Vectorstore)
-    mocker.patch("chatiq.handlers.channel_deleted.Vectorstore", return_value=mock_vectorstore)
+    mock_vectorstore = fast_mock(Vectorstore)
+    mocker.patch("chatiq.handlers.channel_deleted.get_vectorstore", return_value=mock_vectorstore)
     return mock_vectorstore
 
 
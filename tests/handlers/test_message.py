@@ -1,425 +1,355 @@
 import uuid
-from logging import Logger
-from unittest.mock import call
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 from langchain.docstore.document import Document
-from slack_bolt import BoltContext
-from slack_sdk import WebClient
-from weaviate import Client
 
-from chatiq import ChatIQ
-from chatiq.database import Database
 from chatiq.document_loaders import MessageLoader, UnfurlingLinkLoader
 from chatiq.handlers import MessageHandler
 from chatiq.models import SlackTeam
 from chatiq.repositories import SlackTeamRepository
-from chatiq.utils import pretty_json_dumps
+from chatiq.utils import compact_json_dumps
 from chatiq.vectorstore import Vectorstore
+from tests.conftest import fast_mock
+
+# Shared read-only Document payloads; the JSON serialization and Document
+# construction are deterministic, so each variant is built once at import.
+_MSG_CONTENT = {
+    "content_type": "message",
+    "user": "U0JD6RZU6",
+    "channel": "C024BE91L",
+    "message": "Hello, world!",
+    "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
+    "timestamp": "2021-08-20T14:37:41.000200+00:00",
+}
+_MSG_METADATA = {
+    "file_or_attachment_id": "Ev058XH6RPGR",
+    "content_type": "message",
+    "channel_type": "channel",
+    "channel_id": "C024BE91L",
+    "thread_ts": "1579244331.000200",
+    "ts": "1579244331.000200",
+    "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
+    "timestamp": "2021-08-20T14:37:41.000200+00:00",
+}
+_UNFURL_CONTENT = {
+    "content_type": "unfurling_link",
+    "user": "U0JD6RZU6",
+    "title": "Example Domain",
+    "channel": "C024BE91L",
+    "content": "This domain is for use in illustrative examples in documents.",
+    "page": "1 / 1",
+    "permalink": "https://example.com",
+    "timestamp": "2021-08-20T14:37:41.000200+00:00",
+}
+_UNFURL_METADATA = {
+    "content_type": "unfurling_link",
+    "channel_type": "channel",
+    "channel_id": "C024BE91L",
+    "thread_ts": "0000000000.000000",
+    "ts": "1629470261.000200",
+    "timestamp": "2021-08-20T14:37:41.000200+00:00",
+    "permalink": "https://example.com",
+}
+
+
+def _message_document(**extra):
+    return Document(page_content=compact_json_dumps({**_MSG_CONTENT, **extra}), metadata=_MSG_METADATA)
+
+
+_MESSAGE_DOCS = {
+    "plain": _message_document(),
+    "with_file": _message_document(
+        files=[
+            {
+                "content_type": "python",
+                "title": "Test Python File",
+                "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.py",
+            }
+        ]
+    ),
+    "with_pdf": _message_document(
+        files=[
+            {
+                "content_type": "pdf",
+                "title": "parsed pdf content",
+                "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.pdf",
+            }
+        ]
+    ),
+    "with_unfurl": _message_document(
+        attachments=[
+            {
+                "url": "https://example.com",
+                "title": "Example Domain",
+                "text": "This domain is for use in illustrative examples in documents.",
+            }
+        ]
+    ),
+}
+_UNFURL_DOCS = {
+    "add": Document(
+        page_content=compact_json_dumps(_UNFURL_CONTENT),
+        metadata={**_UNFURL_METADATA, "file_or_attachment_id": "1"},
+    ),
+    "change": Document(
+        page_content=compact_json_dumps(_UNFURL_CONTENT),
+        metadata={**_UNFURL_METADATA, "file_or_attachment_id": "1629470261.000200-1"},
+    ),
+}
+
+
+_CHANNEL_INFO = {
+    "channel": {
+        "topic": {"value": ":speech_balloon: Speak like a pirate"},
+        "purpose": {"value": ":thermometer: 2.0\n:round_pushpin: +09:00"},
+    }
+}
 
 
+# MessageHandler only ever calls conversations_info on the client (the
+# loaders that use it are patched out), so a minimal stub replaces the
+# full spec'd WebClient mock; unknown attribute access still raises.
 @pytest.fixture
-def mock_chatiq(mocker):
-    mock_chatiq = mocker.MagicMock(spec=ChatIQ)
-    mock_chatiq.weaviate_client = mocker.MagicMock(spec=Client)
-    mock_chatiq.db = mocker.MagicMock(spec=Database)
-    mock_chatiq.threads = []
-    mock_chatiq.add_thread.side_effect = lambda thread: mock_chatiq.threads.append(thread)
-    return mock_chatiq
+def mock_client():
+    return SimpleNamespace(conversations_info=MagicMock(return_value=_CHANNEL_INFO))
 
 
-@pytest.fixture
-def mock_client(mocker):
-    mock_client = mocker.MagicMock(spec=WebClient)
-    mock_client.conversations_info.return_value = {
-        "channel": {
-            "topic": {"value": ":speech_balloon: Speak like a pirate"},
-            "purpose": {"value": ":thermometer: 2.0\n:round_pushpin: +09:00"},
-        }
-    }
-    return mock_client
+# The loader and collaborator patches below are installed once per module via
+# module_mocker; the function-scoped wrappers only reset call state per test.
+@pytest.fixture(scope="module")
+def _patch_message_loader_init(module_mocker):
+    return module_mocker.patch.object(MessageLoader, "__init__", return_value=None)
 
 
 @pytest.fixture
-def mock_context(mocker):
-    mock_context = mocker.MagicMock(spec=BoltContext)
-    return mock_context
+def mock_message_loader_init(_patch_message_loader_init):
+    _patch_message_loader_init.reset_mock()
+    return _patch_message_loader_init
 
 
-@pytest.fixture
-def mock_logger(mocker):
-    return mocker.MagicMock(spec=Logger)
+@pytest.fixture(scope="module")
+def _patch_message_loader_load(module_mocker):
+    return module_mocker.patch.object(MessageLoader, "load")
 
 
 @pytest.fixture
-def mock_say(mocker):
-    return mocker.MagicMock()
+def mock_message_loader_load(_patch_message_loader_load):
+    _patch_message_loader_load.reset_mock(return_value=True)
+    return _patch_message_loader_load
 
 
-@pytest.fixture
-def mock_message_loader_init(mocker):
-    return mocker.patch.object(MessageLoader, "__init__", return_value=None)
+@pytest.fixture(scope="module")
+def _patch_unfurling_link_loader_init(module_mocker):
+    return module_mocker.patch.object(UnfurlingLinkLoader, "__init__", return_value=None)
 
 
 @pytest.fixture
-def mock_message_loader_load(mocker):
-    mock_message_loader_load = mocker.patch.object(MessageLoader, "load")
-    return mock_message_loader_load
+def mock_unfurling_link_loader_init(_patch_unfurling_link_loader_init):
+    _patch_unfurling_link_loader_init.reset_mock()
+    return _patch_unfurling_link_loader_init
 
 
-@pytest.fixture
-def mock_unfurling_link_loader_init(mocker):
-    return mocker.patch.object(UnfurlingLinkLoader, "__init__", return_value=None)
+@pytest.fixture(scope="module")
+def _patch_unfurling_link_loader_load(module_mocker):
+    return module_mocker.patch.object(UnfurlingLinkLoader, "load")
 
 
 @pytest.fixture
-def mock_unfurling_link_loader_load(mocker):
-    mock_unfurling_link_loader_load = mocker.patch.object(UnfurlingLinkLoader, "load")
-    return mock_unfurling_link_loader_load
+def mock_unfurling_link_loader_load(_patch_unfurling_link_loader_load):
+    _patch_unfurling_link_loader_load.reset_mock(return_value=True)
+    return _patch_unfurling_link_loader_load
 
 
-@pytest.fixture
-def mock_vectorstore(mocker):
-    mock_vectorstore = mocker.MagicMock(spec=Vectorstore)
-    mocker.patch("chatiq.handlers.message.Vectorstore", return_value=mock_vectorstore)
+@pytest.fixture(scope="module")
+def _patch_vectorstore(module_mocker):
+    mock_vectorstore = fast_mock(Vectorstore)
+    module_mocker.patch("chatiq.handlers.message.get_vectorstore", return_value=mock_vectorstore)
     return mock_vectorstore
 
 
 @pytest.fixture
-def mock_team(mocker):
-    mock_team = mocker.MagicMock(spec=SlackTeam)
-    mock_team.namespace_uuid = uuid.UUID("b63dfe06-5e32-4fe4-9dda-f0426eb8d83a")
-    return mock_team
+def mock_vectorstore(_patch_vectorstore):
+    _patch_vectorstore.reset_mock()
+    return _patch_vectorstore
 
 
 @pytest.fixture
-def mock_repository(mocker, mock_team):
-    mock_repository = mocker.MagicMock(spec=SlackTeamRepository)
-    mocker.patch("chatiq.handlers.message.SlackTeamRepository", return_value=mock_repository)
-    mock_repository.get_or_create.return_value = mock_team
-    return mock_repository
+def mock_team():
+    mock_team = fast_mock(SlackTeam)
+    mock_team.namespace_uuid = _TEAM_NS
+    return mock_team
 
 
-def test_message_handler_call_add_event(
-    mock_chatiq,
-    mock_client,
-    mock_context,
-    mock_logger,
-    mock_say,
-    mock_message_loader_init,
-    mock_message_loader_load,
-    mock_unfurling_link_loader_init,
-    mock_unfurling_link_loader_load,
-    mock_vectorstore,
-    mock_repository,
-    mock_team,
-):
-    mock_message_loader_load.return_value = [
-        Document(
-            page_content=pretty_json_dumps(
-                {
-                    "content_type": "message",
-                    "user": "U0JD6RZU6",
-                    "channel": "C024BE91L",
-                    "message": "Hello, world!",
-                    "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
-                    "timestamp": "2021-08-20T14:37:41.000200+00:00",
-                },
-            ),
-            metadata={
-                "file_or_attachment_id": "Ev058XH6RPGR",
-                "content_type": "message",
-                "channel_type": "channel",
-                "channel_id": "C024BE91L",
-                "thread_ts": "1579244331.000200",
-                "ts": "1579244331.000200",
-                "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
-                "timestamp": "2021-08-20T14:37:41.000200+00:00",
-            },
-        )
-    ]
+@pytest.fixture(scope="module")
+def _patch_repository(module_mocker):
+    mock_repository = fast_mock(SlackTeamRepository)
+    module_mocker.patch("chatiq.handlers.message.SlackTeamRepository", return_value=mock_repository)
+    return mock_repository
 
-    message_handler = MessageHandler(mock_chatiq)
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
+
+@pytest.fixture
+def mock_repository(_patch_repository, mock_team):
+    _patch_repository.reset_mock()
+    _patch_repository.get_or_create.return_value = mock_team
+    return _patch_repository
+
+
+_MESSAGE_UUID = uuid.UUID("1e86735d-2b15-5ca1-be34-0142abd47742")
+_TEAM_NS = uuid.UUID("b63dfe06-5e32-4fe4-9dda-f0426eb8d83a")
+
+_ADD_BODY = {
+    "team_id": "T0JD6RZU6",
+    "event": {
+        "user": "U0JD6RS3T",
+        "text": "Hello, World!",
+        "ts": "1579244331.000200",
+        "thread_ts": "1579244331.000200",
+        "channel_type": "channel",
+        "channel": "C024BE91L",
+    },
+    "authorizations": [{"user_id": "U0JD6RZU6"}],
+}
+_CHANGE_BODY = {
+    "team_id": "T0JD6RZU6",
+    "event": {
+        "subtype": "message_changed",
+        "message": {
             "user": "U0JD6RS3T",
-            "text": "Hello, World!",
+            "text": "\u3053\u3093\u306b\u3061\u306f\u3001\u4e16\u754c\uff01",
             "ts": "1579244331.000200",
             "thread_ts": "1579244331.000200",
             "channel_type": "channel",
             "channel": "C024BE91L",
         },
-        "authorizations": [{"user_id": "U0JD6RZU6"}],
-    }
-    message_handler(mock_client, mock_context, body, mock_logger, mock_say)
-    for thread in mock_chatiq.threads:
-        thread.join()
-
-    mock_vectorstore.ensure_index.assert_called_once()
-    mock_repository.get_or_create.assert_called_once_with(body["team_id"], body["authorizations"][0]["user_id"])
-    mock_message_loader_init.assert_called_once_with(mock_client, body, body["event"], mock_team.model)
-    mock_message_loader_load.assert_called_once()
-    mock_unfurling_link_loader_init.assert_not_called()
-    mock_unfurling_link_loader_load.assert_not_called()
-    mock_vectorstore.add_documents.assert_called_once_with(
-        mock_message_loader_load.return_value, uuids=[uuid.UUID("1e86735d-2b15-5ca1-be34-0142abd47742")]
-    )
-    mock_vectorstore.delete_file_or_attachment.assert_not_called()
-
-
-def test_message_handler_call_change_event(
-    mock_chatiq,
-    mock_client,
-    mock_context,
-    mock_logger,
-    mock_say,
-    mock_message_loader_init,
-    mock_message_loader_load,
-    mock_unfurling_link_loader_init,
-    mock_unfurling_link_loader_load,
-    mock_vectorstore,
-    mock_repository,
-    mock_team,
-):
-    mock_message_loader_load.return_value = [
-        Document(
-            page_content=pretty_json_dumps(
-                {
-                    "content_type": "message",
-                    "user": "U0JD6RZU6",
-                    "channel": "C024BE91L",
-                    "message": "Hello, world!",
-                    "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
-                    "timestamp": "2021-08-20T14:37:41.000200+00:00",
-                },
-            ),
-            metadata={
-                "file_or_attachment_id": "Ev058XH6RPGR",
-                "content_type": "message",
-                "channel_type": "channel",
-                "channel_id": "C024BE91L",
-                "thread_ts": "1579244331.000200",
-                "ts": "1579244331.000200",
-                "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
-                "timestamp": "2021-08-20T14:37:41.000200+00:00",
-            },
-        )
-    ]
-
-    message_handler = MessageHandler(mock_chatiq)
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
-            "subtype": "message_changed",
-            "message": {
-                "user": "U0JD6RS3T",
-                "text": "こんにちは、世界！",
-                "ts": "1579244331.000200",
-                "thread_ts": "1579244331.000200",
-                "channel_type": "channel",
-                "channel": "C024BE91L",
-            },
-            "previous_message": {
-                "user": "U0JD6RS3T",
-                "text": "Hello, World!",
-                "ts": "1579244331.000200",
-                "thread_ts": "1579244331.000200",
-                "channel_type": "channel",
-                "channel": "C024BE91L",
-            },
-        },
-        "authorizations": [{"user_id": "U0JD6RZU6"}],
-    }
-    message_handler(mock_client, mock_context, body, mock_logger, mock_say)
-    for thread in mock_chatiq.threads:
-        thread.join()
-
-    mock_vectorstore.ensure_index.assert_called_once()
-    mock_repository.get_or_create.assert_called_once_with(body["team_id"], body["authorizations"][0]["user_id"])
-    mock_message_loader_init.assert_called_once_with(mock_client, body, body["event"]["message"], mock_team.model)
-    mock_message_loader_load.assert_called_once()
-    mock_unfurling_link_loader_init.assert_not_called()
-    mock_unfurling_link_loader_load.assert_not_called()
-    mock_vectorstore.add_documents.assert_called_once_with(
-        mock_message_loader_load.return_value, uuids=[uuid.UUID("1e86735d-2b15-5ca1-be34-0142abd47742")]
-    )
-    mock_vectorstore.delete_file_or_attachment.assert_not_called()
-
-
-def test_message_handler_call_add_event_with_plain_text_file(
-    mock_chatiq,
-    mock_client,
-    mock_context,
-    mock_logger,
-    mock_say,
-    mock_message_loader_init,
-    mock_message_loader_load,
-    mock_unfurling_link_loader_init,
-    mock_unfurling_link_loader_load,
-    mock_vectorstore,
-    mock_repository,
-    mock_team,
-):
-    mock_message_loader_load.return_value = [
-        Document(
-            page_content=pretty_json_dumps(
-                {
-                    "content_type": "message",
-                    "user": "U0JD6RZU6",
-                    "channel": "C024BE91L",
-                    "message": "Hello, world!",
-                    "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
-                    "timestamp": "2021-08-20T14:37:41.000200+00:00",
-                    "files": [
-                        {
-                            "content_type": "python",
-                            "title": "Test Python File",
-                            "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.py",
-                        }
-                    ],
-                },
-            ),
-            metadata={
-                "file_or_attachment_id": "Ev058XH6RPGR",
-                "content_type": "message",
-                "channel_type": "channel",
-                "channel_id": "C024BE91L",
-                "thread_ts": "1579244331.000200",
-                "ts": "1579244331.000200",
-                "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
-                "timestamp": "2021-08-20T14:37:41.000200+00:00",
-            },
-        )
-    ]
-
-    message_handler = MessageHandler(mock_chatiq)
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
+        "previous_message": {
             "user": "U0JD6RS3T",
             "text": "Hello, World!",
             "ts": "1579244331.000200",
             "thread_ts": "1579244331.000200",
             "channel_type": "channel",
             "channel": "C024BE91L",
-            "files": [
-                {
-                    "id": "F0JD6RZU6",
-                    "filetype": "python",
-                    "name": "test.py",
-                    "title": "Test Python File",
-                    "content": "print('Hello, world!')",
-                    "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.py",
-                    "timestamp": 1629470261.000200,
-                }
-            ],
         },
-        "authorizations": [{"user_id": "U0JD6RZU6"}],
+    },
+    "authorizations": [{"user_id": "U0JD6RZU6"}],
+}
+_ADD_BODY_WITH_FILE = {
+    **_ADD_BODY,
+    "event": {
+        **_ADD_BODY["event"],
+        "files": [
+            {
+                "id": "F0JD6RZU6",
+                "filetype": "python",
+                "name": "test.py",
+                "title": "Test Python File",
+                "content": "print('Hello, world!')",
+                "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.py",
+                "timestamp": 1629470261.000200,
+            }
+        ],
+    },
+}
+_ADD_BODY_WITH_PDF = {
+    **_ADD_BODY,
+    "event": {
+        **_ADD_BODY["event"],
+        "files": [
+            {
+                "id": "F0JD6RZU6",
+                "filetype": "pdf",
+                "name": "test.pdf",
+                "title": "Test PDF File",
+                "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.pdf",
+                "timestamp": 1629470261.0002,
+                "url_private": "http://example.com/test.pdf",
+            }
+        ],
+    },
+}
+_ATTACHMENTS = [
+    {
+        "id": 1,
+        "original_url": "https://example.com",
+        "title": "Example Domain",
+        "text": "This domain is for use in illustrative examples in documents.",
     }
-    message_handler(mock_client, mock_context, body, mock_logger, mock_say)
-    for thread in mock_chatiq.threads:
-        thread.join()
-
-    mock_vectorstore.ensure_index.assert_called_once()
-    mock_repository.get_or_create.assert_called_once_with(body["team_id"], body["authorizations"][0]["user_id"])
-    mock_message_loader_init.assert_called_once_with(mock_client, body, body["event"], mock_team.model)
-    mock_message_loader_load.assert_called_once()
-    mock_unfurling_link_loader_init.assert_not_called()
-    mock_unfurling_link_loader_load.assert_not_called()
-    mock_vectorstore.add_documents.assert_called_once_with(
-        mock_message_loader_load.return_value, uuids=[uuid.UUID("1e86735d-2b15-5ca1-be34-0142abd47742")]
-    )
-    mock_vectorstore.delete_file_or_attachment.assert_not_called()
-
-
-def test_message_handler_call_add_event_with_pdf_file(
-    mock_chatiq,
-    mock_client,
-    mock_context,
-    mock_logger,
-    mock_say,
-    mock_message_loader_init,
-    mock_message_loader_load,
-    mock_unfurling_link_loader_init,
-    mock_unfurling_link_loader_load,
-    mock_vectorstore,
-    mock_repository,
-    mock_team,
-):
-    mock_message_loader_load.return_value = [
-        Document(
-            page_content=pretty_json_dumps(
-                {
-                    "content_type": "message",
-                    "user": "U0JD6RZU6",
-                    "channel": "C024BE91L",
-                    "message": "Hello, world!",
-                    "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
-                    "timestamp": "2021-08-20T14:37:41.000200+00:00",
-                    "files": [
-                        {
-                            "content_type": "pdf",
-                            "title": "parsed pdf content",
-                            "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.pdf",
-                        }
-                    ],
-                },
-            ),
-            metadata={
-                "file_or_attachment_id": "Ev058XH6RPGR",
-                "content_type": "message",
-                "channel_type": "channel",
-                "channel_id": "C024BE91L",
-                "thread_ts": "1579244331.000200",
-                "ts": "1579244331.000200",
-                "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
-                "timestamp": "2021-08-20T14:37:41.000200+00:00",
-            },
-        )
-    ]
-
-    message_handler = MessageHandler(mock_chatiq)
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
+]
+_ADD_BODY_WITH_UNFURL = {
+    **_ADD_BODY,
+    "event": {**_ADD_BODY["event"], "attachments": _ATTACHMENTS},
+}
+_EXPECTED_CHANNEL_INFO_BLOCKS = [
+    {"type": "section", "text": {"text": "Configuration is set for this channel", "type": "plain_text"}},
+    {
+        "type": "section",
+        "fields": [
+            {"type": "mrkdwn", "text": "*AI temperature:*\n2.0"},
+            {"type": "mrkdwn", "text": "*Timezone:*\n+09:00"},
+        ],
+    },
+    {"type": "section", "text": {"type": "mrkdwn", "text": "*System Message*\nSpeak like a pirate"}},
+]
+_CHANNEL_TOPIC_BODY = {
+    "team_id": "T0JD6RZU6",
+    "event": {
+        "subtype": "channel_topic",
+        "channel": "C024BE91L",
+    },
+    "authorizations": [{"user_id": "U0JD6RZU6"}],
+}
+_DELETE_BODY = {
+    "team_id": "T0JD6RZU6",
+    "event": {
+        "subtype": "message_deleted",
+        "previous_message": {
+            "ts": "1579244331.000200",
             "user": "U0JD6RS3T",
             "text": "Hello, World!",
-            "ts": "1579244331.000200",
             "thread_ts": "1579244331.000200",
             "channel_type": "channel",
             "channel": "C024BE91L",
-            "files": [
-                {
-                    "id": "F0JD6RZU6",
-                    "filetype": "pdf",
-                    "name": "test.pdf",
-                    "title": "Test PDF File",
-                    "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.pdf",
-                    "timestamp": 1629470261.0002,
-                    "url_private": "http://example.com/test.pdf",
-                }
-            ],
         },
-        "authorizations": [{"user_id": "U0JD6RZU6"}],
-    }
-    message_handler(mock_client, mock_context, body, mock_logger, mock_say)
-    for thread in mock_chatiq.threads:
-        thread.join()
-
-    mock_vectorstore.ensure_index.assert_called_once()
-    mock_repository.get_or_create.assert_called_once_with(body["team_id"], body["authorizations"][0]["user_id"])
-    mock_message_loader_init.assert_called_once_with(mock_client, body, body["event"], mock_team.model)
-    mock_message_loader_load.assert_called_once()
-    mock_unfurling_link_loader_init.assert_not_called()
-    mock_unfurling_link_loader_load.assert_not_called()
-    mock_vectorstore.add_documents.assert_called_once_with(
-        mock_message_loader_load.return_value, uuids=[uuid.UUID("1e86735d-2b15-5ca1-be34-0142abd47742")]
-    )
-    mock_vectorstore.delete_file_or_attachment.assert_not_called()
-
-
-def test_message_handler_call_add_event_with_unfurling_links(
+    },
+    "authorizations": [{"user_id": "U0JD6RZU6"}],
+}
+_CHANGE_BODY_WITH_UNFURL = {
+    **_CHANGE_BODY,
+    "event": {
+        "subtype": "message_changed",
+        "message": {**_ADD_BODY["event"]},
+        "previous_message": {**_ADD_BODY["event"], "attachments": _ATTACHMENTS},
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "msg_doc_key, body, message_source, unfurl_doc_key, unfurl_source, deleted_id",
+    [
+        ("plain", _ADD_BODY, "event", None, None, None),
+        ("plain", _CHANGE_BODY, "message", None, None, None),
+        ("with_file", _ADD_BODY_WITH_FILE, "event", None, None, None),
+        ("with_pdf", _ADD_BODY_WITH_PDF, "event", None, None, None),
+        ("with_unfurl", _ADD_BODY_WITH_UNFURL, "event", "add", "event", None),
+        ("plain", _CHANGE_BODY_WITH_UNFURL, "message", "change", "previous_message", "1629470261.000200-1"),
+    ],
+    ids=[
+        "add_event",
+        "change_event",
+        "add_event_with_plain_text_file",
+        "add_event_with_pdf_file",
+        "add_event_with_unfurling_links",
+        "change_event_with_unfurling_links",
+    ],
+)
+def test_message_handler_call_event(
+    msg_doc_key,
+    body,
+    message_source,
+    unfurl_doc_key,
+    unfurl_source,
+    deleted_id,
     mock_chatiq,
     mock_client,
     mock_context,
@@ -433,218 +363,44 @@ def test_message_handler_call_add_event_with_unfurling_links(
     mock_repository,
     mock_team,
 ):
-    mock_message_loader_load.return_value = [
-        Document(
-            page_content=pretty_json_dumps(
-                {
-                    "content_type": "message",
-                    "user": "U0JD6RZU6",
-                    "channel": "C024BE91L",
-                    "message": "Hello, world!",
-                    "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
-                    "timestamp": "2021-08-20T14:37:41.000200+00:00",
-                    "attachments": [
-                        {
-                            "url": "https://example.com",
-                            "title": "Example Domain",
-                            "text": "This domain is for use in illustrative examples in documents.",
-                        }
-                    ],
-                },
-            ),
-            metadata={
-                "file_or_attachment_id": "Ev058XH6RPGR",
-                "content_type": "message",
-                "channel_type": "channel",
-                "channel_id": "C024BE91L",
-                "thread_ts": "1579244331.000200",
-                "ts": "1579244331.000200",
-                "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
-                "timestamp": "2021-08-20T14:37:41.000200+00:00",
-            },
-        )
-    ]
-    mock_unfurling_link_loader_load.return_value = [
-        Document(
-            page_content=pretty_json_dumps(
-                {
-                    "content_type": "unfurling_link",
-                    "user": "U0JD6RZU6",
-                    "title": "Example Domain",
-                    "channel": "C024BE91L",
-                    "content": "This domain is for use in illustrative examples in documents.",
-                    "page": "1 / 1",
-                    "permalink": "https://example.com",
-                    "timestamp": "2021-08-20T14:37:41.000200+00:00",
-                },
-            ),
-            metadata={
-                "file_or_attachment_id": "1",
-                "content_type": "unfurling_link",
-                "channel_type": "channel",
-                "channel_id": "C024BE91L",
-                "thread_ts": "0000000000.000000",
-                "ts": "1629470261.000200",
-                "timestamp": "2021-08-20T14:37:41.000200+00:00",
-                "permalink": "https://example.com",
-            },
-        )
-    ]
+    mock_message_loader_load.return_value = [_MESSAGE_DOCS[msg_doc_key]]
+    if unfurl_doc_key:
+        mock_unfurling_link_loader_load.return_value = [_UNFURL_DOCS[unfurl_doc_key]]
 
     message_handler = MessageHandler(mock_chatiq)
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
-            "user": "U0JD6RS3T",
-            "text": "Hello, World!",
-            "ts": "1579244331.000200",
-            "thread_ts": "1579244331.000200",
-            "channel_type": "channel",
-            "channel": "C024BE91L",
-            "attachments": [
-                {
-                    "id": 1,
-                    "original_url": "https://example.com",
-                    "title": "Example Domain",
-                    "text": "This domain is for use in illustrative examples in documents.",
-                }
-            ],
-        },
-        "authorizations": [{"user_id": "U0JD6RZU6"}],
-    }
     message_handler(mock_client, mock_context, body, mock_logger, mock_say)
-    for thread in mock_chatiq.threads:
-        thread.join()
 
     mock_vectorstore.ensure_index.assert_called_once()
     mock_repository.get_or_create.assert_called_once_with(body["team_id"], body["authorizations"][0]["user_id"])
-    mock_message_loader_init.assert_called_once_with(mock_client, body, body["event"], mock_team.model)
+    message = body["event"] if message_source == "event" else body["event"]["message"]
+    mock_message_loader_init.assert_called_once_with(mock_client, body, message, mock_team.model)
     mock_message_loader_load.assert_called_once()
-    mock_unfurling_link_loader_init.assert_called_once_with(
-        body, body["event"], body["event"]["attachments"][0], mock_team.model
-    )
-    mock_unfurling_link_loader_load.assert_called_once()
-    calls = [
-        call(mock_message_loader_load.return_value, uuids=[uuid.UUID("1e86735d-2b15-5ca1-be34-0142abd47742")]),
-        call(mock_unfurling_link_loader_load.return_value),
-    ]
-    mock_vectorstore.add_documents.assert_has_calls(calls)
-    mock_vectorstore.delete_file_or_attachment.assert_not_called()
-
 
-def test_message_handler_call_change_event_with_unfurling_links(
-    mock_chatiq,
-    mock_client,
-    mock_context,
-    mock_logger,
-    mock_say,
-    mock_message_loader_init,
-    mock_message_loader_load,
-    mock_unfurling_link_loader_init,
-    mock_unfurling_link_loader_load,
-    mock_vectorstore,
-    mock_repository,
-    mock_team,
-):
-    mock_message_loader_load.return_value = [
-        Document(
-            page_content=pretty_json_dumps(
-                {
-                    "content_type": "message",
-                    "user": "U0JD6RZU6",
-                    "channel": "C024BE91L",
-                    "message": "Hello, world!",
-                    "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
-                    "timestamp": "2021-08-20T14:37:41.000200+00:00",
-                },
-            ),
-            metadata={
-                "file_or_attachment_id": "Ev058XH6RPGR",
-                "content_type": "message",
-                "channel_type": "channel",
-                "channel_id": "C024BE91L",
-                "thread_ts": "1579244331.000200",
-                "ts": "1579244331.000200",
-                "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
-                "timestamp": "2021-08-20T14:37:41.000200+00:00",
-            },
+    if unfurl_doc_key:
+        unfurl_message = body["event"] if unfurl_source == "event" else body["event"]["previous_message"]
+        mock_unfurling_link_loader_init.assert_called_once_with(
+            body, unfurl_message, unfurl_message["attachments"][0], mock_team.model
         )
-    ]
-    mock_unfurling_link_loader_load.return_value = [
-        Document(
-            page_content=pretty_json_dumps(
-                {
-                    "content_type": "unfurling_link",
-                    "user": "U0JD6RZU6",
-                    "title": "Example Domain",
-                    "channel": "C024BE91L",
-                    "content": "This domain is for use in illustrative examples in documents.",
-                    "page": "1 / 1",
-                    "permalink": "https://example.com",
-                    "timestamp": "2021-08-20T14:37:41.000200+00:00",
-                },
-            ),
-            metadata={
-                "file_or_attachment_id": "1629470261.000200-1",
-                "content_type": "unfurling_link",
-                "channel_type": "channel",
-                "channel_id": "C024BE91L",
-                "thread_ts": "0000000000.000000",
-                "ts": "1629470261.000200",
-                "timestamp": "2021-08-20T14:37:41.000200+00:00",
-                "permalink": "https://example.com",
-            },
-        )
-    ]
-
-    message_handler = MessageHandler(mock_chatiq)
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
-            "subtype": "message_changed",
-            "message": {
-                "user": "U0JD6RS3T",
-                "text": "Hello, World!",
-                "ts": "1579244331.000200",
-                "thread_ts": "1579244331.000200",
-                "channel_type": "channel",
-                "channel": "C024BE91L",
-            },
-            "previous_message": {
-                "user": "U0JD6RS3T",
-                "text": "Hello, World!",
-                "ts": "1579244331.000200",
-                "thread_ts": "1579244331.000200",
-                "channel_type": "channel",
-                "channel": "C024BE91L",
-                "attachments": [
-                    {
-                        "id": 1,
-                        "original_url": "https://example.com",
-                        "title": "Example Domain",
-                        "text": "This domain is for use in illustrative examples in documents.",
-                    }
-                ],
-            },
-        },
-        "authorizations": [{"user_id": "U0JD6RZU6"}],
-    }
-    message_handler(mock_client, mock_context, body, mock_logger, mock_say)
-    for thread in mock_chatiq.threads:
-        thread.join()
-
-    mock_vectorstore.ensure_index.assert_called_once()
-    mock_repository.get_or_create.assert_called_once_with(body["team_id"], body["authorizations"][0]["user_id"])
-    mock_message_loader_init.assert_called_once_with(mock_client, body, body["event"]["message"], mock_team.model)
-    mock_message_loader_load.assert_called_once()
-    mock_unfurling_link_loader_init.assert_called_once_with(
-        body, body["event"]["previous_message"], body["event"]["previous_message"]["attachments"][0], mock_team.model
-    )
-    mock_unfurling_link_loader_load.assert_called_once()
-    mock_vectorstore.add_documents.assert_called_once_with(
-        mock_message_loader_load.return_value, uuids=[uuid.UUID("1e86735d-2b15-5ca1-be34-0142abd47742")]
-    )
-    mock_vectorstore.delete_file_or_attachment.assert_called_once_with("1629470261.000200-1")
+        mock_unfurling_link_loader_load.assert_called_once()
+    else:
+        mock_unfurling_link_loader_init.assert_not_called()
+        mock_unfurling_link_loader_load.assert_not_called()
+
+    # The handler passes the loader return values through untouched, so the
+    # payloads are compared by identity instead of deep call(...) equality.
+    add_calls = mock_vectorstore.add_documents.call_args_list
+    assert len(add_calls) == (2 if unfurl_doc_key == "add" else 1)
+    assert add_calls[0].args[0] is mock_message_loader_load.return_value
+    assert add_calls[0].kwargs == {"uuids": [_MESSAGE_UUID]}
+    if unfurl_doc_key == "add":
+        # Unfurling link documents are re-wrapped one per call, so the
+        # identity check applies to the Document rather than the list.
+        assert add_calls[1].args[0] == [_UNFURL_DOCS[unfurl_doc_key]]
+        assert add_calls[1].args[0][0] is _UNFURL_DOCS[unfurl_doc_key]
+    if deleted_id:
+        mock_vectorstore.delete_file_or_attachment.assert_called_once_with(deleted_id)
+    else:
+        mock_vectorstore.delete_file_or_attachment.assert_not_called()
 
 
 def test_message_handler_call_channel_info_event(
@@ -656,32 +412,11 @@ def test_message_handler_call_channel_info_event(
 ):
     message_handler = MessageHandler(mock_chatiq)
 
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
-            "subtype": "channel_topic",
-            "channel": "C024BE91L",
-        },
-        "authorizations": [{"user_id": "U0JD6RZU6"}],
-    }
-    message_handler(mock_client, mock_context, body, mock_logger, mock_say)
-    for thread in mock_chatiq.threads:
-        thread.join()
-
+    message_handler(mock_client, mock_context, _CHANNEL_TOPIC_BODY, mock_logger, mock_say)
     mock_client.conversations_info.assert_called_once_with(channel="C024BE91L")
     mock_say.assert_called_once_with(
         text="Configuration is set for this channel.",
-        blocks=[
-            {"type": "section", "text": {"text": "Configuration is set for this channel", "type": "plain_text"}},
-            {
-                "type": "section",
-                "fields": [
-                    {"type": "mrkdwn", "text": "*AI temperature:*\n2.0"},
-                    {"type": "mrkdwn", "text": "*Timezone:*\n+09:00"},
-                ],
-            },
-            {"type": "section", "text": {"type": "mrkdwn", "text": "*System Message*\nSpeak like a pirate"}},
-        ],
+        blocks=_EXPECTED_CHANNEL_INFO_BLOCKS,
     )
 
 
@@ -695,24 +430,6 @@ def test_message_handler_call_delete_event(
 ):
     message_handler = MessageHandler(mock_chatiq)
 
-    body = {
-        "team_id": "T0JD6RZU6",
-        "event": {
-            "subtype": "message_deleted",
-            "previous_message": {
-                "ts": "1579244331.000200",
-                "user": "U0JD6RS3T",
-                "text": "Hello, World!",
-                "thread_ts": "1579244331.000200",
-                "channel_type": "channel",
-                "channel": "C024BE91L",
-            },
-        },
-        "authorizations": [{"user_id": "U0JD6RZU6"}],
-    }
-    message_handler(mock_client, mock_context, body, mock_logger, mock_say)
-    for thread in mock_chatiq.threads:
-        thread.join()
-
+    message_handler(mock_client, mock_context, _DELETE_BODY, mock_logger, mock_say)
     mock_vectorstore.ensure_index.assert_called_once()
     mock_vectorstore.delete_message.assert_called_once_with("1579244331.000200")
@@ -0,0 +1,69 @@
+import pytest
+
+from chatiq.handlers import TemperatureSelectHandler, TimezoneOffsetSelectHandler
+from chatiq.models import SlackTeam
+from chatiq.repositories import SlackTeamRepository
+from tests.conftest import fast_mock
+
+# The bodies are read-only in the handlers and the tests, so one module-level
+# literal per case avoids rebuilding the nested dicts on every run.
+_TEMPERATURE_BODY = {
+    "user": {"id": "U0JD6RS3T"},
+    "team": {"id": "T0JD6RZU6"},
+    "view": {"state": {"values": {"temperature_block": {"temperature_select": {"selected_option": {"value": "0.2"}}}}}},
+}
+
+_TIMEZONE_OFFSET_BODY = {
+    "user": {"id": "U0JD6RS3T"},
+    "team": {"id": "T0JD6RZU6"},
+    "view": {
+        "state": {"values": {"timezone_offset_block": {"timezone_offset_select": {"selected_option": {"value": "+09:00"}}}}}
+    },
+}
+
+# The temperature and timezone offset handlers are structurally identical:
+# read the selected option, update the team, republish the home screen and
+# ack. One parametrized test covers both.
+_SELECT_CASES = (
+    pytest.param(
+        TemperatureSelectHandler,
+        "temperature_select",
+        _TEMPERATURE_BODY,
+        {"temperature": 0.2},
+        {"model": "gpt-3.5-turbo", "temperature": 0.2, "context": "Test context"},
+        id="temperature",
+    ),
+    pytest.param(
+        TimezoneOffsetSelectHandler,
+        "timezone_offset_select",
+        _TIMEZONE_OFFSET_BODY,
+        {"timezone_offset": "+09:00"},
+        {"timezone_offset": "+00:00"},
+        id="timezone_offset",
+    ),
+)
+
+
+@pytest.mark.parametrize("handler_cls, module, body, expected_update, team_attrs", _SELECT_CASES)
+def test_select_handler_call(
+    mocker,
+    mock_chatiq,
+    mock_client,
+    mock_logger,
+    mock_ack,
+    handler_cls,
+    module,
+    body,
+    expected_update,
+    team_attrs,
+):
+    mock_team = fast_mock(SlackTeam, **team_attrs)
+    mock_repository = fast_mock(SlackTeamRepository)
+    mock_repository.update.return_value = mock_team
+    mocker.patch(f"chatiq.handlers.{module}.SlackTeamRepository", return_value=mock_repository)
+
+    handler = handler_cls(mock_chatiq)
+    handler(mock_client, body, mock_logger, mock_ack)
+
+    mock_repository.update.assert_called_once_with(body["team"]["id"], expected_update)
+    mock_ack.assert_called_once()
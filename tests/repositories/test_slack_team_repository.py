@@ -3,6 +3,7 @@ from sqlalchemy.exc import NoResultFound
 
 from chatiq.models import SlackTeam
 from chatiq.repositories import SlackTeamRepository
+from tests.conftest import fast_mock
 
 
 @pytest.fixture
@@ -11,8 +12,15 @@ def mock_session(mocker):
 
 
 @pytest.fixture
-def mock_team(mocker):
-    return mocker.MagicMock(spec=SlackTeam)
+def mock_execute_result(mock_session):
+    # The session.execute() result chain is walked once here; tests configure
+    # scalar_one / scalars on this child instead of re-traversing it per call.
+    return mock_session.execute.return_value
+
+
+@pytest.fixture
+def mock_team():
+    return fast_mock(SlackTeam)
 
 
 def test_init(mock_session):
@@ -20,8 +28,8 @@ def test_init(mock_session):
     assert repository.session is mock_session
 
 
-def test_get_exists(mock_session, mock_team):
-    mock_session.query().filter_by().one.return_value = mock_team
+def test_get_exists(mock_session, mock_execute_result, mock_team):
+    mock_execute_result.scalar_one.return_value = mock_team
 
     repository = SlackTeamRepository(mock_session)
     team = repository.get(mock_team.team_id)
@@ -29,8 +37,8 @@ def test_get_exists(mock_session, mock_team):
     assert team.team_id == mock_team.team_id
 
 
-def test_get_not_exists(mock_session, mock_team):
-    mock_session.query().filter_by().one.side_effect = NoResultFound()
+def test_get_not_exists(mock_session, mock_execute_result, mock_team):
+    mock_execute_result.scalar_one.side_effect = NoResultFound()
 
     repository = SlackTeamRepository(mock_session)
 
@@ -38,34 +46,36 @@ def test_get_not_exists(mock_session, mock_team):
         repository.get(mock_team.team_id)
 
 
-def test_get_or_create_exists(mock_session, mock_team):
-    mock_session.query().filter_by().first.return_value = mock_team
+def test_get_or_create_exists(mocker, mock_session, mock_team):
+    insert_result = mocker.MagicMock()
+    insert_result.scalars.return_value.first.return_value = None
+    select_result = mocker.MagicMock()
+    select_result.scalars.return_value.first.return_value = mock_team
+    mock_session.execute.side_effect = [insert_result, select_result]
 
     repository = SlackTeamRepository(mock_session)
     team = repository.get_or_create(mock_team.team_id, mock_team.bot_id)
 
     assert team.team_id == mock_team.team_id
     assert team.bot_id == mock_team.bot_id
-    mock_session.add.assert_not_called()
     mock_session.commit.assert_not_called()
 
 
-def test_get_or_create_not_exists(mock_session, mock_team):
-    mock_session.query().filter_by().first.return_value = None
+def test_get_or_create_not_exists(mock_session, mock_execute_result, mock_team):
+    mock_execute_result.scalars.return_value.first.return_value = mock_team
 
     repository = SlackTeamRepository(mock_session)
     team = repository.get_or_create(mock_team.team_id, mock_team.bot_id)
 
     assert team.team_id == mock_team.team_id
     assert team.bot_id == mock_team.bot_id
-    mock_session.add.assert_called_once()
     mock_session.commit.assert_called_once()
 
 
-def test_update(mock_session, mock_team):
+def test_update(mock_session, mock_execute_result, mock_team):
     model = mock_team.model
     mock_team.model = None
-    mock_session.query().filter_by().one.return_value = mock_team
+    mock_execute_result.scalar_one.return_value = mock_team
 
     repository = SlackTeamRepository(mock_session)
     team = repository.update(mock_team.team_id, {"model": model})
@@ -79,5 +89,5 @@ def test_delete(mock_session, mock_team):
     repository = SlackTeamRepository(mock_session)
     repository.delete(mock_team.team_id)
 
-    mock_session.query.return_value.filter.return_value.delete.assert_called_once()
+    mock_session.execute.assert_called_once()
     mock_session.commit.assert_called_once()
@@ -10,41 +10,37 @@ FULL_EMOJI_TEXT = """
 """
 
 
-def test_parse_empty_topic_and_description():
-    parser = ChannelInfoParser("", "")
-    temperature, timezone_offset, context = parser.parse()
+_PARSE_CASES = (
+    ("", "", (None, None, None)),
+    ("Today is Jimmy's birthday!", "Celebrate our birthdays!", (None, None, None)),
+    (FULL_EMOJI_TEXT, FULL_EMOJI_TEXT, (2.0, "+03:00", "Assistant should speak like a viking")),
+    ("", FULL_EMOJI_TEXT, (2.0, "+03:00", "Assistant should speak like a viking")),
+)
 
-    assert temperature is None
-    assert timezone_offset is None
-    assert context is None
+_INVALID_TEMPERATURES = ("invalid", "10.5")
 
+_INVALID_TIMEZONE_OFFSETS = ("+9:00", "invalid")
 
-def test_parse_no_emojis():
-    parser = ChannelInfoParser("Today is Jimmy's birthday!", "Celebrate our birthdays!")
-    temperature, timezone_offset, context = parser.parse()
 
-    assert temperature is None
-    assert timezone_offset is None
-    assert context is None
+@pytest.mark.parametrize(
+    "topic, description, expected",
+    _PARSE_CASES,
+    ids=["empty", "no_emojis", "emojis_in_topic_and_description", "emojis_in_description_only"],
+)
+def test_parse(topic, description, expected):
+    parser = ChannelInfoParser(topic, description)
 
+    assert parser.parse() == expected
 
-def test_parse_emojis_in_topic_and_description():
-    parser = ChannelInfoParser(FULL_EMOJI_TEXT, FULL_EMOJI_TEXT)
-    temperature, timezone_offset, context = parser.parse()
 
-    assert temperature == 2.0
-    assert timezone_offset == "+03:00"
-    assert context == "Assistant should speak like a viking"
-
-
-@pytest.mark.parametrize("temperature_str", ["invalid", "10.5"])
+@pytest.mark.parametrize("temperature_str", _INVALID_TEMPERATURES)
 def test_parse_invalid_temperature(temperature_str):
     parser = ChannelInfoParser(f":thermometer: {temperature_str}", "")
     with pytest.raises(TemperatureRangeError):
         parser.parse()
 
 
-@pytest.mark.parametrize("timezone_offset", ["+9:00", "invalid"])
+@pytest.mark.parametrize("timezone_offset", _INVALID_TIMEZONE_OFFSETS)
 def test_parse_invalid_timezone_offset(timezone_offset):
     parser = ChannelInfoParser("", f":round_pushpin: {timezone_offset}")
     with pytest.raises(TimezoneOffsetSelectError):
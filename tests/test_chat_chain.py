@@ -1,3 +1,4 @@
+import json
 from unittest.mock import MagicMock, Mock
 
 import pytest
@@ -9,37 +10,48 @@ from langchain.schema import BaseChatMessageHistory
 
 from chatiq.chat_chain import ChatChain
 from chatiq.retriever import Retriever
-from chatiq.utils import pretty_json_dumps
 
 
-@pytest.fixture
+# One freezer for the whole module: every assertion below hardcodes this
+# instant, and installing freezegun's fake datetime once is cheaper than
+# re-patching it per test.
+@pytest.fixture(scope="module", autouse=True)
+def frozen_time():
+    with freeze_time("2022-05-19T07:20:00+00:00"):
+        yield
+
+
+@pytest.fixture(scope="module")
 def mock_chat_model():
     mock_chat_model = Mock(spec=ChatOpenAI)
     mock_chat_model.model_name = "gpt-3.5-turbo"
     return mock_chat_model
 
 
-@pytest.fixture
-def mock_memory(mocker):
+@pytest.fixture(scope="module")
+def mock_memory():
     # Create a mock that includes the chat_memory attribute
     memory_mock = Mock(spec=ConversationTokenBufferMemory)
-    memory_mock.chat_memory = mocker.MagicMock(spec=BaseChatMessageHistory)
+    memory_mock.chat_memory = MagicMock(spec=BaseChatMessageHistory)
     return memory_mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_retriever():
     return Mock(spec=Retriever)
 
 
-@pytest.fixture
-def mock_initialize_agent(mocker):
+@pytest.fixture(scope="module")
+def mock_initialize_agent(module_mocker):
     # Mock the initialize_agent function
-    return mocker.patch("chatiq.chat_chain.initialize_agent", return_value=MagicMock(spec=AgentExecutor))
+    return module_mocker.patch("chatiq.chat_chain.initialize_agent", return_value=MagicMock(spec=AgentExecutor))
 
 
-def test_add_memory_ai_message_with_file_document(mock_chat_model, mock_memory, mock_retriever, mock_initialize_agent):
-    chat_chain = ChatChain(
+# ChatChain construction (tool wiring, prompt assembly) runs once per module;
+# the function-scoped wrapper only resets the mocks the tests assert on.
+@pytest.fixture(scope="module")
+def _chat_chain(mock_chat_model, mock_memory, mock_retriever, mock_initialize_agent):
+    return ChatChain(
         chat=mock_chat_model,
         memory=mock_memory,
         retriever=mock_retriever,
@@ -48,6 +60,24 @@ def test_add_memory_ai_message_with_file_document(mock_chat_model, mock_memory,
         context="Speak like a pirate.",
         timezone_offset="+00:00",
     )
+
+
+@pytest.fixture
+def chat_chain(_chat_chain):
+    _chat_chain.memory.chat_memory.reset_mock()
+    _chat_chain.chain.reset_mock()
+    return _chat_chain
+
+
+@pytest.mark.parametrize(
+    "filetype, name, title",
+    [
+        ("python", "test.py", "Test Python File"),
+        ("pdf", "test.pdf", "Test PDF File"),
+    ],
+)
+def test_add_memory_ai_message_with_file_document(chat_chain, filetype, name, title):
+    permalink = f"https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/{name}"
     chat_chain.add_memory_ai_message(
         {
             "user": "U06FKAYEHF",
@@ -56,113 +86,48 @@ def test_add_memory_ai_message_with_file_document(mock_chat_model, mock_memory,
             "files": [
                 {
                     "id": "F0JD6RZU6",
-                    "filetype": "python",
-                    "name": "test.py",
-                    "title": "Test Python File",
-                    "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.py",
+                    "filetype": filetype,
+                    "name": name,
+                    "title": title,
+                    "permalink": permalink,
                     "timestamp": 1629470261.0002,
                 }
             ],
         }
     )
 
-    chat_chain.memory.chat_memory.add_ai_message.assert_called_once_with(
-        pretty_json_dumps(
+    chat_chain.memory.chat_memory.add_ai_message.assert_called_once()
+    # Parse the recorded message once instead of pretty-printing the expected
+    # dict just to compare strings.
+    assert json.loads(chat_chain.memory.chat_memory.add_ai_message.call_args.args[0]) == {
+        "user_id": "U06FKAYEHF",
+        "action": "Message",
+        "action_input": "Hello, I'm an AI!",
+        "timestamp": "2022-05-19T07:20:00+00:00",
+        "files": [
             {
-                "user_id": "U06FKAYEHF",
-                "action": "Message",
-                "action_input": "Hello, I'm an AI!",
-                "timestamp": "2022-05-19T07:20:00+00:00",
-                "files": [
-                    {
-                        "title": "Test Python File",
-                        "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.py",
-                    }
-                ],
+                "title": title,
+                "permalink": permalink,
             }
-        )
-    )
+        ],
+    }
 
 
-def test_add_memory_ai_message_with_pdf_document(mock_chat_model, mock_memory, mock_retriever, mock_initialize_agent):
-    chat_chain = ChatChain(
-        chat=mock_chat_model,
-        memory=mock_memory,
-        retriever=mock_retriever,
-        bot_id="U06FKAYEHF",
-        channel_id="C024BE91L",
-        context="Speak like a pirate.",
-        timezone_offset="+00:00",
-    )
-    chat_chain.add_memory_ai_message(
-        {
-            "user": "U06FKAYEHF",
-            "text": "Hello, I'm an AI!",
-            "ts": "1652944800.000000",
-            "files": [
-                {
-                    "id": "F0JD6RZU6",
-                    "filetype": "pdf",
-                    "name": "test.pdf",
-                    "title": "Test PDF File",
-                    "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.pdf",
-                    "timestamp": 1629470261.0002,
-                }
-            ],
-        }
-    )
-
-    chat_chain.memory.chat_memory.add_ai_message.assert_called_once_with(
-        pretty_json_dumps(
+@pytest.mark.parametrize(
+    "extra_body, extra_expected",
+    [
+        (
             {
-                "user_id": "U06FKAYEHF",
-                "action": "Message",
-                "action_input": "Hello, I'm an AI!",
-                "timestamp": "2022-05-19T07:20:00+00:00",
-                "files": [
+                "attachments": [
                     {
-                        "title": "Test PDF File",
-                        "permalink": "https://chatiq.slack.com/files/U0JD6RZU6/F0JD6RZU6/test.pdf",
+                        "id": 1,
+                        "original_url": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
+                        "author_id": "U0JD6RS3T",
+                        "text": "Hello, World!",
                     }
                 ],
-            }
-        )
-    )
-
-
-def test_add_memory_user_message_with_unfurling_link(mock_chat_model, mock_memory, mock_retriever, mock_initialize_agent):
-    chat_chain = ChatChain(
-        chat=mock_chat_model,
-        memory=mock_memory,
-        retriever=mock_retriever,
-        bot_id="U06FKAYEHF",
-        channel_id="C024BE91L",
-        context="Speak like a pirate.",
-        timezone_offset="+00:00",
-    )
-    chat_chain.add_memory_user_message(
-        {
-            "user": "U0JD6RZU6",
-            "text": "Hello, AI!",
-            "ts": "1652944800.000000",
-            "attachments": [
-                {
-                    "id": 1,
-                    "original_url": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
-                    "author_id": "U0JD6RS3T",
-                    "text": "Hello, World!",
-                }
-            ],
-        }
-    )
-
-    chat_chain.memory.chat_memory.add_user_message.assert_called_once_with(
-        pretty_json_dumps(
+            },
             {
-                "user_id": "U0JD6RZU6",
-                "action": "Message",
-                "action_input": "Hello, AI!",
-                "timestamp": "2022-05-19T07:20:00+00:00",
                 "slack_links": [
                     {
                         "author": "U0JD6RS3T",
@@ -170,52 +135,32 @@ def test_add_memory_user_message_with_unfurling_link(mock_chat_model, mock_memor
                         "permalink": "https://chatiq.slack.com/archives/C024BE91L/p1579244331000200",
                     }
                 ],
-            }
-        )
-    )
-
-
-def test_add_memory_user_message_with_slack_link(mock_chat_model, mock_memory, mock_retriever, mock_initialize_agent):
-    chat_chain = ChatChain(
-        chat=mock_chat_model,
-        memory=mock_memory,
-        retriever=mock_retriever,
-        bot_id="U06FKAYEHF",
-        channel_id="C024BE91L",
-        context="Speak like a pirate.",
-        timezone_offset="+00:00",
-    )
-    chat_chain.add_memory_user_message({"user": "U0JD6RZU6", "text": "Hello, AI!", "ts": "1652944800.000000"})
-
-    chat_chain.memory.chat_memory.add_user_message.assert_called_once_with(
-        pretty_json_dumps(
-            {
-                "user_id": "U0JD6RZU6",
-                "action": "Message",
-                "action_input": "Hello, AI!",
-                "timestamp": "2022-05-19T07:20:00+00:00",
-            }
-        )
-    )
-
-
-@freeze_time("2023-05-21 09:00:47.722261")
-def test_run(mock_chat_model, mock_memory, mock_retriever, mock_initialize_agent):
-    chat_chain = ChatChain(
-        chat=mock_chat_model,
-        memory=mock_memory,
-        retriever=mock_retriever,
-        bot_id="U06FKAYEHF",
-        channel_id="C024BE91L",
-        context="Speak like a pirate.",
-        timezone_offset="+00:00",
-    )
+            },
+        ),
+        ({}, {}),
+    ],
+    ids=["with_unfurling_link", "without_links"],
+)
+def test_add_memory_user_message(chat_chain, extra_body, extra_expected):
+    chat_chain.add_memory_user_message({"user": "U0JD6RZU6", "text": "Hello, AI!", "ts": "1652944800.000000", **extra_body})
+
+    chat_chain.memory.chat_memory.add_user_message.assert_called_once()
+    assert json.loads(chat_chain.memory.chat_memory.add_user_message.call_args.args[0]) == {
+        "user_id": "U0JD6RZU6",
+        "action": "Message",
+        "action_input": "Hello, AI!",
+        "timestamp": "2022-05-19T07:20:00+00:00",
+        **extra_expected,
+    }
+
+
+def test_run(chat_chain):
     chat_chain.run({"user": "U0JD6RZU6", "text": "1 + 1"})
 
     chat_chain.chain.run.assert_called_once_with(
         input='Human: {\n    "user_id": "U0JD6RZU6",\n    "action": "Message",\n    "action_input": "1 + 1"\n}',
         bot_id="U06FKAYEHF",
         channel_id="C024BE91L",
-        time_message="Current time is '2023-05-21T09:00:47.722261+00:00'. ",
+        time_message="Current time is '2022-05-19T07:20:00+00:00'. ",
         context="Speak like a pirate.",
     )
@@ -1,4 +1,4 @@
-import threading
+import os
 from unittest.mock import call
 
 import pytest
@@ -8,19 +8,35 @@ from slack_sdk.oauth.installation_store.sqlalchemy import SQLAlchemyInstallation
 from slack_sdk.oauth.state_store.sqlalchemy import SQLAlchemyOAuthStateStore
 from weaviate import Client
 
-from chatiq import ChatIQ
+from chatiq import ChatIQ, settings
 from chatiq.database import Database
 from chatiq.exceptions import SettingsValidationError
 
 
-@pytest.fixture
-def mock_env_variables(monkeypatch):
-    monkeypatch.delenv("SLACK_CLIENT_ID", raising=False)
-    monkeypatch.delenv("SLACK_CLIENT_SECRET", raising=False)
-    monkeypatch.delenv("SLACK_SIGNING_SECRET", raising=False)
-    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
-    monkeypatch.delenv("POSTGRES_URL", raising=False)
-    monkeypatch.delenv("WEAVIATE_URL", raising=False)
+def refresh_settings(monkeypatch):
+    # Settings snapshots the environment when constructed, so rebuild the
+    # singleton after the environment is changed.
+    monkeypatch.setattr("chatiq.chatiq.Settings", type(settings.Settings)())
+
+
+_ENV_KEYS = (
+    "SLACK_CLIENT_ID",
+    "SLACK_CLIENT_SECRET",
+    "SLACK_SIGNING_SECRET",
+    "OPENAI_API_KEY",
+    "POSTGRES_URL",
+    "WEAVIATE_URL",
+)
+
+
+# Cheaper than six monkeypatch.delenv undo registrations per test: pop the
+# keys in one pass and restore the snapshot on teardown.
+@pytest.fixture(autouse=True)
+def clean_slack_env(monkeypatch):
+    saved = {key: os.environ.pop(key, None) for key in _ENV_KEYS}
+    refresh_settings(monkeypatch)
+    yield
+    os.environ.update({key: value for key, value in saved.items() if value is not None})
 
 
 @pytest.fixture
@@ -46,28 +62,44 @@ def mock_bolt_app(mocker):
     return bolt_app
 
 
-def test_missing_setting_without_bolt_app(mock_env_variables, mock_weaviate_client, mock_database):
+# Constructing ChatIQ validates settings, builds a bolt app and wires every
+# handler, so the read-only tests below share one instance per module. Tests
+# that exercise construction itself keep building their own.
+@pytest.fixture(scope="module")
+def configured_chatiq(module_mocker):
+    module_mocker.patch("chatiq.chatiq.Client", return_value=module_mocker.MagicMock(spec=Client))
+    mock_database = module_mocker.MagicMock(spec=Database)
+    mock_database.installation_store = module_mocker.MagicMock(spec=SQLAlchemyInstallationStore)
+    mock_database.state_store = module_mocker.MagicMock(spec=SQLAlchemyOAuthStateStore)
+    module_mocker.patch("chatiq.chatiq.Database", return_value=mock_database)
+    return ChatIQ(
+        slack_client_id="test_client_id",
+        slack_client_secret="test_client_secret",
+        slack_signing_secret="test_signing_secret",
+        openai_api_key="test_openai_api_key",
+        postgres_url="test_postgres_url",
+        weaviate_url="test_weaviate_url",
+    )
+
+
+def test_missing_setting_without_bolt_app(mock_weaviate_client, mock_database):
     with pytest.raises(SettingsValidationError):
         ChatIQ()
 
 
-def test_environment_variables_settings_without_bolt_app(
-    mock_env_variables,
-    mock_weaviate_client,
-    mock_database,
-    monkeypatch,
-):
+def test_environment_variables_settings_without_bolt_app(mock_weaviate_client, mock_database, monkeypatch):
     monkeypatch.setenv("SLACK_CLIENT_ID", "slack-client-id")
     monkeypatch.setenv("SLACK_CLIENT_SECRET", "slack-client-secret")
     monkeypatch.setenv("SLACK_SIGNING_SECRET", "slack-signing-secret")
     monkeypatch.setenv("OPENAI_API_KEY", "openai-api-key")
     monkeypatch.setenv("POSTGRES_URL", "postgres-url")
     monkeypatch.setenv("WEAVIATE_URL", "weaviate-url")
+    refresh_settings(monkeypatch)
 
     ChatIQ()
 
 
-def test_argument_settings_without_bolt_app(mock_env_variables, mock_weaviate_client, mock_database):
+def test_argument_settings_without_bolt_app(mock_weaviate_client, mock_database):
     ChatIQ(
         slack_client_id="test_client_id",
         slack_client_secret="test_client_secret",
@@ -78,7 +110,7 @@ def test_argument_settings_without_bolt_app(mock_env_variables, mock_weaviate_cl
     )
 
 
-def test_missing_setting_with_bolt_app(mock_env_variables, mock_weaviate_client, mock_database, mock_bolt_app):
+def test_missing_setting_with_bolt_app(mock_weaviate_client, mock_database, mock_bolt_app):
     ChatIQ(
         bolt_app=mock_bolt_app,
         openai_api_key="test_openai_api_key",
@@ -87,22 +119,21 @@ def test_missing_setting_with_bolt_app(mock_env_variables, mock_weaviate_client,
     )
 
 
-def test_environment_variables_settings_with_bolt_app(
-    mock_env_variables, mock_weaviate_client, mock_database, mock_bolt_app, monkeypatch
-):
+def test_environment_variables_settings_with_bolt_app(mock_weaviate_client, mock_database, mock_bolt_app, monkeypatch):
     monkeypatch.setenv("OPENAI_API_KEY", "openai-api-key")
     monkeypatch.setenv("POSTGRES_URL", "postgres-url")
     monkeypatch.setenv("WEAVIATE_URL", "weaviate-url")
+    refresh_settings(monkeypatch)
 
     ChatIQ(bolt_app=mock_bolt_app)
 
 
-def test_argument_settings_with_bolt_app(mock_env_variables, mock_weaviate_client, mock_database, mock_bolt_app):
+def test_argument_settings_with_bolt_app(mock_weaviate_client, mock_database, mock_bolt_app):
     with pytest.raises(SettingsValidationError):
         ChatIQ(bolt_app=mock_bolt_app)
 
 
-def test_rate_limit_retry_handler(mock_env_variables, mock_weaviate_client, mock_database, mock_bolt_app):
+def test_rate_limit_retry_handler(mock_weaviate_client, mock_database, mock_bolt_app):
     ChatIQ(
         bolt_app=mock_bolt_app,
         slack_client_id="test_client_id",
@@ -119,20 +150,11 @@ def test_rate_limit_retry_handler(mock_env_variables, mock_weaviate_client, mock
     assert isinstance(call_args[0][0], RateLimitErrorRetryHandler)
 
 
-def test_listen(mock_env_variables, mock_weaviate_client, mock_database, mocker):
-    chatiq = ChatIQ(
-        slack_client_id="test_client_id",
-        slack_client_secret="test_client_secret",
-        slack_signing_secret="test_signing_secret",
-        openai_api_key="test_openai_api_key",
-        postgres_url="test_postgres_url",
-        weaviate_url="test_weaviate_url",
-    )
+def test_listen(configured_chatiq, mocker):
+    mock_event = mocker.patch.object(configured_chatiq.bolt_app, "event")
+    mock_action = mocker.patch.object(configured_chatiq.bolt_app, "action")
 
-    mock_event = mocker.patch.object(chatiq.bolt_app, "event")
-    mock_action = mocker.patch.object(chatiq.bolt_app, "action")
-
-    chatiq.listen()
+    configured_chatiq.listen()
 
     mock_event.assert_has_calls(
         [
@@ -158,27 +180,11 @@ def test_listen(mock_env_variables, mock_weaviate_client, mock_database, mocker)
     )
 
 
-def test_add_thread(mock_env_variables, mock_weaviate_client, mock_database, mocker):
-    chatiq = ChatIQ(
-        slack_client_id="test_client_id",
-        slack_client_secret="test_client_secret",
-        slack_signing_secret="test_signing_secret",
-        openai_api_key="test_openai_api_key",
-        postgres_url="test_postgres_url",
-        weaviate_url="test_weaviate_url",
-    )
-    assert len(chatiq.threads) == 0
-
-    mock_thread1 = mocker.MagicMock(spec=threading.Thread)
-    mock_thread1.is_alive.return_value = True
-
-    chatiq.add_thread(mock_thread1)
-    assert len(chatiq.threads) == 1
-
-    mock_thread1.is_alive.return_value = False
-
-    mock_thread2 = mocker.MagicMock(spec=threading.Thread)
-    mock_thread2.is_alive.return_value = True
+def test_submit(configured_chatiq):
+    first = configured_chatiq.submit(lambda value: value, 42)
+    assert first.result() == 42
+    assert configured_chatiq.futures == [first]
 
-    chatiq.add_thread(mock_thread2)
-    assert len(chatiq.threads) == 1
+    second = configured_chatiq.submit(lambda: None)
+    assert configured_chatiq.futures == [second]
+    second.result()
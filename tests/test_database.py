@@ -6,47 +6,80 @@ from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.orm import sessionmaker
 
 from chatiq.database import Database
+from tests.conftest import fast_mock
 
 
-@pytest.fixture
-def mock_create_engine(mocker):
-    return mocker.patch("chatiq.database.create_engine", return_value=mocker.MagicMock())
+# The patches below are installed once per module via module_mocker; the
+# function-scoped wrappers only reset call state between tests.
+@pytest.fixture(scope="module")
+def _patch_create_engine(module_mocker):
+    return module_mocker.patch("chatiq.database.create_engine", return_value=module_mocker.MagicMock())
 
 
 @pytest.fixture
-def mock_sessionmaker(mocker):
-    mock_sessionmaker = mocker.MagicMock(spec=sessionmaker)
-    mocker.patch("chatiq.database.sessionmaker", return_value=mock_sessionmaker)
+def mock_create_engine(_patch_create_engine):
+    _patch_create_engine.reset_mock()
+    return _patch_create_engine
+
+
+@pytest.fixture(scope="module")
+def _patch_sessionmaker(module_mocker):
+    mock_sessionmaker = fast_mock(sessionmaker)
+    module_mocker.patch("chatiq.database.sessionmaker", return_value=mock_sessionmaker)
     return mock_sessionmaker
 
 
 @pytest.fixture
-def mock_installation_store(mocker):
-    mock_installation_store = mocker.MagicMock(spec=SQLAlchemyInstallationStore)
-    mock_installation_store.bots = mocker.MagicMock(spec=Table)
+def mock_sessionmaker(_patch_sessionmaker):
+    _patch_sessionmaker.reset_mock()
+    return _patch_sessionmaker
+
+
+@pytest.fixture(scope="module")
+def _patch_installation_store(module_mocker):
+    mock_installation_store = fast_mock(SQLAlchemyInstallationStore)
+    mock_installation_store.bots = fast_mock(Table)
     mock_installation_store.bots.name = "slack_bots"
-    mock_installation_store.installations = mocker.MagicMock(spec=Table)
+    mock_installation_store.installations = fast_mock(Table)
     mock_installation_store.installations.name = "slack_installations"
-    mocker.patch("chatiq.database.SQLAlchemyInstallationStore", return_value=mock_installation_store)
+    module_mocker.patch("chatiq.database.SQLAlchemyInstallationStore", return_value=mock_installation_store)
     return mock_installation_store
 
 
 @pytest.fixture
-def mock_state_store(mocker):
-    mock_state_store = mocker.MagicMock(spec=SQLAlchemyOAuthStateStore)
-    mock_state_store.oauth_states = mocker.MagicMock(spec=Table)
+def mock_installation_store(_patch_installation_store):
+    _patch_installation_store.reset_mock()
+    return _patch_installation_store
+
+
+@pytest.fixture(scope="module")
+def _patch_state_store(module_mocker):
+    mock_state_store = fast_mock(SQLAlchemyOAuthStateStore)
+    mock_state_store.oauth_states = fast_mock(Table)
     mock_state_store.oauth_states.name = "slack_oauth_states"
-    mocker.patch("chatiq.database.SQLAlchemyOAuthStateStore", return_value=mock_state_store)
+    module_mocker.patch("chatiq.database.SQLAlchemyOAuthStateStore", return_value=mock_state_store)
     return mock_state_store
 
 
 @pytest.fixture
-def mock_inspector(mocker):
-    inspector = mocker.MagicMock(spec=Inspector)
-    mocker.patch("chatiq.database.inspect", return_value=inspector)
+def mock_state_store(_patch_state_store):
+    _patch_state_store.reset_mock()
+    return _patch_state_store
+
+
+@pytest.fixture(scope="module")
+def _patch_inspector(module_mocker):
+    inspector = fast_mock(Inspector)
+    module_mocker.patch("chatiq.database.inspect", return_value=inspector)
     return inspector
 
 
+@pytest.fixture
+def mock_inspector(_patch_inspector):
+    _patch_inspector.reset_mock(return_value=True)
+    return _patch_inspector
+
+
 @pytest.fixture
 def mock_base_metadata_create_all(mocker):
     return mocker.patch.object(MetaData, "create_all")
@@ -0,0 +1,11 @@
+import orjson
+import slack_bolt.request.internals
+
+from chatiq import json_compat
+
+
+def test_patch_slack_bolt_registers_orjson():
+    json_compat.patch_slack_bolt()
+
+    assert slack_bolt.request.internals.json.loads is orjson.loads
+    assert slack_bolt.request.internals.json.loads('{"team_id": "T0JD6RZU6"}') == {"team_id": "T0JD6RZU6"}
@@ -0,0 +1,29 @@
+import pytest
+
+from chatiq import metrics
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_increment_renders_counter():
+    metrics.increment("chatiq_weaviate_ops_total", op="delete_index", status="success")
+    metrics.increment("chatiq_weaviate_ops_total", op="delete_index", status="success")
+
+    rendered = metrics.render()
+
+    assert 'chatiq_weaviate_ops_total{op="delete_index",status="success"} 2.0' in rendered
+
+
+def test_time_operation_renders_histogram():
+    with metrics.time_operation("chatiq_weaviate_op_duration_seconds", op="add_documents"):
+        pass
+
+    rendered = metrics.render()
+
+    assert 'chatiq_weaviate_op_duration_seconds_bucket{op="add_documents",le="+Inf"} 1' in rendered
+    assert 'chatiq_weaviate_op_duration_seconds_count{op="add_documents"} 1' in rendered
@@ -1,18 +1,24 @@
+from itertools import islice
+
 import pytest
 from langchain.vectorstores import Weaviate
+from langchain.vectorstores.base import VectorStoreRetriever
 from weaviate import Client
 from weaviate.gql import Query
 
 from chatiq.retriever import Retriever
+from tests.conftest import fast_mock
 
 
 @pytest.fixture
 def mock_vectorstore(mocker):
+    # Retriever's pydantic validator does an isinstance check on the
+    # vectorstore, which a list-spec fast_mock cannot satisfy.
     mock_vectorstore = mocker.MagicMock(spec=Weaviate)
     mock_vectorstore._index_name = "Messageteam_id1"
     mock_vectorstore._query_attrs = ["content"]
-    mock_vectorstore._client = mocker.MagicMock(spec=Client)
-    mock_vectorstore._client.query = mocker.MagicMock(spec=Query)
+    mock_vectorstore._client = fast_mock(Client)
+    mock_vectorstore._client.query = fast_mock(Query)
     return mock_vectorstore
 
 
@@ -111,3 +117,106 @@ def test_search_url(is_private, expected_filter, mock_vectorstore):
     mock_vectorstore._client.query.get.return_value.with_where.assert_called_once_with(expected_filter)
     mock_vectorstore._client.query.get.return_value.with_where.return_value.with_limit.assert_called_once_with(1)
     assert result == "Test content"
+
+
+def test_search_urls(mock_vectorstore):
+    mock_vectorstore._client.query.multi_get.return_value.do.return_value = {
+        "data": {"Get": {"url0": [{"content": "Test content"}], "url1": None}}
+    }
+
+    retriever = Retriever(mock_vectorstore, False, "T0JD6RZU6", "1629470261.000200")
+    result = retriever.search_urls(["https://example.com", "https://example.com/missing"])
+
+    mock_vectorstore._client.query.multi_get.assert_called_once()
+    assert result == {
+        "https://example.com": "Test content",
+        "https://example.com/missing": "Document is not found.",
+    }
+
+
+def test_search_urls_empty(mock_vectorstore):
+    retriever = Retriever(mock_vectorstore, False, "T0JD6RZU6", "1629470261.000200")
+
+    assert retriever.search_urls([]) == {}
+    mock_vectorstore._client.query.multi_get.assert_not_called()
+
+
+def test_iter_search(mock_vectorstore):
+    query = mock_vectorstore._client.query.get.return_value.with_where.return_value.with_limit.return_value
+    query.with_offset.return_value.do.side_effect = [
+        {"data": {"Get": {mock_vectorstore._index_name: [{"content": "Content 0"}, {"content": "Content 1"}]}}},
+        {"data": {"Get": {mock_vectorstore._index_name: [{"content": "Content 2"}]}}},
+    ]
+
+    retriever = Retriever(mock_vectorstore, False, "T0JD6RZU6", "1629470261.000200")
+    where_filter = {"path": ["channel_id"], "operator": "Equal", "valueString": "T0JD6RZU6"}
+    documents = list(retriever.iter_search(where_filter, page_size=2))
+
+    assert [document.page_content for document in documents] == ["Content 0", "Content 1", "Content 2"]
+    assert query.with_offset.return_value.do.call_count == 2
+    query.with_offset.assert_any_call(0)
+    query.with_offset.assert_any_call(2)
+
+
+def test_iter_search_stops_early(mock_vectorstore):
+    query = mock_vectorstore._client.query.get.return_value.with_where.return_value.with_limit.return_value
+    query.with_offset.return_value.do.return_value = {
+        "data": {"Get": {mock_vectorstore._index_name: [{"content": "Content 0"}, {"content": "Content 1"}]}}
+    }
+
+    retriever = Retriever(mock_vectorstore, False, "T0JD6RZU6", "1629470261.000200")
+    where_filter = {"path": ["channel_id"], "operator": "Equal", "valueString": "T0JD6RZU6"}
+    documents = list(islice(retriever.iter_search(where_filter, page_size=2), 1))
+
+    assert [document.page_content for document in documents] == ["Content 0"]
+    query.with_offset.return_value.do.assert_called_once()
+
+
+def test_get_relevant_documents_cached(mocker, mock_vectorstore):
+    mock_documents = [mocker.MagicMock()]
+    mock_get = mocker.patch.object(VectorStoreRetriever, "get_relevant_documents", return_value=mock_documents)
+
+    retriever = Retriever(mock_vectorstore, False, "C024BE91L", "1629470261.000200")
+
+    assert retriever.get_relevant_documents("What  is ChatIQ?") == mock_documents
+    assert retriever.get_relevant_documents("what is chatiq?") == mock_documents
+    mock_get.assert_called_once()
+
+
+def test_get_relevant_documents_cache_scoped_to_index(mocker, mock_vectorstore):
+    mock_get = mocker.patch.object(VectorStoreRetriever, "get_relevant_documents", return_value=[mocker.MagicMock()])
+    mock_other_vectorstore = mocker.MagicMock(spec=Weaviate)
+    mock_other_vectorstore._index_name = "Messageteam_id2"
+
+    retriever = Retriever(mock_vectorstore, False, "C024BE91P", "1629470261.000500")
+    other_retriever = Retriever(mock_other_vectorstore, False, "C024BE91P", "1629470261.000500")
+
+    retriever.get_relevant_documents("Who wrote this thread?")
+    other_retriever.get_relevant_documents("Who wrote this thread?")
+    assert mock_get.call_count == 2
+
+
+def test_get_relevant_documents_check_cache_false(mocker, mock_vectorstore):
+    mock_documents = [mocker.MagicMock()]
+    mock_get = mocker.patch.object(VectorStoreRetriever, "get_relevant_documents", return_value=mock_documents)
+
+    retriever = Retriever(mock_vectorstore, False, "C024BE91M", "1629470261.000300", check_cache=False)
+
+    assert retriever.get_relevant_documents("What is ChatIQ?") == mock_documents
+    assert retriever.get_relevant_documents("What is ChatIQ?") == mock_documents
+    assert mock_get.call_count == 2
+
+
+def test_get_relevant_documents_reuses_cached_embedding(mocker, mock_vectorstore):
+    mock_connection = mocker.MagicMock()
+    mock_connection.post.return_value.json.return_value = {"vector": [0.1, 0.2]}
+    mock_vectorstore._client._connection = mock_connection
+    mock_documents = [mocker.MagicMock()]
+    mock_vectorstore.similarity_search_by_vector.return_value = mock_documents
+
+    retriever = Retriever(mock_vectorstore, False, "C024BE91N", "1629470261.000400", check_cache=False)
+
+    assert retriever.get_relevant_documents("Summarize the thread") == mock_documents
+    assert retriever.get_relevant_documents("summarize  the thread") == mock_documents
+    mock_connection.post.assert_called_once()
+    assert mock_vectorstore.similarity_search_by_vector.call_count == 2
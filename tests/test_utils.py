@@ -7,6 +7,7 @@ from dateutil import tz
 from langchain.docstore.document import Document
 
 from chatiq.utils import (
+    compact_json_dumps,
     extract_emoji_text,
     format_mention,
     get_emoji_from_timezone_offset,
@@ -192,6 +193,27 @@ def test_pretty_json_dumps():
     assert json.loads(pretty_json) == obj
 
 
+def test_json_dumps_caches_repeated_payloads():
+    obj = {"content_type": "message", "files": [{"title": "report.pdf"}]}
+
+    assert pretty_json_dumps(obj) is pretty_json_dumps(dict(obj))
+    assert compact_json_dumps(obj) is compact_json_dumps(dict(obj))
+
+
+def test_compact_json_dumps():
+    obj = {
+        "content_type": "message",
+        "user": "U0JD6RZU6",
+        "message": "こんにちは、世界！",
+    }
+
+    compact_json = compact_json_dumps(obj)
+
+    assert "\n" not in compact_json
+    assert "こんにちは、世界！" in compact_json
+    assert json.loads(compact_json) == obj
+
+
 @pytest.fixture
 def test_subtract_documents_no_overlap():
     doc1 = Document(page_content='{"content": "Test Domain 1"}', metadata={"url": "https://example.com/1"})
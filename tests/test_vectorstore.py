@@ -8,30 +8,31 @@ from weaviate.schema import Schema
 
 from chatiq.retriever import Retriever
 from chatiq.vectorstore import Vectorstore
+from tests.conftest import fast_mock
 
 
 @pytest.fixture
-def mock_weaviate_client(mocker):
-    mock_weaviate_client = mocker.MagicMock(spec=Client)
-    mock_batch = mocker.MagicMock(spec=Batch)
+def mock_weaviate_client():
+    mock_weaviate_client = fast_mock(Client)
+    mock_batch = fast_mock(Batch)
     mock_batch.__enter__.return_value = mock_batch
     mock_batch.__exit__.return_value = None
     mock_weaviate_client.batch = mock_batch
-    mock_weaviate_client.schema = mocker.MagicMock(spec=Schema)
+    mock_weaviate_client.schema = fast_mock(Schema)
     return mock_weaviate_client
 
 
 @pytest.fixture
 def mock_weaviate(mocker):
-    mock_weaviate = mocker.MagicMock(spec=Weaviate)
-    mock_weaviate.as_retriever.return_value = mocker.MagicMock(spec=VectorStoreRetriever)
+    mock_weaviate = fast_mock(Weaviate)
+    mock_weaviate.as_retriever.return_value = fast_mock(VectorStoreRetriever)
     mocker.patch("chatiq.vectorstore.Weaviate", return_value=mock_weaviate)
     return mock_weaviate
 
 
 @pytest.fixture
-def mock_document(mocker):
-    return mocker.MagicMock(spec=Document)
+def mock_document():
+    return fast_mock(Document)
 
 
 @pytest.fixture
@@ -39,11 +40,19 @@ def mock_retriever_init(mocker):
     return mocker.patch.object(Retriever, "__init__", return_value=None)
 
 
-@pytest.mark.parametrize("docs", [[], [mock_document], [mock_document, mock_document]])
-def test_add_documents(mock_weaviate_client, mock_weaviate, mock_document, docs):
+@pytest.mark.parametrize("count", [0, 1, 2])
+def test_add_documents(mock_weaviate_client, mock_weaviate, count):
+    docs = [Document(page_content=f"content {i}", metadata={"ts": f"{i}"}) for i in range(count)]
     vectorstore = Vectorstore(mock_weaviate_client, "team_id1")
-    vectorstore.add_documents(docs)
-    mock_weaviate.add_documents.assert_called_once_with(docs)
+    document_ids = vectorstore.add_documents(docs)
+    assert mock_weaviate_client.batch.add_data_object.call_count == count
+    assert len(document_ids) == count
+
+
+def test_add_documents_deterministic_uuids(mock_weaviate_client, mock_weaviate):
+    doc = Document(page_content="content", metadata={"ts": "1629470261.000200"})
+    vectorstore = Vectorstore(mock_weaviate_client, "team_id1")
+    assert vectorstore.add_documents([doc]) == vectorstore.add_documents([doc])
 
 
 def test_delete_channel(mock_weaviate_client, mock_weaviate):
@@ -62,6 +71,21 @@ def test_delete_message(mock_weaviate_client, mock_weaviate):
     )
 
 
+def test_delete_message_multiple(mock_weaviate_client, mock_weaviate):
+    vectorstore = Vectorstore(mock_weaviate_client, "team_id1")
+    vectorstore.delete_message(["1629470261.000200", "1629470261.000300"])
+    mock_weaviate_client.batch.delete_objects.assert_called_once_with(
+        class_name="Messageteam_id1",
+        where={
+            "operator": "Or",
+            "operands": [
+                {"path": ["ts"], "operator": "Equal", "valueString": "1629470261.000200"},
+                {"path": ["ts"], "operator": "Equal", "valueString": "1629470261.000300"},
+            ],
+        },
+    )
+
+
 def test_delete_file_or_attachment(mock_weaviate_client, mock_weaviate):
     vectorstore = Vectorstore(mock_weaviate_client, "team_id1")
     vectorstore.delete_file_or_attachment("1629470261.000200-1")
@@ -80,10 +104,21 @@ def test_ensure_index(mock_weaviate_client, mock_weaviate, index_exists):
 
     if index_exists:
         mock_weaviate_client.schema.create.assert_not_called()
-        mock_weaviate.add_documents.assert_not_called()
+        mock_weaviate_client.batch.add_data_object.assert_not_called()
     else:
+        vectorstore._pending_seed.join()
         mock_weaviate_client.schema.create.assert_called_once()
-        mock_weaviate.add_documents.assert_called_once()
+        mock_weaviate_client.batch.add_data_object.assert_called_once()
+
+
+def test_ensure_index_skips_repeat_checks(mock_weaviate_client, mock_weaviate):
+    mock_weaviate_client.schema.exists.return_value = True
+
+    vectorstore = Vectorstore(mock_weaviate_client, "team_id1")
+    vectorstore.ensure_index()
+    vectorstore.ensure_index()
+
+    mock_weaviate_client.schema.exists.assert_called_once()
 
 
 @pytest.mark.parametrize("index_exists", [True, False])
@@ -102,4 +137,12 @@ def test_delete_index(mock_weaviate_client, mock_weaviate, index_exists):
 def test_as_retriever(mock_weaviate_client, mock_weaviate, mock_retriever_init):
     vectorstore = Vectorstore(mock_weaviate_client, "team_id1")
     vectorstore.as_retriever(True, "T0JD6RZU6", "1629470261.000200")
-    mock_retriever_init.assert_called_once_with(mock_weaviate, True, "T0JD6RZU6", "1629470261.000200")
+    mock_retriever_init.assert_called_once_with(mock_weaviate, True, "T0JD6RZU6", "1629470261.000200", check_cache=True)
+
+
+def test_ensure_indexes(mocker, mock_weaviate_client, mock_weaviate):
+    mock_weaviate_client.schema.exists.return_value = True
+
+    Vectorstore.ensure_indexes(mock_weaviate_client, ["team_id2", "team_id3", "team_id2"])
+
+    assert mock_weaviate_client.schema.exists.call_count == 2